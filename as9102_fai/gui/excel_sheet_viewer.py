@@ -9,7 +9,7 @@ import logging
 
 from PySide6.QtCore import Qt, QEvent, QPoint, QTimer, Signal, QSignalBlocker, QItemSelection, QItemSelectionModel, QRect
 from PySide6.QtGui import QColor, QFont, QPen, QGuiApplication, QKeySequence, QShortcut, QPalette, QTextOption, QFontMetrics
-from PySide6.QtWidgets import QAbstractItemView, QAbstractItemDelegate, QStyledItemDelegate, QTableWidget, QTableWidgetItem, QWidget, QVBoxLayout, QHBoxLayout, QMenu, QStyleOptionViewItem, QStyle, QTableWidgetSelectionRange, QTextEdit, QLabel
+from PySide6.QtWidgets import QAbstractItemView, QAbstractItemDelegate, QStyledItemDelegate, QTableWidget, QTableWidgetItem, QWidget, QVBoxLayout, QHBoxLayout, QMenu, QStyleOptionViewItem, QStyle, QTextEdit, QLabel
 
 from openpyxl.styles import PatternFill
 
@@ -138,6 +138,10 @@ class ExcelSheetViewer(QWidget):
         # direction: +1 = down, -1 = up
         self._key_navigation_handler: Optional[Callable[[int, int, int], bool]] = None
 
+        # Per-sheet lookup tables built by callers (e.g. Form 3 bubble rows).
+        # Dropped whenever the worksheet is replaced, re-rendered or edited.
+        self._row_index_cache: Dict[str, Any] = {}
+
         # Optional: click-to-paint background fills.
         # When set, clicking a cell applies the fill to the underlying worksheet.
         # Use None to clear fill (no color).
@@ -191,6 +195,8 @@ class ExcelSheetViewer(QWidget):
         self._apply_timer.setInterval(30)
         self._apply_timer.timeout.connect(self._apply_scale)
 
+        self.modified.connect(self._drop_row_index_cache)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
@@ -1186,8 +1192,12 @@ class ExcelSheetViewer(QWidget):
         else:
             self.set_zoom(1.0)
 
+    def _drop_row_index_cache(self) -> None:
+        self._row_index_cache.clear()
+
     def set_worksheet(self, ws) -> None:
         self._ws = ws
+        self._row_index_cache.clear()
         if ws is not None:
             self._validation_lists, self._validation_display_to_value, self._validation_mapped_kind = self._build_validation_list_map(ws)
         else:
@@ -1629,6 +1639,7 @@ class ExcelSheetViewer(QWidget):
         return applied
 
     def render(self) -> None:
+        self._row_index_cache.clear()
         if self._ws is None:
             self.table.setRowCount(0)
             self.table.setColumnCount(0)
@@ -1900,6 +1911,100 @@ class ExcelSheetViewer(QWidget):
 
             return str(raw)
 
+        _qt_h_align = {
+            "left": Qt.AlignmentFlag.AlignLeft,
+            "center": Qt.AlignmentFlag.AlignHCenter,
+            "right": Qt.AlignmentFlag.AlignRight,
+            "justify": Qt.AlignmentFlag.AlignJustify,
+        }
+        _qt_v_align = {
+            "top": Qt.AlignmentFlag.AlignTop,
+            "center": Qt.AlignmentFlag.AlignVCenter,
+            "bottom": Qt.AlignmentFlag.AlignBottom,
+        }
+        _default_pt = float(self.table.font().pointSizeF())
+
+        # Cells share a handful of openpyxl styles, so the Qt-side objects (alignment
+        # flags, QFont, colors, border specs) are resolved once per style and reused.
+        # Keyed on the cell's style-id array (openpyxl internal); None disables reuse.
+        style_cache: Dict[Any, Dict[str, Any]] = {}
+
+        def _cell_style(cell) -> Dict[str, Any]:
+            try:
+                key = tuple(cell._style)
+            except Exception:
+                key = None
+            if key is not None:
+                hit = style_cache.get(key)
+                if hit is not None:
+                    return hit
+
+            st: Dict[str, Any] = {"align": None, "wrap": False, "qfont": None}
+
+            # Alignment
+            align = getattr(cell, "alignment", None)
+            if align:
+                h = getattr(align, "horizontal", None)
+                v = getattr(align, "vertical", None)
+                # Per-cell wrap flag (Excel Wrap Text).
+                st["wrap"] = bool(getattr(align, "wrapText", False))
+                qt_h = _qt_h_align.get(h, Qt.AlignmentFlag.AlignLeft)
+                qt_v = _qt_v_align.get(v, Qt.AlignmentFlag.AlignVCenter)
+                st["align"] = int(qt_h | qt_v)
+
+            # Font
+            font = getattr(cell, "font", None)
+            if font:
+                qfont = QFont()
+                if getattr(font, "name", None):
+                    qfont.setFamily(str(font.name))
+                if getattr(font, "sz", None):
+                    qfont.setPointSizeF(float(font.sz))
+                qfont.setBold(bool(getattr(font, "b", False)))
+                qfont.setItalic(bool(getattr(font, "i", False)))
+                st["qfont"] = qfont
+
+            # Record a base font size for scaling (use explicit cell font size when present).
+            base_size = None
+            if font and getattr(font, "sz", None):
+                try:
+                    base_size = float(font.sz)
+                except Exception:
+                    base_size = None
+            if base_size is None:
+                # Some styles return 0/-1 point size; keep a sane default.
+                base_size = _default_pt if _default_pt > 0 else 9.0
+            st["base_size"] = base_size
+
+            # Fill
+            bg = QColor(255, 255, 255)
+            fill = getattr(cell, "fill", None)
+            if fill and getattr(fill, "patternType", None) == "solid":
+                bg = _qcolor_from_openpyxl(getattr(fill, "fgColor", None))
+            st["bg"] = bg
+
+            # Explicit Excel font color, if any.
+            fg = None
+            if font and getattr(font, "color", None) is not None:
+                fg = _qcolor_from_openpyxl(getattr(font, "color", None))
+            st["fg"] = fg
+
+            # Borders
+            border = getattr(cell, "border", None)
+            borders = None
+            if border:
+                borders = {
+                    "top": _border_spec(getattr(border, "top", None)),
+                    "bottom": _border_spec(getattr(border, "bottom", None)),
+                    "left": _border_spec(getattr(border, "left", None)),
+                    "right": _border_spec(getattr(border, "right", None)),
+                }
+            st["borders"] = borders if borders and _has_visible_borders(borders) else None
+
+            if key is not None:
+                style_cache[key] = st
+            return st
+
         # Populate items.
         self._in_programmatic_change = True
         for r in range(1, max_row + 1):
@@ -1917,75 +2022,22 @@ class ExcelSheetViewer(QWidget):
                 if override is not None and override.value is not None:
                     display_value = str(override.value)
 
+                st = _cell_style(cell)
+
                 item = QTableWidgetItem(display_value)
                 # Allow edits for normal cells. Covered merged cells are not created.
                 item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEditable)
                 # Store 1-based coordinate for later mapping.
                 item.setData(Qt.ItemDataRole.UserRole + 1, (r, c))
 
-                # Alignment
-                align = getattr(cell, "alignment", None)
-                if align:
-                    h = getattr(align, "horizontal", None)
-                    v = getattr(align, "vertical", None)
-
-                    # Per-cell wrap flag (Excel Wrap Text).
-                    try:
-                        item.setData(self.WRAP_ROLE, bool(getattr(align, "wrapText", False)))
-                    except Exception:
-                        pass
-
-                    qt_h = {
-                        "left": Qt.AlignmentFlag.AlignLeft,
-                        "center": Qt.AlignmentFlag.AlignHCenter,
-                        "right": Qt.AlignmentFlag.AlignRight,
-                        "justify": Qt.AlignmentFlag.AlignJustify,
-                    }.get(h, Qt.AlignmentFlag.AlignLeft)
-
-                    qt_v = {
-                        "top": Qt.AlignmentFlag.AlignTop,
-                        "center": Qt.AlignmentFlag.AlignVCenter,
-                        "bottom": Qt.AlignmentFlag.AlignBottom,
-                    }.get(v, Qt.AlignmentFlag.AlignVCenter)
-
-                    item.setTextAlignment(int(qt_h | qt_v))
-                else:
-                    try:
-                        item.setData(self.WRAP_ROLE, False)
-                    except Exception:
-                        pass
-
-                # Font
-                font = getattr(cell, "font", None)
-                if font:
-                    qfont = QFont()
-                    if getattr(font, "name", None):
-                        qfont.setFamily(str(font.name))
-                    if getattr(font, "sz", None):
-                        qfont.setPointSizeF(float(font.sz))
-                    qfont.setBold(bool(getattr(font, "b", False)))
-                    qfont.setItalic(bool(getattr(font, "i", False)))
-                    item.setFont(qfont)
-
-                # Record a base font size for scaling (use explicit cell font size when present).
-                base_size = None
-                if font and getattr(font, "sz", None):
-                    try:
-                        base_size = float(font.sz)
-                    except Exception:
-                        base_size = None
-                if base_size is None:
-                    # Some styles return 0/-1 point size; keep a sane default.
-                    ps = float(self.table.font().pointSizeF())
-                    base_size = ps if ps > 0 else 9.0
-                item.setData(self.BASE_FONT_SIZE_ROLE, base_size)
-
-                # Fill
-                bg = QColor(255, 255, 255)
-                fill = getattr(cell, "fill", None)
-                if fill and getattr(fill, "patternType", None) == "solid":
-                    bg = _qcolor_from_openpyxl(getattr(fill, "fgColor", None))
+                item.setData(self.WRAP_ROLE, st["wrap"])
+                if st["align"] is not None:
+                    item.setTextAlignment(st["align"])
+                if st["qfont"] is not None:
+                    item.setFont(st["qfont"])
+                item.setData(self.BASE_FONT_SIZE_ROLE, st["base_size"])
 
+                bg = st["bg"]
                 if override is not None and override.background is not None:
                     bg = override.background
 
@@ -1995,35 +2047,21 @@ class ExcelSheetViewer(QWidget):
                 # Font color (important for light/dark mode correctness)
                 # Use explicit Excel font color if present; otherwise, if the
                 # cell has an explicit background, choose a contrasting color.
-                fg = None
-                if font and getattr(font, "color", None) is not None:
-                    fg = _qcolor_from_openpyxl(getattr(font, "color", None))
-
+                fg = st["fg"]
                 if fg is None:
                     fg = _ideal_text_color(bg)
 
                 if fg is not None:
                     item.setForeground(fg)
 
-                # Borders
-                border = getattr(cell, "border", None)
-                borders = None
-                if border:
-                    borders = {
-                        "top": _border_spec(getattr(border, "top", None)),
-                        "bottom": _border_spec(getattr(border, "bottom", None)),
-                        "left": _border_spec(getattr(border, "left", None)),
-                        "right": _border_spec(getattr(border, "right", None)),
-                    }
-
                 form1_borders = _form1_border_override(r, c)
                 form3_borders = _form3_border_override(r, c)
                 if form1_borders is not None:
                     item.setData(_ExcelBorderDelegate.BORDER_ROLE, form1_borders)
                 elif form3_borders is not None:
                     item.setData(_ExcelBorderDelegate.BORDER_ROLE, form3_borders)
-                elif borders and _has_visible_borders(borders):
-                    item.setData(_ExcelBorderDelegate.BORDER_ROLE, borders)
+                elif st["borders"] is not None:
+                    item.setData(_ExcelBorderDelegate.BORDER_ROLE, st["borders"])
                 else:
                     try:
                         if (
@@ -2144,22 +2182,19 @@ class ExcelSheetViewer(QWidget):
 
                 # Optional wheel navigation override (used by Form 3 bubble follow).
                 try:
-                    handler = getattr(self, "_wheel_navigation_handler", None)
+                    handler = self._wheel_navigation_handler
                     if handler is not None:
-                        try:
-                            cur_r0 = int(self.table.currentRow())
-                            cur_c0 = int(self.table.currentColumn())
-                        except Exception:
-                            cur_r0 = -1
-                            cur_c0 = -1
+                        # Qt already returns ints here; one currentIndex() covers row and column.
+                        cur = self.table.currentIndex()
+                        cur_r0 = cur.row()
+                        cur_c0 = cur.column()
                         if cur_r0 >= 0 and cur_c0 >= 0:
-                            dy = 0
                             try:
-                                dy = int(event.angleDelta().y())
+                                dy = event.angleDelta().y()
                             except Exception:
                                 dy = 0
                             try:
-                                consumed = bool(handler(int(cur_r0) + 1, int(cur_c0) + 1, int(dy)))
+                                consumed = bool(handler(cur_r0 + 1, cur_c0 + 1, dy))
                             except Exception:
                                 consumed = False
                             if consumed:
@@ -2221,18 +2256,15 @@ class ExcelSheetViewer(QWidget):
                         except Exception:
                             pass
 
-                        handler = getattr(self, "_key_navigation_handler", None)
+                        handler = self._key_navigation_handler
                         if handler is not None:
-                            try:
-                                cur_r0 = int(self.table.currentRow())
-                                cur_c0 = int(self.table.currentColumn())
-                            except Exception:
-                                cur_r0 = -1
-                                cur_c0 = -1
+                            cur = self.table.currentIndex()
+                            cur_r0 = cur.row()
+                            cur_c0 = cur.column()
                             if cur_r0 >= 0 and cur_c0 >= 0:
                                 direction = 1 if key == Qt.Key.Key_Down else -1
                                 try:
-                                    consumed = bool(handler(int(cur_r0) + 1, int(cur_c0) + 1, int(direction)))
+                                    consumed = bool(handler(cur_r0 + 1, cur_c0 + 1, direction))
                                 except Exception:
                                     consumed = False
                                 if consumed:
@@ -2468,22 +2500,14 @@ class ExcelSheetViewer(QWidget):
         nr = max(0, min(r0 + direction, max_r))
         nc = max(0, min(c0, max_c))
 
+        # With no triggering event, setCurrentCell() uses ClearAndSelect, so it alone
+        # leaves exactly the new cell selected.
         try:
-            self.table.clearSelection()
-        except Exception:
-            pass
-        try:
-            self.table.setCurrentCell(int(nr), int(nc))
+            self.table.setCurrentCell(nr, nc)
         except Exception:
             return
         try:
-            self.table.setRangeSelected(QTableWidgetSelectionRange(int(nr), int(nc), int(nr), int(nc)), True)
-        except Exception:
-            pass
-        try:
-            it = self.table.item(int(nr), int(nc))
-            if it is not None:
-                self.table.scrollToItem(it, QAbstractItemView.ScrollHint.EnsureVisible)
+            self.table.scrollTo(self.table.model().index(nr, nc), QAbstractItemView.ScrollHint.EnsureVisible)
         except Exception:
             pass
 
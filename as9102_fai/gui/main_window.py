@@ -12,21 +12,105 @@ import copy
 import datetime
 import logging
 import io
+import struct
+import functools
+import bisect
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                                QHBoxLayout, QPushButton, QLabel, QFileDialog, 
                                QGroupBox, QFormLayout, QLineEdit, QMessageBox, 
                                QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView, QTableWidgetSelectionRange,
                                QTabWidget, QGridLayout, QCheckBox, QScrollArea, QSpinBox, QToolBar, QComboBox, QButtonGroup, QColorDialog, QMenu,
-                               QDialog, QProgressBar, QSizePolicy, QInputDialog)
-from PySide6.QtCore import Qt, QTimer, Signal, QRect, QEvent, QObject
+                               QDialog, QProgressBar, QSizePolicy, QInputDialog, QStyledItemDelegate)
+from PySide6.QtCore import Qt, QTimer, Signal, Slot, QRect, QEvent, QObject, QByteArray, QSignalBlocker, QItemSelectionModel
+from PySide6.QtCore import QEventLoop, QRunnable, QThreadPool
 from PySide6.QtCore import QSettings
 from PySide6.QtGui import QColor, QFontDatabase, QPalette, QFontMetrics, QKeySequence, QShortcut
 import openpyxl
+from openpyxl.worksheet.cell_range import MultiCellRange
 from openpyxl.worksheet.datavalidation import DataValidation
 from openpyxl.styles import PatternFill, Alignment, Font
 
 logger = logging.getLogger(__name__)
 
+# Qt enum members used by the Form 3 wrap/bubble-follow callbacks, bound once so the
+# hot paths skip the enum attribute lookups on every selection change or nav event.
+_CS_CHECKED = Qt.CheckState.Checked
+_CS_PARTIAL = Qt.CheckState.PartiallyChecked
+_CS_UNCHECKED = Qt.CheckState.Unchecked
+_FR_OTHER = Qt.FocusReason.OtherFocusReason
+_SH_POS_TOP = QAbstractItemView.ScrollHint.PositionAtTop
+_QT_WINDOW = Qt.Window
+
+# Optional faster JSON codec for QSettings payloads; stdlib json is the fallback.
+try:
+    import orjson
+
+    def _jdumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    def _jloads(s):
+        return orjson.loads(s)
+except ImportError:
+    def _jdumps(obj) -> str:
+        return json.dumps(obj)
+
+    def _jloads(s):
+        return json.loads(s)
+
+
+def _connect_unique(signal, slot) -> None:
+    """Connect `signal` to `slot` at most once (Qt.UniqueConnection)."""
+    try:
+        signal.connect(slot, Qt.ConnectionType.UniqueConnection)
+    except (TypeError, RuntimeError):
+        pass
+
+
+class _WorkbookLoadSignals(QObject):
+    finished = Signal()
+
+
+class _WorkbookLoadTask(QRunnable):
+    """Run openpyxl.load_workbook() on a QThreadPool thread."""
+
+    def __init__(self, path: str) -> None:
+        super().__init__()
+        self.setAutoDelete(False)
+        self.path = path
+        self.wb = None
+        self.error: Exception | None = None
+        # Created on the GUI thread, so `finished` is queued back to it.
+        self.signals = _WorkbookLoadSignals()
+
+    def run(self) -> None:
+        try:
+            self.wb = openpyxl.load_workbook(self.path)
+        except Exception as e:
+            self.error = e
+        self.signals.finished.emit()
+
+
+def _load_workbook_off_thread(path: str):
+    """Load `path` on a worker thread while the GUI thread keeps repainting.
+
+    Callers still get the workbook back synchronously: the GUI thread waits in a local
+    event loop that skips user input only. Timers, queued calls and close events still
+    run during the wait, so callers must settle pending work first and guard against
+    re-entry (see MainWindow.load_template).
+    """
+    task = _WorkbookLoadTask(path)
+    loop = QEventLoop()
+    task.signals.finished.connect(loop.quit)
+    QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+    try:
+        QThreadPool.globalInstance().start(task)
+        loop.exec(QEventLoop.ProcessEventsFlag.ExcludeUserInputEvents)
+    finally:
+        QApplication.restoreOverrideCursor()
+    if task.error is not None:
+        raise task.error
+    return task.wb
+
 
 class _DeleteClearsTableCellsFilter(QObject):
     """Event filter: pressing Delete clears selected QTableWidget cell contents."""
@@ -60,8 +144,7 @@ class _DeleteClearsTableCellsFilter(QObject):
                 if not indexes:
                     return super().eventFilter(obj, event)
 
-                try:
-                    table.blockSignals(True)
+                with QSignalBlocker(table):
                     for ix in indexes:
                         r = int(ix.row())
                         c = int(ix.column())
@@ -70,11 +153,6 @@ class _DeleteClearsTableCellsFilter(QObject):
                             item = QTableWidgetItem("")
                             table.setItem(r, c, item)
                         item.setText("")
-                finally:
-                    try:
-                        table.blockSignals(False)
-                    except Exception:
-                        pass
 
                 event.accept()
                 return True
@@ -136,6 +214,41 @@ class _ColorSwatchCheckBox(QCheckBox):
             pass
         return super().mousePressEvent(event)
 
+
+class _StateComboDelegate(QStyledItemDelegate):
+    """Editable combo editor for the Supplier Directory State column."""
+
+    def createEditor(self, parent, option, index):
+        combo = QComboBox(parent)
+        combo.setEditable(True)
+        combo.addItem("")
+        combo.addItems(US_STATE_CODES)
+        QTimer.singleShot(0, combo.showPopup)
+        return combo
+
+    def setEditorData(self, editor, index):
+        try:
+            txt = str(index.data(Qt.ItemDataRole.DisplayRole) or "").strip().upper()
+            i = editor.findText(txt)
+            if i >= 0:
+                editor.setCurrentIndex(i)
+            else:
+                editor.setCurrentText(txt)
+        except Exception:
+            return
+
+    def setModelData(self, editor, model, index):
+        try:
+            txt = editor.currentText()
+            txt = txt.strip().upper() if txt else ""
+            # Opening the combo without changing it shouldn't emit itemChanged (and queue a save).
+            if txt == (index.data(Qt.ItemDataRole.EditRole) or ""):
+                return
+            model.setData(index, txt, Qt.ItemDataRole.EditRole)
+        except Exception:
+            return
+
+
 US_STATE_CODES: list[str] = [
     "AL","AK","AZ","AR","CA","CO","CT","DE","DC","FL","GA","HI","ID","IL","IN","IA","KS","KY","LA","ME",
     "MD","MA","MI","MN","MS","MO","MT","NE","NV","NH","NJ","NM","NY","NC","ND","OH","OK","OR","PA","RI",
@@ -199,6 +312,212 @@ US_STATE_NAME_TO_CODE: dict[str, str] = {
 _US_STATE_NAMES_BY_LENGTH: list[str] = sorted(US_STATE_NAME_TO_CODE.keys(), key=len, reverse=True)
 
 
+def _clean(value: object) -> str:
+    """Return `str(value).strip()` (empty for falsy values), interned for cheap reuse."""
+    if not value:
+        return ""
+    return sys.intern(str(value).strip())
+
+
+def _sv(value: object) -> str:
+    """Return `value` stripped as a str ("" for None), skipping str() for str cells."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value.strip()
+    return str(value).strip()
+
+
+_WS_RE = re.compile(r"\s+")
+# Form 3 row-write patterns, applied once per characteristic.
+_DATUM_SINGLE_RE = re.compile(r"\b([A-Za-z])\b")
+_DATUM_ANY_RE = re.compile(r"([A-Za-z])")
+_BASIC_DIM_RE = re.compile(r"\b(?:basic|bsc)\b", re.IGNORECASE)
+_TOL_NUMBER_RE = re.compile(r"(\d*\.?\d+)")
+_GAGE_PREFIX_RE = re.compile(r"^\s*(?:gage\s*id|id)\s*:\s*", re.IGNORECASE)
+_DUE_PREFIX_RE = re.compile(r"^\s*(?:cal\s*due|due)\s*:\s*", re.IGNORECASE)
+
+
+def _norm_ws(value: object) -> str:
+    """Lower-case `value` with whitespace runs collapsed, for sheet-name/header matching ("" for None)."""
+    if value is None:
+        return ""
+    return _WS_RE.sub(" ", str(value).strip().lower())
+
+
+# GD&T font-mapped codes, most specific first (e.g. "PROFILE OF A LINE" before "PROFILE").
+_GDT_FONT_CODES: tuple[tuple[str, str], ...] = (
+    ("ANGULARITY", "a"),
+    ("PERPENDICULAR", "b"),
+    ("FLATNESS", "c"),
+    ("PROFILE OF A LINE", "k"),
+    ("PROFILE", "d"),
+    ("CIRCULARITY", "e"),
+    ("PARALLEL", "f"),
+    ("CYLINDRIC", "g"),
+    ("CIRCULAR RUNOUT", "h"),
+    ("SYMMETRY", "i"),
+    ("TRUE POSITION", "j"),
+    ("POSITION", "j"),
+    ("LMC", "l"),
+    ("MMC", "m"),
+    ("SQUARE", "o"),
+    ("PROJECTED TOLERANCE ZONE", "p"),
+    ("CENTERLINE", "q"),
+    ("CONCENTRIC", "r"),
+    ("RFS", "s"),
+    ("TOTAL RUNOUT", "t"),
+    ("STRAIGHTNESS", "u"),
+    ("COUNTERBORE", "v"),
+    ("COUNTERSINK", "w"),
+    ("DEPTH", "x"),
+    ("CONICAL TAPER", "y"),
+    ("FLAT TAPER", "Z"),
+)
+
+
+def _gdt_font_code_from_text(text: str) -> str:
+    """Return the single-letter code (Excel font-mapped) from text."""
+    tu = str(text or "").strip().upper()
+    if not tu:
+        return ""
+    for key, code in _GDT_FONT_CODES:
+        if key in tu:
+            return code
+    return ""
+
+
+def _gdt_symbol_from_text(text: str) -> str:
+    """Best-effort Unicode GD&T symbol from Calypso/spec text.
+
+    Uses Unicode symbols where available; falls back to a short token when not.
+    """
+    tu = str(text or "").strip().upper()
+    if not tu:
+        return ""
+
+    # Order matters: specific phrases first.
+    if "PROFILE OF A LINE" in tu or "PROFILE OF LINE" in tu:
+        return "⌒"  # U+2312
+    if "PROFILE" in tu:
+        return "⌓"  # U+2313
+    if "TRUE POSITION" in tu or "POSITION" in tu:
+        return "⌖"  # U+2316
+    if "PERPENDICULAR" in tu:
+        return "⊥"  # U+22A5
+    if "PARALLEL" in tu:
+        return "∥"  # U+2225
+    if "ANGULAR" in tu:
+        return "∠"  # U+2220
+    if "FLATNESS" in tu:
+        return "⏥"  # U+23E5
+    if "STRAIGHTNESS" in tu:
+        return "⏤"  # U+23E4
+    if "CIRCULARITY" in tu or "ROUNDNESS" in tu:
+        return "○"  # U+25CB
+    if "CYLINDRIC" in tu:
+        return "⌭"  # U+232D
+    if "CONCENTRIC" in tu:
+        return "⊙"  # U+2299 (approx)
+    if "SYMMETRY" in tu:
+        return "≡"  # U+2261 (approx)
+    if "CIRCULAR RUNOUT" in tu:
+        return "⟲"  # U+27F2 (approx)
+    if "TOTAL RUNOUT" in tu or "RUNOUT" in tu:
+        return "⟳"  # U+27F3 (approx)
+
+    # Modifiers/feature-control extras sometimes appear standalone.
+    if "MMC" in tu:
+        return "Ⓜ"  # U+24C2
+    if "LMC" in tu:
+        return "Ⓛ"  # U+24C1
+    if "RFS" in tu:
+        return "Ⓢ"  # U+24C8
+    if "PROJECTED" in tu and "ZONE" in tu:
+        return "Ⓟ"  # U+24C5
+
+    if "SQUARE" in tu:
+        return "□"  # U+25A1
+    if "CENTERLINE" in tu or "CENTER LINE" in tu:
+        return "℄"  # U+2104
+
+    if "COUNTERBORE" in tu:
+        return "⌴"  # U+2334
+    if "COUNTERSINK" in tu:
+        return "⌵"  # U+2335
+    if "DEPTH" in tu:
+        return "⌷"  # U+2337
+
+    return ""
+
+
+# Characteristic types that count as GD&T callouts when the idsymbol doesn't say so.
+_GDT_CALLOUT_TYPE_KEYS = (
+    "POSITION",
+    "TRUE POSITION",
+    "FLATNESS",
+    "PERPENDICULAR",
+    "PROFILE",
+    "PARALLEL",
+    "ANGULAR",
+    "STRAIGHT",
+    "CIRCULAR",
+    "CYLINDRIC",
+    "RUNOUT",
+    "SYMMETRY",
+    "CONCENTRIC",
+)
+
+
+def _is_gdt_callout_row(idsym: str, typ: str, cid: str) -> bool:
+    """Return True only for rows that should display a GD&T callout.
+
+    Takes a characteristic's stripped idsymbol/type/id, which the Form 3 writer reads
+    once per row and reuses for the callout text.
+
+    Calypso exports often include helper/component rows like .X/.Z that are
+    "basic" components for a GD&T position and should NOT display a callout.
+    Also exclude pure size dimensions like Diameter of Cylinder/Circle.
+    """
+    idsym_l = idsym.lower()
+    typ_u = typ.upper()
+    cid_u = cid.upper()
+
+    # Exclude X/Z component rows (e.g., True Position ... .X / .Z)
+    if idsym_l.endswith(".x") or idsym_l.endswith(".z"):
+        return False
+    if cid_u.endswith(".X") or cid_u.endswith(".Z"):
+        return False
+    if ".X" in typ_u or ".Z" in typ_u:
+        return False
+    if typ_u in ("X VALUE", "Y VALUE", "Z VALUE"):
+        return False
+
+    # Exclude diameter size dimensions (not GD&T callouts)
+    if idsym_l == "diameter" or typ_u == "DIAMETER":
+        return False
+
+    # Most GD&T rows in this export have idsymbol starting with 'gdt'.
+    # Keep that as a strong signal.
+    if idsym_l.startswith("gdt"):
+        return True
+
+    # Fallback: allow explicit GD&T types.
+    return any(k in typ_u for k in _GDT_CALLOUT_TYPE_KEYS)
+
+
+# Form sheet classifier, tried in order against the _norm_ws() sheet name. "2c" (None)
+# is the conjunctive Form 2 continuation test and must be checked before plain "2".
+_FORM_SHEET_NEEDLES: tuple[tuple[str, tuple[str, ...] | None], ...] = (
+    ("1", ("form 1", "form1")),
+    ("2c", None),
+    ("2", ("form 2", "form2")),
+    ("3", ("form 3", "form3")),
+)
+
+
+# Pure and called with the same directory strings on every read and write, so memoized.
+@functools.lru_cache(maxsize=4096)
 def _clean_company_prefix(company: str, address: str) -> str:
     comp = str(company or "").strip()
     addr = str(address or "").strip()
@@ -256,6 +575,7 @@ def _parse_us_city_state_zip(s: str) -> tuple[str, str, str]:
     return city.strip(), "", ""
 
 
+@functools.lru_cache(maxsize=4096)
 def _split_address_lines(full_address: str) -> tuple[str, str, str, str, str, str]:
     """Split a one-line address into (addr1, addr2, addr3, city, state, zip)."""
     s = str(full_address or "").strip()
@@ -263,7 +583,7 @@ def _split_address_lines(full_address: str) -> tuple[str, str, str, str, str, st
         return "", "", "", "", "", ""
 
     # Normalize whitespace
-    s = re.sub(r"\s+", " ", s)
+    s = _WS_RE.sub(" ", s)
 
     # Try comma-based split
     parts = [p.strip() for p in s.split(",") if p.strip()]
@@ -292,36 +612,26 @@ def _split_address_lines(full_address: str) -> tuple[str, str, str, str, str, st
 
 
 def _build_full_address(addr1: str, addr2: str, addr3: str, city: str, state: str, zipc: str) -> str:
-    parts: list[str] = []
-    for a in (addr1, addr2, addr3):
-        a = str(a or "").strip().strip(",")
-        if a:
-            parts.append(a)
+    a1 = str(addr1 or "").strip().strip(",")
+    a2 = str(addr2 or "").strip().strip(",")
+    a3 = str(addr3 or "").strip().strip(",")
     cs = str(city or "").strip().strip(",")
     st = str(state or "").strip().upper()
     z = str(zipc or "").strip()
-    tail = ""
-    if cs and st and z:
-        tail = f"{cs}, {st} {z}"
-    elif cs and st:
-        tail = f"{cs}, {st}"
-    elif cs:
-        tail = cs
-    elif st and z:
-        tail = f"{st} {z}"
-    elif st:
-        tail = st
-    elif z:
-        tail = z
-    if tail:
-        parts.append(tail)
-    return ", ".join(parts)
+    # "City, ST 12345" / "City, ST" / "City" / "ST 12345" / "ST" / "12345" (zip is dropped after a bare city).
+    st_z = f"{st} {z}" if (st and z) else (st or z)
+    if cs:
+        tail = f"{cs}, {st_z}" if st else cs
+    else:
+        tail = st_z
+    return ", ".join(p for p in (a1, a2, a3, tail) if p)
 
 
 def _build_full_address_v2(addr1: str, addr2: str, city: str, state: str, zipc: str) -> str:
     return _build_full_address(addr1, addr2, "", city, state, zipc)
 
 
+@functools.lru_cache(maxsize=4096)
 def _build_full_address_with_company(company: str, addr1: str, addr2: str, city: str, state: str, zipc: str) -> str:
     """Build the stored dropdown value shown in Form 1/2 cells.
 
@@ -334,6 +644,204 @@ def _build_full_address_with_company(company: str, addr1: str, addr2: str, city:
     return comp_s or base
 
 
+def _normalize_supplier_row(raw, legacy: bool) -> tuple[str, str, str, str, str, str] | None:
+    """Normalize one raw supplier-directory sheet row to the 6-column tab layout.
+
+    `legacy` selects the old A-G schema (with Address 3 in D). Returns None for blank rows.
+    """
+    if len(raw) < 7:
+        raw = tuple(raw) + (None,) * (7 - len(raw))
+    comp, a1, a2 = raw[0], raw[1], raw[2]
+    if legacy:
+        a3, city, state, zipc = raw[3], raw[4], raw[5], raw[6]
+    else:
+        a3, city, state, zipc = None, raw[3], raw[4], raw[5]
+
+    comp, a1, a2, a3, city, zipc = _sv(comp), _sv(a1), _sv(a2), _sv(a3), _sv(city), _sv(zipc)
+    state = _sv(state).upper()
+
+    if a1 and not (a2 or a3 or city or state or zipc):
+        # Backward compat: only column B populated -> treat it as a one-line address.
+        a1, a2, a3, city, state, zipc = _split_address_lines(_clean_company_prefix(comp, a1))
+    # Fold Address 3 into Address 2 for the screenshot schema.
+    if a3:
+        a2 = f"{a2}, {a3}" if a2 else a3
+
+    if not (comp or a1 or a2 or city or state or zipc):
+        return None
+    return comp, a1, a2, city, state, zipc
+
+
+def _drop_cached_rows(ws) -> None:
+    """Forget rows cached on a list sheet by its reader after the sheet is rewritten."""
+    for attr in ("_as9102_rows_cache", "_as9102_addr_by_customer", "_as9102_legacy_schema"):
+        try:
+            delattr(ws, attr)
+        except AttributeError:
+            pass
+
+
+def _form3_bubble_index(viewer) -> tuple[list[int], dict[int, int]]:
+    """Return (sorted rows, row -> bubble number) for column E of the viewer's sheet.
+
+    Built from the cells that already exist in column E (iter_rows would create an empty
+    cell for every row it visits) and kept in the viewer's row-index cache, which the
+    viewer drops when the sheet is replaced, re-rendered or edited.
+    """
+    cache = viewer._row_index_cache
+    idx = cache.get("form3_bubbles")
+    if idx is None:
+        nums: dict[int, int] = {}
+        ws = getattr(viewer, "_ws", None)
+        cells = getattr(ws, "_cells", None) or {}
+        for (r, c), cell in list(cells.items()):
+            if c != 5:
+                continue
+            v = cell.value
+            if v is None:
+                continue
+            try:
+                n = int(v)
+            except Exception:
+                continue
+            if n > 0:
+                nums[r] = n
+        idx = cache["form3_bubbles"] = (sorted(nums), nums)
+    return idx
+
+
+def _form3_bubble_number_at_row(viewer, row_1based: int) -> int | None:
+    """Bubble number in column E of `row_1based`, read from the cached bubble index."""
+    return _form3_bubble_index(viewer)[1].get(row_1based)
+
+
+def _form3_next_bubble_row(viewer, row_1based: int, step: int) -> tuple[int, int] | None:
+    """Find the nearest bubble row from `row_1based + step` (clamped to row 6) going `step`.
+
+    The index only holds rows that exist on the sheet, so the bisect position being in
+    range is the whole bounds check; no max_row probe or iteration cap is needed.
+    """
+    rows, nums = _form3_bubble_index(viewer)
+    rr = max(6, row_1based + step)
+    if step > 0:
+        i = bisect.bisect_left(rows, rr)
+    else:
+        i = bisect.bisect_right(rows, rr) - 1
+    if 0 <= i < len(rows):
+        return rows[i], nums[rows[i]]
+    return None
+
+
+def _form3_select_bubble_cell(tbl, r0: int) -> None:
+    """Make column E of row `r0` the only selected, current cell and scroll it near the top.
+
+    One ClearAndSelect update on the selection model, so the table emits a single
+    selection change instead of one each for clear/setCurrentCell/setRangeSelected.
+    """
+    model = tbl.model()
+    tbl.selectionModel().setCurrentIndex(
+        model.index(r0, 4), QItemSelectionModel.SelectionFlag.ClearAndSelect
+    )
+    # Keep a few rows of context above the selected bubble.
+    tbl.scrollTo(model.index(max(0, r0 - 5), 4), _SH_POS_TOP)
+
+
+def _replace_hidden_sheet_rows(ws, rows, width: int | None = None) -> None:
+    """Replace the first `width` columns of an internal `__as9102_*` list sheet with `rows`.
+
+    `width` is the number of leading columns the caller owns (default: the widest row);
+    cells to the right of it, such as a legacy marker column, are left alone. Rows are
+    overwritten in place and only cells whose value actually changes are written, so
+    re-saving a list after an in-place edit touches just the edited cells. Rows past
+    the old end (all of them on a fresh sheet) go through ws.append(). Leftover rows
+    past the new end are dropped with one delete_rows() call, or just cleared when the
+    sheet has data beyond `width`.
+    """
+    _drop_cached_rows(ws)
+    rows = [tuple(r) for r in rows]
+    n = len(rows)
+    # max_row reports 1 for a sheet with no cells at all.
+    old_max = (getattr(ws, "max_row", 0) or 0) if getattr(ws, "_cells", None) else 0
+    if width is None:
+        width = max((len(r) for r in rows), default=0)
+    old_rows = iter(())
+    if n and old_max and width:
+        old_rows = ws.iter_rows(min_row=1, max_row=min(n, old_max), max_col=width, values_only=True)
+    # append() writes after ws._current_row, so it is only used when that is the old end.
+    can_append = getattr(ws, "_current_row", None) == old_max
+    cell = ws.cell
+    for r, new in enumerate(rows, start=1):
+        if r > old_max and can_append:
+            ws.append(new)
+            continue
+        old = next(old_rows, ())
+        for c in range(width):
+            nv = new[c] if c < len(new) else None
+            ov = old[c] if c < len(old) else None
+            if nv != ov or type(nv) is not type(ov):
+                cell(row=r, column=c + 1).value = nv
+    if old_max > n:
+        if (getattr(ws, "max_column", 0) or 0) <= width:
+            ws.delete_rows(n + 1, old_max - n)
+        else:
+            cells = ws._cells
+            for r in range(n + 1, old_max + 1):
+                for c in range(1, width + 1):
+                    existing = cells.get((r, c))
+                    if existing is not None and existing.value is not None:
+                        existing.value = None
+
+
+def _list_validation_covering(ws, ref: str):
+    """Return the first list DataValidation on `ws` whose ranges cover all of `ref`.
+
+    `ref` is a cell or range sqref ("D9", "E15:E500", "A1 C3:C9"). Each of its ranges must
+    lie inside one of the validation's ranges, so "D9" matches "D5:D20" but not
+    "D90:D99", and "D9:D500" is not covered by "D5:D20". Nothing is cached: the
+    validations are read fresh on every call, so edits to a validation's sqref or
+    swapping one in place are always seen.
+    """
+    try:
+        wanted = MultiCellRange(str(ref or "")).ranges
+    except Exception:
+        return None
+    if not wanted:
+        return None
+    dvs = getattr(ws, "data_validations", None)
+    for dv in list(getattr(dvs, "dataValidation", []) or []):
+        if getattr(dv, "type", None) != "list":
+            continue
+        try:
+            sqref = dv.sqref
+            if not isinstance(sqref, MultiCellRange):
+                sqref = MultiCellRange(str(sqref or ""))
+            have = sqref.ranges
+            if all(any(w.issubset(h) for h in have) for w in wanted):
+                return dv
+        except Exception:
+            continue
+    return None
+
+
+def _pack_table_sizes(cols: list[int], rows: list[int]) -> bytes:
+    """Pack column widths and row heights: <II (col count, row count) then one <I per size."""
+    return struct.pack(f"<II{len(cols) + len(rows)}I", len(cols), len(rows), *cols, *rows)
+
+
+def _unpack_table_sizes(blob: bytes) -> tuple[list[int], list[int]] | None:
+    """Inverse of _pack_table_sizes; also reads the older <HH-header blobs. None if malformed."""
+    for head in ("<II", "<HH"):
+        off = struct.calcsize(head)
+        if len(blob) < off:
+            continue
+        n_cols, n_rows = struct.unpack_from(head, blob)
+        if len(blob) != off + 4 * (n_cols + n_rows):
+            continue
+        sizes = struct.unpack_from(f"<{n_cols + n_rows}I", blob, off)
+        return list(sizes[:n_cols]), list(sizes[n_cols:])
+    return None
+
+
 # Supplier directory seed rows EXACTLY as provided in the screenshot.
 # Columns: Company, Address 1, Address 2, City, State, Zip Code
 DEFAULT_SUPPLIER_DIRECTORY_SEED: list[tuple[str, str, str, str, str, str]] = [
@@ -429,19 +937,33 @@ class MainWindow(QMainWindow):
         # Forms are keyed to match the common template structure
         # (Form 1, Form 2, Form 2 Cont., Form 3)
         self._form_sheet_names = {"1": None, "2": None, "2c": None, "3": None}
+        # Worksheet handles for the detected form sheets (wb[name] is a linear title scan).
+        self._form_worksheets: dict[str, object] = {}
         self._form_viewers = {"1": None, "2": None, "2c": None, "3": None}
+        # Popped-out form windows (kept referenced to prevent garbage collection).
+        self._popout_windows: list[QMainWindow] = []
+        # ExcelSheetViewer children per pop-out window, keyed by id(window).
+        self._popout_viewer_cache: dict[int, list] = {}
+        # Coalesces validation refreshes requested by bulk list writes.
+        self._viewer_refresh_timer: QTimer | None = None
+        # Set by supplier directory writes; the dropdowns are re-applied on the next refresh.
+        self._supplier_dropdowns_pending = False
         self._supplier_directory_table = None
-        self._supplier_directory_suppress_changes = False
+        # Rows last handed to _save_persistent_supplier_directory_rows (None = unknown).
+        self._persisted_supplier_directory_snapshot: tuple | None = None
 
         # Threads tab state
         self._threads_table = None
 
         # Calibrated Equipment tab state
         self._calibrated_equipment_table = None
-        self._calibrated_equipment_suppress_changes = False
 
         # Per-user/per-machine settings (Windows registry on Windows).
         self._settings = QSettings("as9102_fai", "as9102_fai_gui")
+        # Parsed JSON list payloads keyed by settings key (write-through; see _cached_qsetting_json).
+        self._qsettings_cache: dict[str, object] = {}
+        # Last serialized value written/read per settings key, to skip no-op writes.
+        self._last_written_payload: dict[str, str | bytes] = {}
 
         # Form 3 option: include derived thread rows (Go/No-Go + Minor Dia).
         self._form3_include_thread_extras = self._settings.value(
@@ -466,6 +988,21 @@ class MainWindow(QMainWindow):
         # Debounce timers for persisting table column/row sizes.
         self._table_persist_timers: dict[str, QTimer] = {}
 
+        # Debounce timers for saving editable list tables (Supplier Directory, etc.).
+        self._table_save_timers: dict[str, QTimer] = {}
+        self._table_savers: dict[str, object] = {}
+        # QSettings writes from spin boxes/checkboxes, flushed once per burst.
+        self._pending_settings: dict[str, object] = {}
+        self._settings_flush_timer = QTimer(self)
+        self._settings_flush_timer.setSingleShot(True)
+        self._settings_flush_timer.setInterval(250)
+        self._settings_flush_timer.timeout.connect(self._flush_pending_settings)
+
+        # Set while load_template() waits on the worker thread; a close requested
+        # during the wait is replayed once the load returns.
+        self._template_loading = False
+        self._close_after_template_load = False
+
         # Form 3 undo stack (for row delete operations).
         self._form3_undo_stack: list[bytes] = []
         self._form3_undo_max = 20
@@ -727,13 +1264,6 @@ class MainWindow(QMainWindow):
                     pass
                 break
 
-        def _norm_header(v: object) -> str:
-            if v is None:
-                return ""
-            s = str(v).strip().lower()
-            s = re.sub(r"[\s\t\r\n]+", " ", s)
-            return s
-
         results_col: int | None = None
         bonus_tol_col: int | None = None
 
@@ -756,7 +1286,7 @@ class MainWindow(QMainWindow):
                     hv = ws.cell(row=hr, column=cc).value
                     if hv is None or str(hv).strip() == "":
                         continue
-                    h = _norm_header(hv)
+                    h = _norm_ws(hv)
                     if bonus_tol_col is None and ("bonus" in h and "tolerance" in h):
                         bonus_tol_col = cc
                     if results_col is None and ("result" in h or "results" in h or "actual" in h):
@@ -832,13 +1362,6 @@ class MainWindow(QMainWindow):
         tooling_col: int | None = None
         additional_col: int | None = None
 
-        def _norm_header(v: object) -> str:
-            if v is None:
-                return ""
-            s = str(v).strip().lower()
-            s = re.sub(r"[\s\t\r\n]+", " ", s)
-            return s
-
         try:
             max_col = min(int(getattr(ws, "max_column", 0) or 0), 26)
         except Exception:
@@ -857,7 +1380,7 @@ class MainWindow(QMainWindow):
                     hv = ws.cell(row=hr, column=cc).value
                     if hv is None or str(hv).strip() == "":
                         continue
-                    h = _norm_header(hv)
+                    h = _norm_ws(hv)
                     if unit_col is None and ("unit" in h) and ("measure" in h or "measurement" in h or "uom" in h):
                         unit_col = cc
                     if tooling_col is None and ("tooling" in h) and ("designed" in h) and ("qualified" in h):
@@ -1388,11 +1911,8 @@ class MainWindow(QMainWindow):
             try:
                 if bool(cb.isChecked()) == enabled:
                     continue
-                cb.blockSignals(True)
-                try:
+                with QSignalBlocker(cb):
                     cb.setChecked(enabled)
-                finally:
-                    cb.blockSignals(False)
             except Exception:
                 pass
 
@@ -1494,17 +2014,18 @@ class MainWindow(QMainWindow):
             data = combo.currentData()
             if isinstance(data, tuple) and len(data) == 3:
                 mid, mtype, due = data
-                return (str(mid or "").strip(), str(mtype or "").strip(), str(due or "").strip())
+                return (_clean(mid), _clean(mtype), _clean(due))
         except Exception:
             pass
 
-        selected_name = str(combo.currentText() or "").strip()
+        selected_name = _clean(combo.currentText())
         if not selected_name:
             return None
 
+        selected_key = selected_name.lower()
         for name, mid, mtype, due in self._calibrated_equipment_rows_for_dropdown():
-            if str(name or "").strip().lower() == selected_name.lower():
-                return (str(mid or "").strip(), str(mtype or "").strip(), str(due or "").strip())
+            if _clean(name).lower() == selected_key:
+                return (_clean(mid), _clean(mtype), _clean(due))
         return None
 
     def _selected_machine_name_for_combo(self, combo) -> str:
@@ -1528,7 +2049,12 @@ class MainWindow(QMainWindow):
                 return row
         return None
 
-    def _reload_calypso_inputs(self) -> None:
+    def _reload_calypso_inputs(self) -> set[str]:
+        """Re-parse all Calypso inputs and rewrite Form 3.
+
+        Returns the sheet names touched by the calibrated-equipment write
+        (Form 3 is always rewritten and re-rendered here when present).
+        """
         aggregated: list[FaiCharacteristic] = []
 
         for slot_index, row in self._iter_calypso_input_rows():
@@ -1563,9 +2089,10 @@ class MainWindow(QMainWindow):
 
         self.characteristics = aggregated
 
+        mutated: set[str] = set()
         if self._template_wb is not None:
             try:
-                self._apply_selected_calibrated_equipment_to_workbook()
+                mutated = self._apply_selected_calibrated_equipment_to_workbook()
             except Exception:
                 pass
 
@@ -1580,6 +2107,8 @@ class MainWindow(QMainWindow):
             self._form_viewers["3"].render()
             QTimer.singleShot(0, self._sync_bubbles_to_form3)
 
+        return mutated
+
     def _browse_chr_slot(self, slot_index: int) -> None:
         row = None
         for idx, candidate in self._iter_calypso_input_rows():
@@ -1701,7 +2230,7 @@ class MainWindow(QMainWindow):
                 )
             except Exception:
                 pass
-            combo.currentIndexChanged.connect(self._on_calibrated_equipment_combo_changed)
+            _connect_unique(combo.currentIndexChanged, self._on_calibrated_equipment_combo_changed)
 
             path_edit = QLineEdit()
             path_edit.setPlaceholderText(f"Drop chr.txt here for Machine {slot_index + 1} or click Browse")
@@ -1802,6 +2331,9 @@ class MainWindow(QMainWindow):
 
         # Embed the same layout as the standalone Drawing Viewer window
         # (Properties/Notes docks + drawing toolbar).
+        # Tracks the pop-out state set by _undock/_dock_drawing_viewer so hot paths
+        # (wheel/key navigation) don't have to probe windowFlags() on every event.
+        self._drawing_viewer_popped = False
         self.drawing_viewer_tab = DrawingViewerWindow(
             pdf_path="",
             default_save_basename="",
@@ -1815,18 +2347,18 @@ class MainWindow(QMainWindow):
         try:
             v = getattr(self.drawing_viewer_tab, "_pdf_viewer", None)
             if v is not None and hasattr(v, "bubbles_changed"):
-                v.bubbles_changed.connect(self._on_drawing_bubbles_changed)
+                _connect_unique(v.bubbles_changed, self._on_drawing_bubbles_changed)
             if v is not None and hasattr(v, "drawing_saved"):
-                v.drawing_saved.connect(self._on_drawing_saved)
+                _connect_unique(v.drawing_saved, self._on_drawing_saved)
             if v is not None and hasattr(v, "insert_notes_to_form3_requested"):
-                v.insert_notes_to_form3_requested.connect(self._on_insert_notes_to_form3)
+                _connect_unique(v.insert_notes_to_form3_requested, self._on_insert_notes_to_form3)
         except Exception:
             pass
 
         # Drawing Viewer bubble scroller: optionally highlight Form 3 when viewer is popped out.
         try:
             if hasattr(self.drawing_viewer_tab, "bubbleScrollSelected"):
-                self.drawing_viewer_tab.bubbleScrollSelected.connect(self._on_drawing_bubble_scroller_selected)
+                _connect_unique(self.drawing_viewer_tab.bubbleScrollSelected, self._on_drawing_bubble_scroller_selected)
         except Exception:
             pass
         drawing_tab_l.addWidget(self.drawing_viewer_tab, 1)
@@ -1911,6 +2443,7 @@ class MainWindow(QMainWindow):
             # Detach from layout and show as a top-level window.
             dv.setParent(None)
             dv.setWindowFlags(Qt.Window)
+            self._drawing_viewer_popped = True
             try:
                 dv.set_docked_state(False)
             except Exception:
@@ -1938,6 +2471,7 @@ class MainWindow(QMainWindow):
 
             dv.setParent(tab)
             dv.setWindowFlags(Qt.Widget)
+            self._drawing_viewer_popped = False
             try:
                 dv.set_docked_state(True)
             except Exception:
@@ -1981,14 +2515,14 @@ class MainWindow(QMainWindow):
         items: list[tuple[str, tuple[str, str, str]]] = []
         seen: set[str] = set()
         for name, mid, mtype, due in rows:
-            n = str(name or "").strip()
+            n = _clean(name)
             if not n:
                 continue
             key = n.lower()
             if key in seen:
                 continue
             seen.add(key)
-            items.append((n, (str(mid or "").strip(), str(mtype or "").strip(), str(due or "").strip())))
+            items.append((n, (_clean(mid), _clean(mtype), _clean(due))))
 
         if not rows_ui and getattr(self, "calibrated_equipment_combo", None) is not None:
             rows_ui = [{"combo": self.calibrated_equipment_combo}]
@@ -1997,7 +2531,7 @@ class MainWindow(QMainWindow):
             combo = row.get("combo")
             if combo is None:
                 continue
-            prev = str(combo.currentText() or "").strip() if preserve_selection else ""
+            prev = _clean(combo.currentText()) if preserve_selection else ""
             try:
                 combo.blockSignals(True)
                 combo.clear()
@@ -2029,7 +2563,7 @@ class MainWindow(QMainWindow):
         if combo is None:
             return
 
-        selected_name = str(combo.currentText() or "").strip()
+        selected_name = _clean(combo.currentText())
         slot_index = 0
         for idx, row in self._iter_calypso_input_rows():
             if row.get("combo") is combo:
@@ -2053,21 +2587,18 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            self._reload_calypso_inputs()
+            mutated = self._reload_calypso_inputs()
         except Exception:
             return
 
-        # Re-render relevant forms so the user sees the change immediately.
+        # Re-render the forms whose sheets the equipment write touched.
+        # Form 3 was already rewritten and rendered by _reload_calypso_inputs.
         try:
-            for key in ("2", "2c", "3"):
+            sheetnames = set(self._template_wb.sheetnames)
+            for key in ("2", "2c"):
                 name = self._form_sheet_names.get(key)
                 viewer = self._form_viewers.get(key)
-                if name and viewer and name in self._template_wb.sheetnames:
-                    if key == "3" and self.characteristics:
-                        try:
-                            self._write_form3_to_worksheet(self._template_wb[name])
-                        except Exception:
-                            pass
+                if name and viewer and name in mutated and name in sheetnames:
                     viewer.set_overrides({})
                     viewer.render()
         except Exception:
@@ -2084,25 +2615,27 @@ class MainWindow(QMainWindow):
         s = s.replace(" ", "")
         return s
 
-    def _apply_selected_calibrated_equipment_to_workbook(self) -> None:
+    def _apply_selected_calibrated_equipment_to_workbook(self) -> set[str]:
         """Write selected equipment details into the template workbook.
 
         - Machine ID + Calibration Due Date -> "Designed/Qualified tooling" field
         - Machine Type -> first column under "Additional Data/Comments"
+
+        Returns the names of the sheets that were actually written.
         """
 
         if self._template_wb is None:
-            return
+            return set()
         details = self._selected_calibrated_equipment_details()
         if not details:
-            return
+            return set()
         machine_id, machine_type, due_date = details
 
         # Form 3 (and some Form 2 templates) display tooling like:
         #   Gage ID: <id>  Cal Due: <date>
         # Convert older persisted prefixes ("ID:" / "Due:") if present.
-        mid_clean = re.sub(r"^\s*(?:gage\s*id|id)\s*:\s*", "", str(machine_id or ""), flags=re.IGNORECASE).strip()
-        due_clean = re.sub(r"^\s*(?:cal\s*due|due)\s*:\s*", "", str(due_date or ""), flags=re.IGNORECASE).strip()
+        mid_clean = _GAGE_PREFIX_RE.sub("", str(machine_id or "")).strip()
+        due_clean = _DUE_PREFIX_RE.sub("", str(due_date or "")).strip()
         tooling_parts: list[str] = []
         if mid_clean:
             tooling_parts.append(f"Gage ID: {mid_clean}")
@@ -2146,18 +2679,21 @@ class MainWindow(QMainWindow):
             # Common patterns: "10", "10.", "10)"
             return s == str(n) or s.startswith(f"{n}.") or s.startswith(f"{n})")
 
-        def row_has_keywords(ws, row: int, keywords: list[str], max_col: int) -> int:
-            score = 0
+        def normalized_row(ws, row: int, max_col: int) -> list[tuple[int, str]]:
+            """Return [(col, normalized_label)] for the non-empty cells on a row."""
+            out: list[tuple[int, str]] = []
             for cc in range(1, max_col + 1):
-                v = ws.cell(row=row, column=cc).value
-                n = self._norm_label(v)
-                if not n:
-                    continue
-                hit = 0
-                for kw in keywords:
-                    if kw in n:
-                        hit += 1
-                score = max(score, hit)
+                n = self._norm_label(ws.cell(row=row, column=cc).value)
+                if n:
+                    out.append((cc, n))
+            return out
+
+        def row_has_keywords(norm_row: list[tuple[int, str]], keywords: tuple[str, ...]) -> int:
+            score = 0
+            for _cc, n in norm_row:
+                hit = sum(1 for kw in keywords if kw in n)
+                if hit > score:
+                    score = hit
             return score
 
         def find_numbered_field_write_cell(ws, field_no: int, keywords: list[str]) -> tuple[int, int] | None:
@@ -2168,13 +2704,19 @@ class MainWindow(QMainWindow):
 
             max_row = min(getattr(ws, "max_row", 0) or 0, 250)
             max_col = min(getattr(ws, "max_column", 0) or 0, 60)
+            kw_tuple = tuple(keywords)
             best: tuple[int, int, int] | None = None  # (score, row, number_col)
+            # Each row is normalized at most once, then shared by scoring and label lookup.
+            norm_rows: dict[int, list[tuple[int, str]]] = {}
 
             for rr in range(1, max_row + 1):
                 for cc in range(1, min(max_col, 10) + 1):
                     if not looks_like_field_number(ws.cell(row=rr, column=cc).value, field_no):
                         continue
-                    score = row_has_keywords(ws, rr, keywords, max_col)
+                    norm_row = norm_rows.get(rr)
+                    if norm_row is None:
+                        norm_row = norm_rows[rr] = normalized_row(ws, rr, max_col)
+                    score = row_has_keywords(norm_row, kw_tuple)
                     if score <= 0:
                         continue
                     if best is None or score > best[0]:
@@ -2187,12 +2729,8 @@ class MainWindow(QMainWindow):
             # Find the label cell on this row that contains most keywords.
             best_label_col = num_col
             best_label_hits = 0
-            for cc in range(1, max_col + 1):
-                v = ws.cell(row=rr, column=cc).value
-                n = self._norm_label(v)
-                if not n:
-                    continue
-                hits = sum(1 for kw in keywords if kw in n)
+            for cc, n in norm_rows[rr]:
+                hits = sum(1 for kw in kw_tuple if kw in n)
                 if hits > best_label_hits:
                     best_label_hits = hits
                     best_label_col = cc
@@ -2280,9 +2818,10 @@ class MainWindow(QMainWindow):
         sheet_candidates: list[str] = []
         # NOTE: Do not apply this to Form 3. Form 3 uses per-row columns for tooling/comments,
         # and writing into the header area can land in unintended merged cells (e.g. O4/P5).
+        sheetnames = set(self._template_wb.sheetnames)
         for key in ("2", "2c", "1"):
             nm = self._form_sheet_names.get(key)
-            if nm and nm in self._template_wb.sheetnames:
+            if nm and nm in sheetnames:
                 sheet_candidates.append(nm)
         # De-dup while preserving order.
         sheet_candidates = list(dict.fromkeys(sheet_candidates))
@@ -2290,16 +2829,19 @@ class MainWindow(QMainWindow):
             sheet_candidates = list(self._template_wb.sheetnames)
 
         wrote_any = False
+        mutated: set[str] = set()
         for sname in sheet_candidates:
             try:
                 ws = self._template_wb[sname]
             except Exception:
                 continue
+            wrote_sheet = False
             # First try label-based matching.
             if tooling_text:
-                wrote_any = write_next_to_label(ws, is_tooling_label, tooling_text) or wrote_any
+                wrote_sheet = write_next_to_label(ws, is_tooling_label, tooling_text) or wrote_sheet
             if machine_type:
-                wrote_any = write_under_header_first_col(ws, is_additional_comments_header, machine_type) or wrote_any
+                wrote_sheet = write_under_header_first_col(ws, is_additional_comments_header, machine_type) or wrote_sheet
+            wrote_any = wrote_any or wrote_sheet
 
             # Then try numbered-field matching (AS9102 Form 2 style):
             # 10. Designed/Qualified Tooling
@@ -2308,7 +2850,7 @@ class MainWindow(QMainWindow):
                 if loc is not None:
                     r0, c0 = loc
                     ws.cell(row=r0, column=c0).value = tooling_text
-                    wrote_any = True
+                    wrote_any = wrote_sheet = True
 
             # 12. Additional Data/Comments
             if machine_type and not wrote_any:
@@ -2316,9 +2858,12 @@ class MainWindow(QMainWindow):
                 if loc is not None:
                     r0, c0 = loc
                     ws.cell(row=r0, column=c0).value = machine_type
-                    wrote_any = True
+                    wrote_any = wrote_sheet = True
 
-        return
+            if wrote_sheet:
+                mutated.add(sname)
+
+        return mutated
         
         # Enable drops for the window
         self.setAcceptDrops(True)
@@ -2370,22 +2915,17 @@ class MainWindow(QMainWindow):
             if self._suppliers_table is None:
                 return
             table = self._suppliers_table
-            try:
-                table.blockSignals(True)
+            with QSignalBlocker(table):
                 r = table.rowCount()
                 table.insertRow(r)
-                for c in range(2):
-                    table.setItem(r, c, QTableWidgetItem(""))
-            finally:
-                table.blockSignals(False)
 
             table.setCurrentCell(r, 0)
-            table.editItem(table.item(r, 0))
+            table.edit(table.model().index(r, 0))
 
         def _delete_rows() -> None:
             if self._suppliers_table is None:
                 return
-            rows = sorted({idx.row() for idx in self._suppliers_table.selectionModel().selectedRows()}, reverse=True)
+            rows = sorted({idx.row() for idx in self._suppliers_table.selectedIndexes()}, reverse=True)
             if not rows:
                 return
             for r in rows:
@@ -2479,7 +3019,7 @@ class MainWindow(QMainWindow):
                 inner2 = inner
                 inner2 = inner2.replace(r"\s+", " ")
                 inner2 = inner2.replace(r"\s*", " ")
-                inner2 = re.sub(r"\s+", " ", inner2).strip()
+                inner2 = _WS_RE.sub(" ", inner2).strip()
             except Exception:
                 inner2 = inner.strip()
 
@@ -2651,8 +3191,7 @@ class MainWindow(QMainWindow):
 
         # Populate from settings (or defaults).
         rows = self._load_persistent_thread_rules_rows()
-        try:
-            table.blockSignals(True)
+        with QSignalBlocker(table):
             table.setRowCount(0)
             for rr, row in enumerate(rows):
                 table.insertRow(rr)
@@ -2668,29 +3207,24 @@ class MainWindow(QMainWindow):
                 table.setItem(rr, 0, QTableWidgetItem(pat))
                 table.setItem(rr, 1, QTableWidgetItem(rta))
                 for i in range(10):
-                    table.setItem(rr, 2 + i, QTableWidgetItem(suffixes[i]))
-        finally:
-            table.blockSignals(False)
+                    # Most suffix slots are blank; a missing item reads back as "".
+                    if suffixes[i]:
+                        table.setItem(rr, 2 + i, QTableWidgetItem(suffixes[i]))
 
         def _add_row() -> None:
             if self._threads_table is None:
                 return
             table = self._threads_table
-            try:
-                table.blockSignals(True)
+            with QSignalBlocker(table):
                 r = table.rowCount()
                 table.insertRow(r)
-                for c in range(12):
-                    table.setItem(r, c, QTableWidgetItem(""))
-            finally:
-                table.blockSignals(False)
             table.setCurrentCell(r, 0)
-            table.editItem(table.item(r, 0))
+            table.edit(table.model().index(r, 0))
 
         def _delete_rows() -> None:
             if self._threads_table is None:
                 return
-            rows = sorted({idx.row() for idx in self._threads_table.selectionModel().selectedRows()}, reverse=True)
+            rows = sorted({idx.row() for idx in self._threads_table.selectedIndexes()}, reverse=True)
             if not rows:
                 return
             for r in rows:
@@ -2891,38 +3425,6 @@ class MainWindow(QMainWindow):
 
         self._supplier_directory_table = table
 
-        class _StateDelegate(QHeaderView):
-            pass
-
-        from PySide6.QtWidgets import QStyledItemDelegate, QComboBox
-
-        class _StateComboDelegate(QStyledItemDelegate):
-            def createEditor(self, parent, option, index):
-                combo = QComboBox(parent)
-                combo.setEditable(True)
-                combo.addItem("")
-                combo.addItems(US_STATE_CODES)
-                QTimer.singleShot(0, combo.showPopup)
-                return combo
-
-            def setEditorData(self, editor, index):
-                try:
-                    txt = str(index.data(Qt.ItemDataRole.DisplayRole) or "").strip().upper()
-                    i = editor.findText(txt)
-                    if i >= 0:
-                        editor.setCurrentIndex(i)
-                    else:
-                        editor.setCurrentText(txt)
-                except Exception:
-                    return
-
-            def setModelData(self, editor, model, index):
-                try:
-                    txt = str(editor.currentText() or "").strip().upper()
-                    model.setData(index, txt)
-                except Exception:
-                    return
-
         # State column (index 4)
         table.setItemDelegateForColumn(4, _StateComboDelegate(table))
 
@@ -2930,31 +3432,29 @@ class MainWindow(QMainWindow):
             if self._supplier_directory_table is None:
                 return
             table = self._supplier_directory_table
-            try:
-                table.blockSignals(True)
+            with QSignalBlocker(table):
                 r = table.rowCount()
-                table.insertRow(r)
-                for c in range(6):
-                    table.setItem(r, c, QTableWidgetItem(""))
-            finally:
-                table.blockSignals(False)
+                # Items are created lazily when a cell is edited; readers treat missing items as "".
+                table.model().insertRow(r)
 
             table.setCurrentCell(r, 0)
-            table.editItem(table.item(r, 0))
+            table.edit(table.model().index(r, 0))
 
         def _delete_rows() -> None:
             if self._supplier_directory_table is None:
                 return
-            rows = sorted({idx.row() for idx in self._supplier_directory_table.selectionModel().selectedRows()}, reverse=True)
+            rows = {idx.row() for idx in self._supplier_directory_table.selectedIndexes()}
             if not rows:
                 return
-            for r in rows:
-                self._supplier_directory_table.removeRow(r)
-            self._save_supplier_directory_from_tab()
+            self._remove_rows_batched(self._supplier_directory_table, rows)
+            self._schedule_table_save("supplier_dir", self._save_supplier_directory_from_tab)
+
+        def _on_item_changed(_it) -> None:
+            self._schedule_table_save("supplier_dir", self._save_supplier_directory_from_tab)
 
         add_btn.clicked.connect(_add_row)
         del_btn.clicked.connect(_delete_rows)
-        table.itemChanged.connect(lambda _it: self._save_supplier_directory_from_tab())
+        table.itemChanged.connect(_on_item_changed)
 
         return container
 
@@ -3007,31 +3507,29 @@ class MainWindow(QMainWindow):
             if self._calibrated_equipment_table is None:
                 return
             table = self._calibrated_equipment_table
-            try:
-                table.blockSignals(True)
+            with QSignalBlocker(table):
                 r = table.rowCount()
-                table.insertRow(r)
-                for c in range(4):
-                    table.setItem(r, c, QTableWidgetItem(""))
-            finally:
-                table.blockSignals(False)
+                # Items are created lazily when a cell is edited; readers treat missing items as "".
+                table.model().insertRow(r)
 
             table.setCurrentCell(r, 0)
-            table.editItem(table.item(r, 0))
+            table.edit(table.model().index(r, 0))
 
         def _delete_rows() -> None:
             if self._calibrated_equipment_table is None:
                 return
-            rows = sorted({idx.row() for idx in self._calibrated_equipment_table.selectionModel().selectedRows()}, reverse=True)
+            rows = {idx.row() for idx in self._calibrated_equipment_table.selectedIndexes()}
             if not rows:
                 return
-            for r in rows:
-                self._calibrated_equipment_table.removeRow(r)
-            self._save_calibrated_equipment_from_tab()
+            self._remove_rows_batched(self._calibrated_equipment_table, rows)
+            self._schedule_table_save("calibrated_equipment", self._save_calibrated_equipment_from_tab)
+
+        def _on_item_changed(_it) -> None:
+            self._schedule_table_save("calibrated_equipment", self._save_calibrated_equipment_from_tab)
 
         add_btn.clicked.connect(_add_row)
         del_btn.clicked.connect(_delete_rows)
-        table.itemChanged.connect(lambda _it: self._save_calibrated_equipment_from_tab())
+        table.itemChanged.connect(_on_item_changed)
 
         return container
 
@@ -3072,6 +3570,105 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
+    def _populate_table(self, table: QTableWidget, rows, cols: int) -> None:
+        """Make `table` show exactly `rows`, writing through the model.
+
+        Existing rows and their items are reused: the row count is adjusted once and
+        cells are overwritten in place, so a save -> reload cycle does not destroy and
+        rebuild every QTableWidgetItem. Blank cells without an item get none.
+        Signals are blocked, so itemChanged does not fire for the seeded values, and
+        painting/sorting are suspended until every row is in.
+        """
+        model = table.model()
+        n = len(rows)
+        edit_role = Qt.ItemDataRole.EditRole
+        sorting = table.isSortingEnabled()
+        updates = table.updatesEnabled()
+        table.setUpdatesEnabled(False)
+        if sorting:
+            table.setSortingEnabled(False)
+        try:
+            with QSignalBlocker(table):
+                table.setRowCount(n)
+                item = table.item
+                for r, row in enumerate(rows):
+                    row = tuple(row[:cols])
+                    for c in range(cols):
+                        val = row[c] if c < len(row) else None
+                        if val is None or val == "":
+                            # A missing item already reads as ""; only clear one that exists.
+                            if item(r, c) is None:
+                                continue
+                            val = ""
+                        model.setData(model.index(r, c), val, edit_role)
+        finally:
+            if sorting:
+                table.setSortingEnabled(True)
+            table.setUpdatesEnabled(updates)
+
+    def _sync_table_rows(self, table: QTableWidget, rows, cols: int) -> None:
+        """Show saved `rows` in `table` without dropping its blank rows.
+
+        A debounced save can fire while a just-added blank row is being edited, so the
+        non-blank rows are matched up with `rows` in order and only cells whose text
+        changed are rewritten. Blank rows stay where they are. If the non-blank row
+        count no longer matches, the table is rebuilt with _populate_table().
+        """
+        model = table.model()
+        index = model.index
+        shown = []
+        for r in range(model.rowCount()):
+            row = tuple(str(index(r, c).data() or "").strip() for c in range(cols))
+            if any(row):
+                shown.append((r, row))
+        if len(shown) != len(rows):
+            self._populate_table(table, rows, cols)
+            return
+        edit_role = Qt.ItemDataRole.EditRole
+        with QSignalBlocker(table):
+            for (r, old), new in zip(shown, rows):
+                new = tuple(new[:cols])
+                for c in range(cols):
+                    val = new[c] if c < len(new) else ""
+                    val = "" if val is None else str(val)
+                    if old[c] != val:
+                        model.setData(index(r, c), val, edit_role)
+
+    def _table_rows(self, table: QTableWidget, cols: int) -> list[tuple]:
+        """Return the stripped text of the first `cols` columns of each non-blank row.
+
+        Reads through the model, so cells that never got an item are just "".
+        """
+        model = table.model()
+        index = model.index
+        rows = []
+        for r in range(model.rowCount()):
+            row = tuple(str(index(r, c).data() or "").strip() for c in range(cols))
+            if any(row):
+                rows.append(row)
+        return rows
+
+    def _remove_rows_batched(self, table: QTableWidget, rows) -> None:
+        """Remove `rows` from `table`, one model.removeRows() call per contiguous run."""
+        ordered = sorted(set(rows), reverse=True)
+        if not ordered:
+            return
+        model = table.model()
+        # Walk descending indices, collapsing e.g. [9, 8, 7, 3] into (7, 3) and (3, 1).
+        runs: list[tuple[int, int]] = []
+        start = end = ordered[0]
+        for r in ordered[1:]:
+            if r == start - 1:
+                start = r
+                continue
+            runs.append((start, end - start + 1))
+            start = end = r
+        runs.append((start, end - start + 1))
+
+        with QSignalBlocker(table):
+            for first, count in runs:
+                model.removeRows(first, count)
+
     def _install_delete_clears_cells(self, table: QTableWidget) -> None:
         """Ensure Delete clears contents for the provided table."""
         if table is None:
@@ -3096,71 +3693,221 @@ class MainWindow(QMainWindow):
             timer = QTimer(self)
             timer.setSingleShot(True)
             timer.setInterval(250)
-            timer.timeout.connect(lambda t=table, k=key: self._save_persistent_table_sizes(t, k))
+            timer.timeout.connect(functools.partial(self._save_persistent_table_sizes, table, key))
             self._table_persist_timers[key] = timer
         timer.start()
 
+    def _schedule_table_save(self, key: str, saver) -> None:
+        """Coalesce bursts of table edits into a single `saver()` call."""
+        key = str(key or "").strip()
+        if not key:
+            return
+        self._table_savers[key] = saver
+        timer = self._table_save_timers.get(key)
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(250)
+            timer.timeout.connect(functools.partial(self._run_table_save, key))
+            self._table_save_timers[key] = timer
+        timer.start()
+
+    def _run_table_save(self, key: str) -> None:
+        saver = self._table_savers.get(key)
+        if saver is None:
+            return
+        try:
+            saver()
+        except Exception:
+            logger.exception("Debounced table save %r failed", key)
+
+    def _flush_pending_table_saves(self) -> None:
+        """Run any debounced table saves immediately (e.g. before closing)."""
+        for key, timer in list(self._table_save_timers.items()):
+            try:
+                if not timer.isActive():
+                    continue
+                timer.stop()
+            except Exception:
+                continue
+            self._run_table_save(key)
+
+    def _queue_setting(self, key: str, value) -> None:
+        """Stage a QSettings write; bursts (e.g. spin box edits) are written once."""
+        self._pending_settings[key] = value
+        self._settings_flush_timer.start()
+
+    def _flush_pending_settings(self) -> None:
+        """Write staged QSettings values now (e.g. before closing or reading them back)."""
+        self._settings_flush_timer.stop()
+        pending, self._pending_settings = self._pending_settings, {}
+        for key, value in pending.items():
+            try:
+                self._settings.setValue(key, value)
+            except Exception:
+                logger.exception("Failed to write setting %r", key)
+
     def _save_persistent_table_sizes(self, table: QTableWidget, key: str) -> None:
+        """Store sizes as a packed blob (see _pack_table_sizes)."""
         if table is None:
             return
         try:
-            payload = {
-                "cols": [int(table.columnWidth(i)) for i in range(int(table.columnCount()))],
-                "rows": [int(table.rowHeight(i)) for i in range(int(table.rowCount()))],
-            }
-            self._settings.setValue(f"{key}/sizes", json.dumps(payload))
+            col_size = table.horizontalHeader().sectionSize
+            row_size = table.verticalHeader().sectionSize
+            cols = [col_size(i) for i in range(table.columnCount())]
+            rows = [row_size(i) for i in range(table.rowCount())]
+            blob = _pack_table_sizes(cols, rows)
+            if self._set_setting_if_changed(f"{key}/sizes_bin", blob):
+                # Drop the legacy JSON payload once the binary one exists.
+                if self._settings.contains(f"{key}/sizes"):
+                    self._settings.remove(f"{key}/sizes")
         except Exception:
             return
 
-    def _restore_persistent_table_sizes(self, table: QTableWidget, key: str) -> None:
-        if table is None:
-            return
+    def _load_persistent_table_sizes(self, key: str) -> tuple[list[int], list[int]] | None:
+        """Return (col_widths, row_heights) saved for `key`, or None.
+
+        Falls back to the legacy JSON `{key}/sizes` payload.
+        """
+        try:
+            raw = self._settings.value(f"{key}/sizes_bin")
+        except Exception:
+            raw = None
+        if raw:
+            try:
+                blob = bytes(raw)
+                sizes = _unpack_table_sizes(blob)
+            except Exception:
+                return None
+            if sizes is None:
+                return None
+            self._last_written_payload[f"{key}/sizes_bin"] = blob
+            return sizes
+
         try:
             raw = self._settings.value(f"{key}/sizes", "", type=str)
         except Exception:
             raw = ""
         if not raw:
-            return
+            return None
         try:
-            payload = json.loads(str(raw))
+            payload = _jloads(str(raw))
         except Exception:
-            return
+            return None
         if not isinstance(payload, dict):
-            return
-
+            return None
         cols = payload.get("cols")
         rows = payload.get("rows")
-        if isinstance(cols, list):
-            for i in range(min(len(cols), int(table.columnCount()))):
-                try:
-                    w = int(cols[i])
-                except Exception:
-                    continue
-                if w > 0:
-                    table.setColumnWidth(i, w)
-        if isinstance(rows, list):
-            for i in range(min(len(rows), int(table.rowCount()))):
-                try:
-                    h = int(rows[i])
-                except Exception:
-                    continue
-                if h > 0:
-                    table.setRowHeight(i, h)
+        return (cols if isinstance(cols, list) else []), (rows if isinstance(rows, list) else [])
 
-    def _refresh_all_viewer_validations(self) -> None:
-        for v in self._form_viewers.values():
-            if v is not None:
-                try:
-                    v.refresh_validations()
-                except Exception:
-                    pass
-        for win in list(self._popout_windows):
+    def _restore_persistent_table_sizes(self, table: QTableWidget, key: str) -> None:
+        if table is None:
+            return
+        sizes = self._load_persistent_table_sizes(key)
+        if sizes is None:
+            return
+
+        cols, rows = sizes
+        # Programmatic resizes shouldn't re-trigger the sectionResized -> persist path.
+        with QSignalBlocker(table.horizontalHeader()), QSignalBlocker(table.verticalHeader()):
+            if isinstance(cols, list):
+                for i in range(min(len(cols), int(table.columnCount()))):
+                    try:
+                        w = int(cols[i])
+                    except Exception:
+                        continue
+                    if w > 0:
+                        table.setColumnWidth(i, w)
+            if isinstance(rows, list):
+                for i in range(min(len(rows), int(table.rowCount()))):
+                    try:
+                        h = int(rows[i])
+                    except Exception:
+                        continue
+                    if h > 0:
+                        table.setRowHeight(i, h)
+        # The view listens to sectionResized for its own layout; refresh it once instead.
+        try:
+            table.updateGeometries()
+            table.viewport().update()
+        except Exception:
+            pass
+
+    def _popout_excel_viewers(self, win) -> list:
+        """Return the ExcelSheetViewer children of a pop-out window (cached until it is destroyed)."""
+        key = id(win)
+        viewers = self._popout_viewer_cache.get(key)
+        if viewers is None:
+            viewers = list(win.findChildren(ExcelSheetViewer))
+            self._popout_viewer_cache[key] = viewers
             try:
-                for v in win.findChildren(ExcelSheetViewer):
-                    v.refresh_validations()
+                win.destroyed.connect(lambda *_a, k=key: self._popout_viewer_cache.pop(k, None))
+            except Exception:
+                pass
+        return viewers
+
+    def _apply_supplier_directory_dropdowns(self) -> None:
+        """Re-apply the supplier directory dropdowns (Form 1 E15:E500, Form 2 F5:F500)."""
+        self._supplier_dropdowns_pending = False
+        if self._template_wb is None:
+            return
+        # wb.sheetnames rebuilds its list on every access; take it once.
+        sheetnames = set(self._template_wb.sheetnames)
+        for key, cell_range in (("1", "E15:E500"), ("2", "F5:F500")):
+            name = self._form_sheet_names.get(key)
+            if name and name in sheetnames:
+                self._ensure_supplier_directory_dropdown(self._template_wb[name], cell_range=cell_range)
+
+    def _flush_pending_workbook_writes(self) -> None:
+        """Apply debounced list saves and dropdown updates before the workbook is written out."""
+        self._flush_pending_table_saves()
+        self._flush_pending_settings()
+        if self._supplier_dropdowns_pending:
+            try:
+                self._apply_supplier_directory_dropdowns()
+            except Exception:
+                pass
+
+    def _refresh_all_viewer_validations(self) -> None:
+        if self._supplier_dropdowns_pending:
+            try:
+                self._apply_supplier_directory_dropdowns()
+            except Exception:
+                pass
+        for v in self._form_viewers.values():
+            if v is not None:
+                try:
+                    v.refresh_validations()
+                except Exception:
+                    pass
+        for win in list(self._popout_windows):
+            try:
+                for v in self._popout_excel_viewers(win):
+                    v.refresh_validations()
             except Exception:
                 continue
 
+    def _drop_viewer_row_indexes(self, ws) -> None:
+        """Drop the cached row indexes (e.g. Form 3 bubble rows) of every viewer showing `ws`."""
+        viewers = list(self._form_viewers.values())
+        for win in list(self._popout_windows):
+            try:
+                viewers.extend(self._popout_excel_viewers(win))
+            except Exception:
+                continue
+        for v in viewers:
+            if v is not None and getattr(v, "_ws", None) is ws:
+                v._drop_row_index_cache()
+
+    def _schedule_refresh_all_viewer_validations(self) -> None:
+        """Coalesce validation refreshes (150 ms) so bulk list writes repaint viewers once."""
+        if self._viewer_refresh_timer is None:
+            self._viewer_refresh_timer = QTimer(self)
+            self._viewer_refresh_timer.setSingleShot(True)
+            self._viewer_refresh_timer.setInterval(150)
+            self._viewer_refresh_timer.timeout.connect(self._refresh_all_viewer_validations)
+        self._viewer_refresh_timer.start()
+
     def _supplier_master_sheet(self, wb):
         """Hidden sheet used for both supplier-code and supplier-directory dropdowns.
 
@@ -3193,9 +3940,8 @@ class MainWindow(QMainWindow):
 
             if "__as9102_supplier_directory" in wb.sheetnames:
                 sd = wb["__as9102_supplier_directory"]
-                for rr in range(1, min((getattr(sd, "max_row", 0) or 0), 5000) + 1):
-                    comp = sd.cell(row=rr, column=1).value
-                    addr = sd.cell(row=rr, column=2).value
+                max_scan = min((getattr(sd, "max_row", 0) or 0), 5000)
+                for comp, addr in sd.iter_rows(min_row=1, max_row=max_scan, min_col=1, max_col=2, values_only=True):
                     comp_s = str(comp).strip() if comp is not None else ""
                     addr_s = str(addr).strip() if addr is not None else ""
                     if comp_s and addr_s:
@@ -3203,9 +3949,8 @@ class MainWindow(QMainWindow):
 
             if "__as9102_suppliers" in wb.sheetnames:
                 sc = wb["__as9102_suppliers"]
-                for rr in range(1, min((getattr(sc, "max_row", 0) or 0), 5000) + 1):
-                    code = sc.cell(row=rr, column=1).value
-                    comp = sc.cell(row=rr, column=2).value
+                max_scan = min((getattr(sc, "max_row", 0) or 0), 5000)
+                for code, comp in sc.iter_rows(min_row=1, max_row=max_scan, min_col=1, max_col=2, values_only=True):
                     comp_s = str(comp).strip() if comp is not None else ""
                     code_s = str(code).strip() if code is not None else ""
                     if comp_s and code_s:
@@ -3220,25 +3965,61 @@ class MainWindow(QMainWindow):
                     "Vallen": "497735",
                 }
 
-            companies = sorted(set(directory_rows.keys()) | set(code_rows.keys()), key=lambda s: s.lower())
-            for i, comp in enumerate(companies, start=1):
+            # Merge both sources keyed by lower-cased company (first spelling wins), then sort once.
+            merged: dict[str, tuple[str, str, str]] = {}
+            for comp, addr in directory_rows.items():
+                merged.setdefault(comp.lower(), (comp, addr, ""))
+            for comp, code in code_rows.items():
+                prev = merged.get(comp.lower())
+                merged[comp.lower()] = (prev[0], prev[1], code) if prev is not None else (comp, "", code)
+            _drop_cached_rows(ws)
+            for i, (_key, (comp, addr, code)) in enumerate(sorted(merged.items()), start=1):
                 ws.cell(row=i, column=1).value = comp
-                ws.cell(row=i, column=2).value = directory_rows.get(comp, "")
-                ws.cell(row=i, column=3).value = code_rows.get(comp, "")
+                ws.cell(row=i, column=2).value = addr
+                ws.cell(row=i, column=3).value = code
 
         return ws
 
-    def _load_persistent_customer_rows(self) -> list[tuple[str, str]]:
-        """Load persisted Customer rows as [(customer, code)]."""
+    def _cached_qsetting_json(self, key: str) -> object:
+        """Return the JSON value stored under `key` (None if unset/invalid).
+
+        Parsed values are cached in memory; `_set_qsetting_json` keeps the cache current.
+        """
+        if key in self._qsettings_cache:
+            return self._qsettings_cache[key]
         try:
-            raw = self._settings.value("lists/customer_rows", "", type=str)
+            raw = self._settings.value(key, "", type=str)
         except Exception:
             raw = ""
-        if not raw:
-            return []
-        try:
-            data = json.loads(raw)
-        except Exception:
+        data = None
+        if raw:
+            self._last_written_payload[key] = raw
+            try:
+                data = _jloads(raw)
+            except Exception:
+                data = None
+        self._qsettings_cache[key] = data
+        return data
+
+    def _set_qsetting_json(self, key: str, payload: object) -> None:
+        self._set_setting_if_changed(key, _jdumps(payload))
+        self._qsettings_cache[key] = payload
+
+    def _set_setting_if_changed(self, key: str, value: str | bytes) -> bool:
+        """Write `value` to QSettings unless it matches what was last written/read for `key`.
+
+        Bytes are stored as a QByteArray. Returns True if a write happened.
+        """
+        if self._last_written_payload.get(key) == value:
+            return False
+        self._settings.setValue(key, QByteArray(value) if isinstance(value, bytes) else value)
+        self._last_written_payload[key] = value
+        return True
+
+    def _load_persistent_customer_rows(self) -> list[tuple[str, str]]:
+        """Load persisted Customer rows as [(customer, code)]."""
+        data = self._cached_qsetting_json("lists/customer_rows")
+        if not data:
             return []
         rows: list[tuple[str, str]] = []
         if isinstance(data, list):
@@ -3251,16 +4032,12 @@ class MainWindow(QMainWindow):
                     continue
                 rows.append((customer, code))
         # De-dupe by customer name (case-insensitive), keep first occurrence.
-        out: list[tuple[str, str]] = []
-        seen: set[str] = set()
-        for customer, code in rows:
-            k = (customer or "").strip().lower()
-            if k and k in seen:
-                continue
-            if k:
-                seen.add(k)
-            out.append((customer, code))
-        return out
+        # Rows without a name are all kept (keyed by position, which can't collide with a name).
+        unique: dict[str | int, tuple[str, str]] = {}
+        for row in rows:
+            k = (row[0] or "").strip().lower()
+            unique.setdefault(k or len(unique), row)
+        return list(unique.values())
 
     def _save_persistent_customer_rows(self, rows: list[tuple[str, str]]) -> None:
         """Persist Customer rows as JSON in QSettings."""
@@ -3272,39 +4049,35 @@ class MainWindow(QMainWindow):
                 continue
             payload.append({"customer": customer, "code": code})
         try:
-            self._settings.setValue("lists/customer_rows", json.dumps(payload))
+            self._set_qsetting_json("lists/customer_rows", payload)
         except Exception:
             pass
 
     def _load_persistent_supplier_directory_rows(self) -> list[tuple[str, str, str, str, str, str]]:
         """Load persisted Supplier rows as [(company, addr1, addr2, city, state, zip)]."""
-        try:
-            raw = self._settings.value("lists/supplier_directory_rows", "", type=str)
-        except Exception:
-            raw = ""
-        if not raw:
-            return []
-        try:
-            data = json.loads(raw)
-        except Exception:
+        data = self._cached_qsetting_json("lists/supplier_directory_rows")
+        if not data:
             return []
+        def _s(it: dict, key: str) -> str:
+            v = it.get(key)
+            return "" if v is None else str(v).strip()
+
         rows: list[tuple[str, str, str, str, str, str]] = []
         if isinstance(data, list):
             for it in data:
                 if not isinstance(it, dict):
                     continue
-                company = str(it.get("company", "") or "").strip()
+                company = _s(it, "company")
                 # Backward-compat: old key "address" stored full address in one field.
-                full = str(it.get("address", "") or "").strip()
-                addr1 = str(it.get("addr1", "") or "").strip() or full
-                addr2 = str(it.get("addr2", "") or "").strip()
-                addr3 = str(it.get("addr3", "") or "").strip()
-                city = str(it.get("city", "") or "").strip()
-                state = str(it.get("state", "") or "").strip().upper()
-                zipc = str(it.get("zip", "") or "").strip()
-                if full and (not city and not state and not zipc and not addr2 and not addr3):
-                    a1, a2, a3, ct, st, z = _split_address_lines(full)
-                    addr1, addr2, addr3, city, state, zipc = a1, a2, a3, ct, st, z
+                full = _s(it, "address")
+                addr1 = _s(it, "addr1") or full
+                addr2 = _s(it, "addr2")
+                addr3 = _s(it, "addr3")
+                city = _s(it, "city")
+                state = _s(it, "state").upper()
+                zipc = _s(it, "zip")
+                if full and not (addr2 or addr3 or city or state or zipc):
+                    addr1, addr2, addr3, city, state, zipc = _split_address_lines(full)
 
                 # Fold legacy Address3 into Address2 to match screenshot.
                 if addr3:
@@ -3314,19 +4087,22 @@ class MainWindow(QMainWindow):
                     continue
                 rows.append((company, addr1, addr2, city, state, zipc))
         # De-dupe by company name (case-insensitive), keep first occurrence.
-        out: list[tuple[str, str, str, str, str, str]] = []
-        seen: set[str] = set()
-        for company, addr1, addr2, city, state, zipc in rows:
-            k = (company or "").strip().lower()
-            if k and k in seen:
-                continue
-            if k:
-                seen.add(k)
-            out.append((company, addr1, addr2, city, state, zipc))
-        return out
+        # Rows without a name are all kept (keyed by position, which can't collide with a name).
+        unique: dict[str | int, tuple[str, str, str, str, str, str]] = {}
+        for row in rows:
+            k = (row[0] or "").strip().lower()
+            unique.setdefault(k or len(unique), row)
+        return list(unique.values())
 
     def _save_persistent_supplier_directory_rows(self, rows: list[tuple[str, str, str, str, str, str]]) -> None:
-        """Persist Supplier rows as JSON in QSettings."""
+        """Persist Supplier rows as JSON in QSettings.
+
+        Skipped entirely when `rows` match the last persisted rows, so debounced
+        re-saves of an unchanged directory don't rebuild and re-serialize the payload.
+        """
+        snapshot = tuple(tuple(r) for r in rows)
+        if self._persisted_supplier_directory_snapshot == snapshot:
+            return
         payload = []
         for company, addr1, addr2, city, state, zipc in rows:
             company = str(company or "").strip()
@@ -3348,21 +4124,15 @@ class MainWindow(QMainWindow):
                 }
             )
         try:
-            self._settings.setValue("lists/supplier_directory_rows", json.dumps(payload))
+            self._set_qsetting_json("lists/supplier_directory_rows", payload)
+            self._persisted_supplier_directory_snapshot = snapshot
         except Exception:
             pass
 
     def _load_persistent_calibrated_equipment_rows(self) -> list[tuple[str, str, str, str]]:
         """Load persisted calibrated equipment rows as [(name, id, type, due_date)]."""
-        try:
-            raw = self._settings.value("lists/calibrated_equipment_rows", "", type=str)
-        except Exception:
-            raw = ""
-        if not raw:
-            return []
-        try:
-            data = json.loads(raw)
-        except Exception:
+        data = self._cached_qsetting_json("lists/calibrated_equipment_rows")
+        if not data:
             return []
         rows: list[tuple[str, str, str, str]] = []
         if isinstance(data, list):
@@ -3378,16 +4148,12 @@ class MainWindow(QMainWindow):
                 rows.append((name, mid, mtype, due))
 
         # De-dupe by ID if present, else by name (case-insensitive). Keep first occurrence.
-        out: list[tuple[str, str, str, str]] = []
-        seen: set[str] = set()
-        for name, mid, mtype, due in rows:
-            k = (mid or name or "").strip().lower()
-            if k and k in seen:
-                continue
-            if k:
-                seen.add(k)
-            out.append((name, mid, mtype, due))
-        return out
+        # Rows with neither are all kept (keyed by position, which can't collide with a name/ID).
+        unique: dict[str | int, tuple[str, str, str, str]] = {}
+        for row in rows:
+            k = (row[1] or row[0] or "").strip().lower()
+            unique.setdefault(k or len(unique), row)
+        return list(unique.values())
 
     def _save_persistent_calibrated_equipment_rows(self, rows: list[tuple[str, str, str, str]]) -> None:
         """Persist calibrated equipment rows as JSON in QSettings."""
@@ -3408,7 +4174,7 @@ class MainWindow(QMainWindow):
                 }
             )
         try:
-            self._settings.setValue("lists/calibrated_equipment_rows", json.dumps(payload))
+            self._set_qsetting_json("lists/calibrated_equipment_rows", payload)
         except Exception:
             pass
 
@@ -3422,27 +4188,19 @@ class MainWindow(QMainWindow):
         if persisted_customers:
             ws = self._supplier_master_sheet(self._template_wb)
             # Build an address map from existing master rows.
-            addr_by_key: dict[str, str] = {}
-            max_scan = min(max(getattr(ws, "max_row", 0) or 0, 0), 5000)
-            for rr in range(1, max_scan + 1):
-                comp = ws.cell(row=rr, column=1).value
-                addr = ws.cell(row=rr, column=2).value
-                comp_s = str(comp).strip() if comp is not None else ""
-                addr_s = str(addr).strip() if addr is not None else ""
-                if comp_s:
-                    addr_by_key[comp_s.lower()] = addr_s
+            max_scan = min(getattr(ws, "max_row", 0) or 0, 5000)
+            addr_by_key: dict[str, str] = {
+                str(comp).strip().lower(): (str(addr).strip() if addr is not None else "")
+                for comp, addr in ws.iter_rows(min_row=1, max_row=max_scan, min_col=1, max_col=2, values_only=True)
+                if comp is not None and str(comp).strip()
+            }
 
             # Clear then write.
             rows = sorted(persisted_customers, key=lambda x: (x[0] or "").lower())
-            clear_to = max(len(rows) + 20, 50)
-            for rr in range(1, clear_to + 1):
-                ws.cell(row=rr, column=1).value = None
-                ws.cell(row=rr, column=2).value = None
-                ws.cell(row=rr, column=3).value = None
-            for i, (customer, code) in enumerate(rows, start=1):
-                ws.cell(row=i, column=1).value = customer
-                ws.cell(row=i, column=2).value = addr_by_key.get(customer.lower(), "")
-                ws.cell(row=i, column=3).value = code
+            _replace_hidden_sheet_rows(
+                ws,
+                ((customer, addr_by_key.get(customer.lower(), ""), code) for customer, code in rows),
+            )
 
             self._apply_supplier_master_validations()
 
@@ -3451,46 +4209,27 @@ class MainWindow(QMainWindow):
         if persisted_suppliers:
             sheet_name, _last = self._ensure_supplier_directory_sheet(self._template_wb)
             ws = self._template_wb[sheet_name]
-            rows = list(persisted_suppliers)
-            clear_to = max(len(rows) + 20, 50)
-            for rr in range(1, clear_to + 1):
-                for cc in range(1, 9):
-                    ws.cell(row=rr, column=cc).value = None
-            for i, (company, addr1, addr2, city, state, zipc) in enumerate(rows, start=1):
+            out_rows = []
+            for company, addr1, addr2, city, state, zipc in persisted_suppliers:
                 addr1 = _clean_company_prefix(company, addr1)
-                ws.cell(row=i, column=1).value = company
-                ws.cell(row=i, column=2).value = addr1
-                ws.cell(row=i, column=3).value = addr2
-                ws.cell(row=i, column=4).value = city
-                ws.cell(row=i, column=5).value = state
-                ws.cell(row=i, column=6).value = zipc
-                ws.cell(row=i, column=7).value = _build_full_address_with_company(company, addr1, addr2, city, state, zipc)
+                out_rows.append(
+                    (company, addr1, addr2, city, state, zipc,
+                     _build_full_address_with_company(company, addr1, addr2, city, state, zipc))
+                )
+            # Columns A-H belong to the directory (H holds the seed marker); I is legacy.
+            _replace_hidden_sheet_rows(ws, out_rows, width=8)
             # Mark as migrated/seeded so we don't re-import defaults on every load.
             ws.cell(row=1, column=8).value = "seeded_v4_reset"
 
             # Re-apply dropdowns.
-            form1 = self._form_sheet_names.get("1")
-            form2 = self._form_sheet_names.get("2")
-            if form1 and form1 in self._template_wb.sheetnames:
-                self._ensure_supplier_directory_dropdown(self._template_wb[form1], cell_range="E15:E500")
-            if form2 and form2 in self._template_wb.sheetnames:
-                self._ensure_supplier_directory_dropdown(self._template_wb[form2], cell_range="F5:F500")
+            self._apply_supplier_directory_dropdowns()
 
         # Calibrated equipment list -> calibrated equipment sheet
         persisted_equipment = self._load_persistent_calibrated_equipment_rows()
         if persisted_equipment:
             ws = self._calibrated_equipment_sheet(self._template_wb)
             if ws is not None:
-                rows = list(persisted_equipment)
-                clear_to = max(len(rows) + 20, 50)
-                for rr in range(1, clear_to + 1):
-                    for cc in range(1, 6):
-                        ws.cell(row=rr, column=cc).value = None
-                for i, (name, mid, mtype, due) in enumerate(rows, start=1):
-                    ws.cell(row=i, column=1).value = name
-                    ws.cell(row=i, column=2).value = mid
-                    ws.cell(row=i, column=3).value = mtype
-                    ws.cell(row=i, column=4).value = due
+                _replace_hidden_sheet_rows(ws, persisted_equipment)
                 ws.cell(row=1, column=5).value = "seeded_v1"
 
     def _calibrated_equipment_sheet(self, wb):
@@ -3515,16 +4254,20 @@ class MainWindow(QMainWindow):
         is_empty = all(v is None or str(v).strip() == "" for v in (a1, b1, c1, d1))
         if created or is_empty:
             persisted = self._load_persistent_calibrated_equipment_rows()
-            rows = persisted or list(DEFAULT_CALIBRATED_EQUIPMENT_SEED)
-            for rr in range(1, max(len(rows) + 20, 50) + 1):
+            # Read-only here, so the seed constant is used as-is rather than copied.
+            rows = persisted or DEFAULT_CALIBRATED_EQUIPMENT_SEED
+            n_rows = len(rows)
+            cell = ws.cell
+            _drop_cached_rows(ws)
+            for rr in range(1, max(n_rows + 20, 50) + 1):
                 for cc in range(1, 6):
-                    ws.cell(row=rr, column=cc).value = None
+                    cell(row=rr, column=cc).value = None
             for i, (mn, mid, mt, due) in enumerate(rows, start=1):
-                ws.cell(row=i, column=1).value = mn
-                ws.cell(row=i, column=2).value = mid
-                ws.cell(row=i, column=3).value = mt
-                ws.cell(row=i, column=4).value = due
-            ws.cell(row=1, column=5).value = "seeded_v1"
+                cell(row=i, column=1).value = mn
+                cell(row=i, column=2).value = mid
+                cell(row=i, column=3).value = mt
+                cell(row=i, column=4).value = due
+            cell(row=1, column=5).value = "seeded_v1"
             # Persist seed so it survives even if the workbook changes.
             try:
                 if not persisted:
@@ -3552,10 +4295,8 @@ class MainWindow(QMainWindow):
             return []
         ws = self._supplier_master_sheet(self._template_wb)
         rows: list[tuple[str, str, str]] = []
-        for rr in range(1, min((getattr(ws, "max_row", 0) or 0), 5000) + 1):
-            comp = ws.cell(row=rr, column=1).value
-            addr = ws.cell(row=rr, column=2).value
-            code = ws.cell(row=rr, column=3).value
+        max_scan = min((getattr(ws, "max_row", 0) or 0), 5000)
+        for comp, addr, code in ws.iter_rows(min_row=1, max_row=max_scan, min_col=1, max_col=3, values_only=True):
             comp_s = str(comp).strip() if comp is not None else ""
             addr_s = str(addr).strip() if addr is not None else ""
             code_s = str(code).strip() if code is not None else ""
@@ -3564,25 +4305,35 @@ class MainWindow(QMainWindow):
             rows.append((comp_s, addr_s, code_s))
         return rows
 
+    def _supplier_addr_by_customer(self) -> dict[str, str]:
+        """Map lower-cased customer -> address from the supplier master sheet.
+
+        Cached on the sheet and dropped whenever the sheet is rewritten.
+        """
+        if self._template_wb is None:
+            return {}
+        ws = self._supplier_master_sheet(self._template_wb)
+        cached = getattr(ws, "_as9102_addr_by_customer", None)
+        if cached is not None:
+            return cached
+        addr_by_customer: dict[str, str] = {}
+        for comp, addr, _code in self._supplier_master_rows():
+            if comp:
+                addr_by_customer[comp.strip().lower()] = addr
+        try:
+            ws._as9102_addr_by_customer = addr_by_customer
+        except Exception:
+            pass
+        return addr_by_customer
+
     def _write_supplier_master_rows(self, rows: list[tuple[str, str, str]]) -> None:
         if self._template_wb is None:
             return
         ws = self._supplier_master_sheet(self._template_wb)
-
-        # Clear a bit beyond current size.
-        clear_to = max(len(rows) + 20, 50)
-        for rr in range(1, clear_to + 1):
-            ws.cell(row=rr, column=1).value = None
-            ws.cell(row=rr, column=2).value = None
-            ws.cell(row=rr, column=3).value = None
-
-        for i, (comp, addr, code) in enumerate(rows, start=1):
-            ws.cell(row=i, column=1).value = comp
-            ws.cell(row=i, column=2).value = addr
-            ws.cell(row=i, column=3).value = code
+        _replace_hidden_sheet_rows(ws, ((comp, addr, code) for comp, addr, code in rows))
 
         self._apply_supplier_master_validations()
-        self._refresh_all_viewer_validations()
+        self._schedule_refresh_all_viewer_validations()
 
         # Persist customer list automatically (customer + code).
         try:
@@ -3597,16 +4348,11 @@ class MainWindow(QMainWindow):
             ws.data_validations = openpyxl.worksheet.datavalidation.DataValidationList()
             dvs = ws.data_validations
 
-        # Update an existing list DV that targets this sqref, else create.
-        for dv in list(getattr(dvs, "dataValidation", []) or []):
-            if getattr(dv, "type", None) != "list":
-                continue
-            try:
-                if sqref.split(":", 1)[0] in str(getattr(dv, "sqref", "")):
-                    dv.formula1 = formula1
-                    return
-            except Exception:
-                continue
+        # Reuse a list DV only if it covers all of sqref; otherwise add a new one.
+        dv = _list_validation_covering(ws, sqref)
+        if dv is not None:
+            dv.formula1 = formula1
+            return
 
         dv = DataValidation(type="list", formula1=formula1, allow_blank=True)
         ws.add_data_validation(dv)
@@ -3617,9 +4363,11 @@ class MainWindow(QMainWindow):
             return
         master = self._supplier_master_sheet(self._template_wb)
         last_code = 1
-        max_scan = min(max(getattr(master, "max_row", 0) or 0, 50), 5000)
-        for rr in range(1, max_scan + 1):
-            c = master.cell(row=rr, column=3).value
+        # Rows past max_row are empty, so there's no need to scan (and materialize) them.
+        max_scan = min(getattr(master, "max_row", 0) or 0, 5000)
+        for rr, (c,) in enumerate(
+            master.iter_rows(min_row=1, max_row=max_scan, min_col=3, max_col=3, values_only=True), start=1
+        ):
             if c is not None and str(c).strip() != "":
                 last_code = rr
         code_rng = f"=__as9102_supplier_master!$C$1:$C${last_code}"
@@ -3633,21 +4381,16 @@ class MainWindow(QMainWindow):
     def _load_suppliers_tab_from_workbook(self) -> None:
         if self._suppliers_table is None:
             return
-        self._suppliers_suppress_changes = True
-        try:
-            self._suppliers_table.setRowCount(0)
+        # itemChanged stays blocked while the tab is rebuilt, so no save gets queued for it.
+        with QSignalBlocker(self._suppliers_table):
             if self._template_wb is None:
+                self._suppliers_table.setRowCount(0)
                 self._suppliers_table.setEnabled(False)
                 return
             self._suppliers_table.setEnabled(True)
 
             rows = self._supplier_master_rows()
-            self._suppliers_table.setRowCount(len(rows))
-            for r, (comp, addr, code) in enumerate(rows):
-                self._suppliers_table.setItem(r, 0, QTableWidgetItem(comp))
-                self._suppliers_table.setItem(r, 1, QTableWidgetItem(code))
-        finally:
-            self._suppliers_suppress_changes = False
+            self._populate_table(self._suppliers_table, [(comp, code) for comp, _addr, code in rows], 2)
 
     def _supplier_directory_rows(self) -> list[tuple[str, str, str, str, str, str]]:
         if self._template_wb is None:
@@ -3656,80 +4399,47 @@ class MainWindow(QMainWindow):
         if ws is None:
             return []
 
-        # Detect legacy schema (old marker was stored in column I).
-        legacy_schema = False
-        try:
-            for rr in range(1, min((getattr(ws, "max_row", 0) or 0), 10) + 1):
-                v = ws.cell(row=rr, column=9).value
-                if v is not None and str(v).strip() != "":
-                    legacy_schema = True
-                    break
-        except Exception:
-            legacy_schema = False
-
-        rows: list[tuple[str, str, str, str, str, str]] = []
-        for rr in range(1, min((getattr(ws, "max_row", 0) or 0), 5000) + 1):
-            comp = ws.cell(row=rr, column=1).value
-            addr1 = ws.cell(row=rr, column=2).value
-            addr2 = ws.cell(row=rr, column=3).value
-
-            if legacy_schema:
-                addr3 = ws.cell(row=rr, column=4).value
-                city = ws.cell(row=rr, column=5).value
-                state = ws.cell(row=rr, column=6).value
-                zipc = ws.cell(row=rr, column=7).value
-            else:
-                addr3 = None
-                city = ws.cell(row=rr, column=4).value
-                state = ws.cell(row=rr, column=5).value
-                zipc = ws.cell(row=rr, column=6).value
-
-            comp_s = str(comp).strip() if comp is not None else ""
-            a1_s = str(addr1).strip() if addr1 is not None else ""
-            a2_s = str(addr2).strip() if addr2 is not None else ""
-            a3_s = str(addr3).strip() if addr3 is not None else ""
-            city_s = str(city).strip() if city is not None else ""
-            state_s = str(state).strip().upper() if state is not None else ""
-            zip_s = str(zipc).strip() if zipc is not None else ""
-
-            # Backward compat: if only column B is populated and others are empty,
-            # treat it as a single-line address and split it.
-            if a1_s and not (a2_s or a3_s or city_s or state_s or zip_s):
-                a1_clean = _clean_company_prefix(comp_s, a1_s)
-                a1, a2, a3, ct, st, z = _split_address_lines(a1_clean)
-                # Fold legacy address line 3 into Address 2 for screenshot schema.
-                if a3:
-                    a2 = f"{a2}, {a3}" if a2 else a3
-                a1_s, a2_s, a3_s, city_s, state_s, zip_s = a1, a2, "", ct, st, z
+        max_row = min((getattr(ws, "max_row", 0) or 0), 5000)
+        if max_row < 1:
+            return []
+        # One values-only pass; per-cell ws.cell() lookups dominate on large directories.
+        data = list(ws.iter_rows(min_row=1, max_row=max_row, max_col=9, values_only=True))
 
-            # Fold legacy Address 3 into Address 2.
-            if a3_s:
-                a2_s = f"{a2_s}, {a3_s}" if a2_s else a3_s
-                a3_s = ""
+        # Detect legacy schema (old marker was stored in column I). Only a full rewrite
+        # of the sheet can change the answer, so it is cached on the sheet until then.
+        legacy_schema = getattr(ws, "_as9102_legacy_schema", None)
+        if legacy_schema is None:
+            try:
+                legacy_schema = any(_sv(row[8]) for row in data[:10] if len(row) > 8)
+            except Exception:
+                legacy_schema = False
+            try:
+                ws._as9102_legacy_schema = legacy_schema
+            except Exception:
+                pass
 
-            if not (comp_s or a1_s or a2_s or city_s or state_s or zip_s):
-                continue
-            rows.append((comp_s, a1_s, a2_s, city_s, state_s, zip_s))
+        rows: list[tuple[str, str, str, str, str, str]] = []
+        for row in data:
+            norm = _normalize_supplier_row(row, legacy_schema)
+            if norm is not None:
+                rows.append(norm)
         return rows
 
-    def _write_supplier_directory_rows(self, rows: list[tuple[str, str, str, str, str, str]]) -> None:
+    def _write_supplier_directory_rows(
+        self, rows: list[tuple[str, str, str, str, str, str]]
+    ) -> list[tuple[str, str, str, str, str, str]]:
+        """Write `rows` to the hidden directory sheet; return them as normalized for the tab."""
         if self._template_wb is None:
-            return
+            return []
         ws = self._supplier_directory_sheet(self._template_wb)
         if ws is None:
-            return
-
-        clear_to = max(len(rows) + 20, 50)
-        for rr in range(1, clear_to + 1):
-            for cc in range(1, 9):
-                ws.cell(row=rr, column=cc).value = None
+            return []
 
-        for i, (comp, addr1, addr2, city, state, zipc) in enumerate(rows, start=1):
+        out_rows = []
+        for comp, addr1, addr2, city, state, zipc in rows:
             addr1 = _clean_company_prefix(comp, addr1)
-            state = str(state or "").strip().upper()
-            if state and state not in US_STATE_CODES:
-                # Keep user value, but normalized.
-                state = state
+            # Non-US codes are kept as typed (just normalized), so no membership check is needed.
+            state = str(state).strip().upper() if state else ""
 
             # If user pasted a multi-line address into Address 1, split it.
             if addr1 and not (addr2 or city or state or zipc):
@@ -3738,26 +4448,18 @@ class MainWindow(QMainWindow):
                     a2 = f"{a2}, {a3}" if a2 else a3
                 addr1, addr2, city, state, zipc = a1, a2, ct, st, z
 
-            ws.cell(row=i, column=1).value = comp
-            ws.cell(row=i, column=2).value = addr1
-            ws.cell(row=i, column=3).value = addr2
-            ws.cell(row=i, column=4).value = city
-            ws.cell(row=i, column=5).value = state
-            ws.cell(row=i, column=6).value = zipc
-            ws.cell(row=i, column=7).value = _build_full_address_with_company(comp, addr1, addr2, city, state, zipc)
+            out_rows.append(
+                (comp, addr1, addr2, city, state, zipc,
+                 _build_full_address_with_company(comp, addr1, addr2, city, state, zipc))
+            )
+        _replace_hidden_sheet_rows(ws, out_rows, width=8)
 
         # Keep the one-time reset marker so we don't wipe user edits on next load.
         ws.cell(row=1, column=8).value = "seeded_v4_reset"
 
-        # Re-apply dropdowns (Form 1 E15:E500, Form 2 F5:F500)
-        form1 = self._form_sheet_names.get("1")
-        form2 = self._form_sheet_names.get("2")
-        if form1 and form1 in self._template_wb.sheetnames:
-            self._ensure_supplier_directory_dropdown(self._template_wb[form1], cell_range="E15:E500")
-        if form2 and form2 in self._template_wb.sheetnames:
-            self._ensure_supplier_directory_dropdown(self._template_wb[form2], cell_range="F5:F500")
-
-        self._refresh_all_viewer_validations()
+        # Dropdowns are re-applied once per burst of saves, right before the viewers refresh.
+        self._supplier_dropdowns_pending = True
+        self._schedule_refresh_all_viewer_validations()
 
         # Persist supplier directory automatically.
         try:
@@ -3765,49 +4467,34 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
+        return [r[:6] for r in out_rows]
+
     def _load_supplier_directory_tab_from_workbook(self) -> None:
         if self._supplier_directory_table is None:
             return
-        self._supplier_directory_suppress_changes = True
-        try:
-            self._supplier_directory_table.setRowCount(0)
+        # itemChanged stays blocked while the tab is rebuilt, so no save gets queued for it.
+        with QSignalBlocker(self._supplier_directory_table):
             if self._template_wb is None:
+                self._supplier_directory_table.setRowCount(0)
                 self._supplier_directory_table.setEnabled(False)
                 return
             self._supplier_directory_table.setEnabled(True)
 
             rows = self._supplier_directory_rows()
-            self._supplier_directory_table.setRowCount(len(rows))
-            for r, (comp, addr1, addr2, city, state, zipc) in enumerate(rows):
-                self._supplier_directory_table.setItem(r, 0, QTableWidgetItem(comp))
-                self._supplier_directory_table.setItem(r, 1, QTableWidgetItem(addr1))
-                self._supplier_directory_table.setItem(r, 2, QTableWidgetItem(addr2))
-                self._supplier_directory_table.setItem(r, 3, QTableWidgetItem(city))
-                self._supplier_directory_table.setItem(r, 4, QTableWidgetItem(state))
-                self._supplier_directory_table.setItem(r, 5, QTableWidgetItem(zipc))
-        finally:
-            self._supplier_directory_suppress_changes = False
+            self._populate_table(self._supplier_directory_table, rows, 6)
 
     def _save_supplier_directory_from_tab(self) -> None:
-        if self._supplier_directory_suppress_changes:
-            return
         if self._template_wb is None or self._supplier_directory_table is None:
             return
 
-        rows: list[tuple[str, str, str, str, str, str]] = []
-        for r in range(self._supplier_directory_table.rowCount()):
-            comp = self._supplier_directory_table.item(r, 0).text().strip() if self._supplier_directory_table.item(r, 0) else ""
-            addr1 = self._supplier_directory_table.item(r, 1).text().strip() if self._supplier_directory_table.item(r, 1) else ""
-            addr2 = self._supplier_directory_table.item(r, 2).text().strip() if self._supplier_directory_table.item(r, 2) else ""
-            city = self._supplier_directory_table.item(r, 3).text().strip() if self._supplier_directory_table.item(r, 3) else ""
-            state = self._supplier_directory_table.item(r, 4).text().strip().upper() if self._supplier_directory_table.item(r, 4) else ""
-            zipc = self._supplier_directory_table.item(r, 5).text().strip() if self._supplier_directory_table.item(r, 5) else ""
-            if not (comp or addr1 or addr2 or city or state or zipc):
-                continue
-            rows.append((comp, addr1, addr2, city, state, zipc))
+        rows: list[tuple[str, str, str, str, str, str]] = [
+            (comp, addr1, addr2, city, state.upper(), zipc)
+            for comp, addr1, addr2, city, state, zipc in self._table_rows(self._supplier_directory_table, 6)
+        ]
 
-        self._write_supplier_directory_rows(rows)
-        self._load_supplier_directory_tab_from_workbook()
+        # Show what was written without re-parsing the sheet we just filled.
+        written = self._write_supplier_directory_rows(rows)
+        self._sync_table_rows(self._supplier_directory_table, written, 6)
 
     def _calibrated_equipment_rows(self) -> list[tuple[str, str, str, str]]:
         if self._template_wb is None:
@@ -3816,19 +4503,27 @@ class MainWindow(QMainWindow):
         if ws is None:
             return []
 
+        # Parsed rows are cached on the sheet itself, so a template reload drops them too.
+        cached = getattr(ws, "_as9102_rows_cache", None)
+        if cached is not None:
+            return list(cached)
+
+        max_row = min((getattr(ws, "max_row", 0) or 0), 5000)
+        if max_row < 1:
+            return []
+
         rows: list[tuple[str, str, str, str]] = []
-        for rr in range(1, min((getattr(ws, "max_row", 0) or 0), 5000) + 1):
-            name = ws.cell(row=rr, column=1).value
-            mid = ws.cell(row=rr, column=2).value
-            mtype = ws.cell(row=rr, column=3).value
-            due = ws.cell(row=rr, column=4).value
-            name_s = str(name).strip() if name is not None else ""
-            mid_s = str(mid).strip() if mid is not None else ""
-            mtype_s = str(mtype).strip() if mtype is not None else ""
-            due_s = str(due).strip() if due is not None else ""
+        for row in ws.iter_rows(min_row=1, max_row=max_row, max_col=4, values_only=True):
+            if len(row) < 4:
+                row = tuple(row) + (None,) * (4 - len(row))
+            name_s, mid_s, mtype_s, due_s = _sv(row[0]), _sv(row[1]), _sv(row[2]), _sv(row[3])
             if not (name_s or mid_s or mtype_s or due_s):
                 continue
             rows.append((name_s, mid_s, mtype_s, due_s))
+        try:
+            ws._as9102_rows_cache = tuple(rows)
+        except Exception:
+            pass
         return rows
 
     def _write_calibrated_equipment_rows(self, rows: list[tuple[str, str, str, str]]) -> None:
@@ -3838,16 +4533,13 @@ class MainWindow(QMainWindow):
         if ws is None:
             return
 
-        clear_to = max(len(rows) + 20, 50)
-        for rr in range(1, clear_to + 1):
-            for cc in range(1, 6):
-                ws.cell(row=rr, column=cc).value = None
-
-        for i, (name, mid, mtype, due) in enumerate(rows, start=1):
-            ws.cell(row=i, column=1).value = str(name or "").strip()
-            ws.cell(row=i, column=2).value = str(mid or "").strip()
-            ws.cell(row=i, column=3).value = str(mtype or "").strip()
-            ws.cell(row=i, column=4).value = str(due or "").strip()
+        _replace_hidden_sheet_rows(
+            ws,
+            (
+                (str(name or "").strip(), str(mid or "").strip(), str(mtype or "").strip(), str(due or "").strip())
+                for name, mid, mtype, due in rows
+            ),
+        )
 
         ws.cell(row=1, column=5).value = "seeded_v1"
 
@@ -3859,42 +4551,26 @@ class MainWindow(QMainWindow):
     def _load_calibrated_equipment_tab_from_workbook(self) -> None:
         if self._calibrated_equipment_table is None:
             return
-        self._calibrated_equipment_suppress_changes = True
-        try:
-            self._calibrated_equipment_table.setRowCount(0)
+        # itemChanged stays blocked while the tab is rebuilt, so no save gets queued for it.
+        with QSignalBlocker(self._calibrated_equipment_table):
             if self._template_wb is None:
+                self._calibrated_equipment_table.setRowCount(0)
                 self._calibrated_equipment_table.setEnabled(False)
                 return
             self._calibrated_equipment_table.setEnabled(True)
 
             rows = self._calibrated_equipment_rows()
-            self._calibrated_equipment_table.setRowCount(len(rows))
-            for r, (name, mid, mtype, due) in enumerate(rows):
-                self._calibrated_equipment_table.setItem(r, 0, QTableWidgetItem(name))
-                self._calibrated_equipment_table.setItem(r, 1, QTableWidgetItem(mid))
-                self._calibrated_equipment_table.setItem(r, 2, QTableWidgetItem(mtype))
-                self._calibrated_equipment_table.setItem(r, 3, QTableWidgetItem(due))
-        finally:
-            self._calibrated_equipment_suppress_changes = False
+            self._populate_table(self._calibrated_equipment_table, rows, 4)
 
     def _save_calibrated_equipment_from_tab(self) -> None:
-        if self._calibrated_equipment_suppress_changes:
-            return
         if self._template_wb is None or self._calibrated_equipment_table is None:
             return
 
-        rows: list[tuple[str, str, str, str]] = []
-        for r in range(self._calibrated_equipment_table.rowCount()):
-            name = self._calibrated_equipment_table.item(r, 0).text().strip() if self._calibrated_equipment_table.item(r, 0) else ""
-            mid = self._calibrated_equipment_table.item(r, 1).text().strip() if self._calibrated_equipment_table.item(r, 1) else ""
-            mtype = self._calibrated_equipment_table.item(r, 2).text().strip() if self._calibrated_equipment_table.item(r, 2) else ""
-            due = self._calibrated_equipment_table.item(r, 3).text().strip() if self._calibrated_equipment_table.item(r, 3) else ""
-            if not (name or mid or mtype or due):
-                continue
-            rows.append((name, mid, mtype, due))
+        rows: list[tuple[str, str, str, str]] = self._table_rows(self._calibrated_equipment_table, 4)
 
+        # Rows are already stripped and blank-filtered, exactly as the sheet now holds them.
         self._write_calibrated_equipment_rows(rows)
-        self._load_calibrated_equipment_tab_from_workbook()
+        self._sync_table_rows(self._calibrated_equipment_table, rows, 4)
 
         # Keep Inputs dropdown in sync with table changes.
         try:
@@ -3903,17 +4579,12 @@ class MainWindow(QMainWindow):
             pass
 
     def _save_suppliers_from_tab(self) -> None:
-        if self._suppliers_suppress_changes:
-            return
         if self._template_wb is None or self._suppliers_table is None:
             return
 
         # Preserve any existing address values in the master sheet.
-        existing_addr_by_customer: dict[str, str] = {}
         try:
-            for comp, addr, _code in self._supplier_master_rows():
-                if comp:
-                    existing_addr_by_customer[comp.strip().lower()] = addr
+            existing_addr_by_customer = self._supplier_addr_by_customer()
         except Exception:
             existing_addr_by_customer = {}
 
@@ -4014,7 +4685,7 @@ class MainWindow(QMainWindow):
             try:
                 undo_btn = QPushButton("Undo Delete")
                 undo_btn.setToolTip("Undo last Form 3 row delete")
-                undo_btn.clicked.connect(lambda: self._on_form3_undo_requested())
+                undo_btn.clicked.connect(self._on_form3_undo_requested)
                 header_layout.addWidget(undo_btn)
             except Exception:
                 pass
@@ -4037,6 +4708,7 @@ class MainWindow(QMainWindow):
                 except Exception:
                     self._form3_follow_find_enabled = bool(saved_follow)
 
+                @Slot(bool)
                 def _persist_follow(on: bool) -> None:
                     try:
                         self._form3_follow_find_enabled = bool(on)
@@ -4050,13 +4722,12 @@ class MainWindow(QMainWindow):
                     try:
                         cb2 = getattr(self, "_form3_follow_find_cb_pop", None)
                         if cb2 is not None and bool(cb2.isChecked()) != bool(on):
-                            cb2.blockSignals(True)
-                            cb2.setChecked(bool(on))
-                            cb2.blockSignals(False)
+                            with QSignalBlocker(cb2):
+                                cb2.setChecked(bool(on))
                     except Exception:
                         pass
 
-                self._form3_follow_find_cb.toggled.connect(lambda on: _persist_follow(bool(on)))
+                self._form3_follow_find_cb.toggled.connect(_persist_follow)
                 header_layout.addWidget(self._form3_follow_find_cb)
             except Exception:
                 pass
@@ -4096,6 +4767,7 @@ class MainWindow(QMainWindow):
         color_group = None
         red_btn = orange_btn = none_btn = None
         _clear_color_selection = None
+        _clear_color_idle = None
         _persist_swatch_colors = None
 
         if form_key in ("1", "2", "2c", "3"):
@@ -4117,6 +4789,7 @@ class MainWindow(QMainWindow):
             color_group.addButton(orange_btn, 2)
             color_group.addButton(none_btn, 3)
 
+            @Slot()
             def _clear_color_selection() -> None:
                 try:
                     color_group.setExclusive(False)
@@ -4126,14 +4799,19 @@ class MainWindow(QMainWindow):
                 finally:
                     color_group.setExclusive(True)
 
+            _clear_color_idle = QTimer(color_group)
+            _clear_color_idle.setSingleShot(True)
+            _clear_color_idle.setInterval(0)
+            _clear_color_idle.timeout.connect(_clear_color_selection)
+
             # Default selection: none selected (paint mode off).
             _clear_color_selection()
 
             def _persist_swatch_colors() -> None:
                 try:
-                    self._settings.setValue("forms/3/paint_swatch1_rgb", red_btn.swatch_rgb() or "")
-                    self._settings.setValue("forms/3/paint_swatch2_rgb", orange_btn.swatch_rgb() or "")
-                    self._settings.setValue("forms/3/paint_swatch3_rgb", none_btn.swatch_rgb() or "")
+                    self._queue_setting("forms/3/paint_swatch1_rgb", red_btn.swatch_rgb() or "")
+                    self._queue_setting("forms/3/paint_swatch2_rgb", orange_btn.swatch_rgb() or "")
+                    self._queue_setting("forms/3/paint_swatch3_rgb", none_btn.swatch_rgb() or "")
                 except Exception:
                     pass
 
@@ -4143,7 +4821,7 @@ class MainWindow(QMainWindow):
 
             # Form 3 checkbox is independent, but it lives next to the paint controls.
             if include_thread_cb is not None:
-                include_thread_cb.toggled.connect(lambda checked: self._apply_form3_include_thread_extras_toggle(bool(checked)))
+                include_thread_cb.toggled.connect(self._apply_form3_include_thread_extras_toggle)
 
 
         header_layout.addStretch()
@@ -4219,204 +4897,7 @@ class MainWindow(QMainWindow):
 
         if form_key == "3":
             # Form 3: click/scroll bubble follow (driven by Form 3 checkbox).
-            try:
-                def _follow_enabled() -> bool:
-                    try:
-                        return bool(getattr(self, "_form3_follow_find_enabled", False))
-                    except Exception:
-                        return False
-
-                def _drawing_is_popped_out() -> bool:
-                    try:
-                        dv = getattr(self, "drawing_viewer_tab", None)
-                        return bool(dv is not None and (dv.windowFlags() & Qt.Window))
-                    except Exception:
-                        return False
-
-                def _select_bubble_on_drawing(n: int) -> None:
-                    try:
-                        nn = int(n)
-                    except Exception:
-                        return
-                    if nn <= 0:
-                        return
-
-                    # If the Drawing Viewer is popped out, do NOT activate it;
-                    # keep keyboard focus on Form 3 so Up/Down works.
-                    try:
-                        dv = getattr(self, "drawing_viewer_tab", None)
-                        pv = getattr(dv, "_pdf_viewer", None) if dv is not None else None
-                        popped_out = _drawing_is_popped_out()
-                    except Exception:
-                        pv = None
-                        popped_out = False
-
-                    if popped_out and pv is not None and hasattr(pv, "select_bubble_number"):
-                        try:
-                            pv.select_bubble_number(int(nn), center=True)
-                        except Exception:
-                            pass
-                        return
-
-                    try:
-                        self._focus_drawing_and_select_bubble(int(nn))
-                    except Exception:
-                        pass
-
-                def _bubble_number_at_row(ws, row_1based: int) -> int | None:
-                    try:
-                        v = ws.cell(row=int(row_1based), column=5).value
-                        n = int(v)
-                        return int(n) if n > 0 else None
-                    except Exception:
-                        return None
-
-                def _select_row_bubble(rr_1based: int) -> int | None:
-                    ws = getattr(viewer, "_ws", None)
-                    tbl = getattr(viewer, "table", None)
-                    if ws is None or tbl is None:
-                        return None
-                    n = _bubble_number_at_row(ws, int(rr_1based))
-                    if n is None:
-                        return None
-                    r0 = int(rr_1based) - 1
-                    c0 = 4
-                    try:
-                        tbl.clearSelection()
-                    except Exception:
-                        pass
-                    try:
-                        tbl.setCurrentCell(int(r0), int(c0))
-                    except Exception:
-                        pass
-                    try:
-                        tbl.setRangeSelected(QTableWidgetSelectionRange(int(r0), int(c0), int(r0), int(c0)), True)
-                    except Exception:
-                        pass
-                    try:
-                        it = tbl.item(int(r0), int(c0))
-                        if it is not None:
-                            off = max(0, int(r0) - 5)
-                            it2 = tbl.item(int(off), int(c0))
-                            if it2 is not None:
-                                tbl.scrollToItem(it2, QAbstractItemView.ScrollHint.PositionAtTop)
-                    except Exception:
-                        pass
-                    return int(n)
-
-                def _on_form3_bubble_click(r0: int, c0: int) -> None:
-                    if not _follow_enabled():
-                        return
-                    if int(c0) + 1 != 5:
-                        return
-                    ws = getattr(viewer, "_ws", None)
-                    if ws is None:
-                        return
-                    n = _bubble_number_at_row(ws, int(r0) + 1)
-                    if n is None:
-                        return
-                    _select_bubble_on_drawing(int(n))
-                    if _drawing_is_popped_out():
-                        try:
-                            viewer.table.setFocus(Qt.FocusReason.OtherFocusReason)
-                        except Exception:
-                            pass
-
-                def _wheel_nav(row_1based: int, col_1based: int, delta_y: int) -> bool:
-                    if not _follow_enabled():
-                        return False
-                    if int(col_1based) != 5:
-                        return False
-                    if int(delta_y) == 0:
-                        return False
-
-                    ws = getattr(viewer, "_ws", None)
-                    if ws is None:
-                        return False
-
-                    step = 1 if int(delta_y) < 0 else -1
-                    rr = int(row_1based) + int(step)
-                    if rr < 6:
-                        rr = 6
-
-                    try:
-                        max_row = int(getattr(ws, "max_row", 0) or 0)
-                    except Exception:
-                        max_row = 0
-                    if max_row <= 0:
-                        max_row = int(rr) + 500
-
-                    tries = 0
-                    while 1 <= rr <= max_row and tries < 2000:
-                        tries += 1
-                        n = _select_row_bubble(int(rr))
-                        if n is not None:
-                            _select_bubble_on_drawing(int(n))
-                            if _drawing_is_popped_out():
-                                try:
-                                    viewer.table.setFocus(Qt.FocusReason.OtherFocusReason)
-                                except Exception:
-                                    pass
-                            return True
-                        rr += int(step)
-                    return False
-
-                def _key_nav(row_1based: int, col_1based: int, direction: int) -> bool:
-                    if not _follow_enabled():
-                        return False
-                    if int(col_1based) != 5:
-                        return False
-                    try:
-                        direction = int(direction)
-                    except Exception:
-                        return False
-                    if direction not in (-1, 1):
-                        return False
-
-                    ws = getattr(viewer, "_ws", None)
-                    if ws is None:
-                        return False
-
-                    rr = int(row_1based) + int(direction)
-                    if rr < 6:
-                        rr = 6
-
-                    try:
-                        max_row = int(getattr(ws, "max_row", 0) or 0)
-                    except Exception:
-                        max_row = 0
-                    if max_row <= 0:
-                        max_row = int(rr) + 500
-
-                    tries = 0
-                    while 1 <= rr <= max_row and tries < 2000:
-                        tries += 1
-                        n = _select_row_bubble(int(rr))
-                        if n is not None:
-                            _select_bubble_on_drawing(int(n))
-                            if _drawing_is_popped_out():
-                                try:
-                                    viewer.table.setFocus(Qt.FocusReason.OtherFocusReason)
-                                except Exception:
-                                    pass
-                            return True
-                        rr += int(direction)
-                    return False
-
-                try:
-                    viewer.table.cellClicked.connect(_on_form3_bubble_click)
-                except Exception:
-                    pass
-                try:
-                    viewer.set_wheel_navigation_handler(_wheel_nav)
-                except Exception:
-                    pass
-                try:
-                    viewer.set_key_navigation_handler(_key_nav)
-                except Exception:
-                    pass
-            except Exception:
-                pass
+            self._install_form3_follow(viewer, popout=False)
 
         if wrap_cb is not None:
             _wrap_updating = {"busy": False}
@@ -4426,42 +4907,78 @@ class MainWindow(QMainWindow):
                     ws = getattr(viewer, "_ws", None)
                     tbl = getattr(viewer, "table", None)
                     if ws is None or tbl is None:
-                        return Qt.CheckState.Unchecked
-                    ranges = list(tbl.selectedRanges() or [])
-                    if not ranges:
-                        return Qt.CheckState.Unchecked
+                        return _CS_UNCHECKED
+                    # Cheap empty check first; clicks on blank cells often clear the selection.
+                    sm = tbl.selectionModel()
+                    if sm is None or not sm.hasSelection():
+                        return _CS_UNCHECKED
+                    ranges = tbl.selectedRanges()
                 except Exception:
-                    return Qt.CheckState.Unchecked
+                    return _CS_UNCHECKED
 
                 any_true = False
                 any_false = False
 
+                # Scan the on-screen rows of each range first: a mixed selection (the common
+                # case for large ones) is usually decided there, before the off-screen rows.
+                try:
+                    vis_top = tbl.rowAt(0)
+                    vis_bottom = tbl.rowAt(tbl.viewport().height() - 1)
+                    if vis_bottom < 0:
+                        vis_bottom = tbl.rowCount() - 1
+                except Exception:
+                    vis_top = -1
+                    vis_bottom = -1
+
+                bands: list[tuple[int, int, int, int]] = []
+                later: list[tuple[int, int, int, int]] = []
                 for rng in ranges:
-                    r0 = int(rng.topRow()) + 1
-                    r1 = int(rng.bottomRow()) + 1
-                    c0 = int(rng.leftColumn()) + 1
-                    c1 = int(rng.rightColumn()) + 1
-                    for rr in range(r0, r1 + 1):
-                        for cc in range(c0, c1 + 1):
-                            try:
-                                cell = ws.cell(row=int(rr), column=int(cc))
-                                align = getattr(cell, "alignment", None)
-                                w = bool(getattr(align, "wrapText", False)) if align is not None else False
-                            except Exception:
+                    top, bottom = rng.topRow(), rng.bottomRow()
+                    left, right = rng.leftColumn(), rng.rightColumn()
+                    lo, hi = max(top, vis_top), min(bottom, vis_bottom)
+                    if vis_top < 0 or lo > hi:
+                        later.append((top, bottom, left, right))
+                        continue
+                    bands.append((lo, hi, left, right))
+                    if top < lo:
+                        later.append((top, lo - 1, left, right))
+                    if hi < bottom:
+                        later.append((hi + 1, bottom, left, right))
+                bands.extend(later)
+
+                # Cells are read straight from the sheet's internal (row, col) dict rather than
+                # through ws.cell()/iter_rows(), which would create a cell object for every
+                # never-written coordinate of a large selection. A missing cell is unwrapped.
+                # The return exits every loop as soon as the selection is known to be mixed.
+                cells = getattr(ws, "_cells", None)
+                if not isinstance(cells, dict):
+                    cells = {}
+                cells_get = cells.get
+                for top, bottom, left, right in bands:
+                    cols = range(left + 1, right + 2)
+                    for rr in range(top + 1, bottom + 2):
+                        for cc in cols:
+                            cell = cells_get((rr, cc))
+                            if cell is None:
                                 w = False
+                            else:
+                                try:
+                                    align = cell.alignment
+                                    w = bool(align.wrapText) if align is not None else False
+                                except Exception:
+                                    w = False
                             if w:
                                 any_true = True
                             else:
                                 any_false = True
                             if any_true and any_false:
-                                return Qt.CheckState.PartiallyChecked
+                                return _CS_PARTIAL
 
                 if any_true and not any_false:
-                    return Qt.CheckState.Checked
-                if any_false and not any_true:
-                    return Qt.CheckState.Unchecked
-                return Qt.CheckState.Unchecked
+                    return _CS_CHECKED
+                return _CS_UNCHECKED
 
+            @Slot()
             def _update_wrap_checkbox_from_selection() -> None:
                 if _wrap_updating["busy"]:
                     return
@@ -4471,10 +4988,17 @@ class MainWindow(QMainWindow):
                     try:
                         wrap_cb.setCheckState(st)
                     except Exception:
-                        wrap_cb.setChecked(st == Qt.CheckState.Checked)
+                        wrap_cb.setChecked(st == _CS_CHECKED)
                 finally:
                     _wrap_updating["busy"] = False
 
+            # Re-armable zero-delay sync; start() while pending does not queue a second run.
+            wrap_sync_idle = QTimer(viewer.table)
+            wrap_sync_idle.setSingleShot(True)
+            wrap_sync_idle.setInterval(0)
+            wrap_sync_idle.timeout.connect(_update_wrap_checkbox_from_selection)
+
+            @Slot(int)
             def _on_wrap_state_changed(state: int) -> None:
                 if _wrap_updating["busy"]:
                     return
@@ -4483,23 +5007,40 @@ class MainWindow(QMainWindow):
                     st = Qt.CheckState(state)
                 except Exception:
                     st = state
-                desired = (st == Qt.CheckState.Checked)
+                desired = (st == _CS_CHECKED)
                 applied = False
                 try:
                     applied = bool(viewer.set_wrap_text_for_selection(bool(desired)))
                 except Exception:
                     applied = False
 
-                if not applied:
+                if applied:
+                    # The whole selection now has the requested wrap; show it without a rescan.
+                    # (A click on a partial checkbox lands here as an unwrap.)
+                    _wrap_updating["busy"] = True
                     try:
-                        QMessageBox.information(self, "Wrap Text", "Please select a cell, row, or column first.")
+                        wrap_cb.setCheckState(_CS_CHECKED if desired else _CS_UNCHECKED)
                     except Exception:
                         pass
-                # Always refresh checkbox state from the actual selection after attempting.
-                QTimer.singleShot(0, _update_wrap_checkbox_from_selection)
+                    finally:
+                        _wrap_updating["busy"] = False
+                    return
 
+                try:
+                    QMessageBox.information(self, "Wrap Text", "Please select a cell, row, or column first.")
+                except Exception:
+                    pass
+                # Nothing was applied; re-derive the checkbox from the actual selection.
+                wrap_sync_idle.start()
+
+            # Rubber-band drags emit itemSelectionChanged per mouse move; only the final
+            # selection matters, so the rescan is debounced (restarting the timer on each emit).
             try:
-                viewer.table.itemSelectionChanged.connect(_update_wrap_checkbox_from_selection)
+                wrap_sync_timer = QTimer(viewer.table)
+                wrap_sync_timer.setSingleShot(True)
+                wrap_sync_timer.setInterval(50)
+                wrap_sync_timer.timeout.connect(_update_wrap_checkbox_from_selection)
+                viewer.table.itemSelectionChanged.connect(wrap_sync_timer.start)
             except Exception:
                 pass
 
@@ -4509,7 +5050,7 @@ class MainWindow(QMainWindow):
                 pass
 
             # Initial sync.
-            QTimer.singleShot(0, _update_wrap_checkbox_from_selection)
+            wrap_sync_idle.start()
 
         # Wire up the color selector to apply-to-selection behavior (Excel-like).
         if color_group is not None and red_btn is not None and orange_btn is not None and none_btn is not None:
@@ -4520,6 +5061,7 @@ class MainWindow(QMainWindow):
                 except Exception:
                     pass
 
+                @Slot()
                 def _apply_fill_from_swatch() -> None:
                     checked_id = -1
                     try:
@@ -4551,8 +5093,8 @@ class MainWindow(QMainWindow):
 
                     # Always clear the swatch selection so no mode stays active.
                     try:
-                        if _clear_color_selection is not None:
-                            QTimer.singleShot(0, _clear_color_selection)
+                        if _clear_color_idle is not None:
+                            _clear_color_idle.start()
                     except Exception:
                         pass
                     try:
@@ -4561,8 +5103,9 @@ class MainWindow(QMainWindow):
                         pass
 
                 # Clicking a swatch applies the color and immediately clears the selection.
-                color_group.buttonClicked.connect(lambda _b=None: _apply_fill_from_swatch())
+                color_group.buttonClicked.connect(_apply_fill_from_swatch)
 
+                @Slot()
                 def _refresh_after_color_pick() -> None:
                     try:
                         if _persist_swatch_colors is not None:
@@ -4576,12 +5119,14 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
 
+        @Slot()
         def _apply_starting_scale() -> None:
             if use_start_cb.isChecked():
                 viewer.set_effective_scale(float(start_spin.value()) / 100.0)
             else:
                 viewer.reset_auto_scale()
 
+        @Slot(float)
         def _update_scale_label(scale: float) -> None:
             try:
                 pct = int(round(float(scale) * 100.0))
@@ -4590,19 +5135,37 @@ class MainWindow(QMainWindow):
             scale_label.setText(f"Scale: {pct}%")
 
         def _persist_settings() -> None:
-            self._settings.setValue(f"forms/{form_key}/use_starting_scale", use_start_cb.isChecked())
-            self._settings.setValue(f"forms/{form_key}/starting_scale_pct", int(start_spin.value()))
+            self._queue_setting(f"forms/{form_key}/use_starting_scale", use_start_cb.isChecked())
+            self._queue_setting(f"forms/{form_key}/starting_scale_pct", int(start_spin.value()))
 
         viewer.scaleChanged.connect(_update_scale_label)
         _update_scale_label(viewer.effective_scale())
-        use_start_cb.toggled.connect(lambda _checked: (_persist_settings(), _apply_starting_scale()))
-        start_spin.valueChanged.connect(
-            lambda _v: (_persist_settings(), _apply_starting_scale()) if use_start_cb.isChecked() else _persist_settings()
-        )
+        @Slot(bool)
+        def _on_use_start_toggled(_checked: bool) -> None:
+            _persist_settings()
+            _apply_starting_scale()
+
+        # Holding an arrow on the spin box fires valueChanged many times a second; each
+        # rescale relayouts the whole sheet, so the rescale runs once the ticks settle.
+        scale_apply_timer = QTimer(start_spin)
+        scale_apply_timer.setSingleShot(True)
+        scale_apply_timer.setInterval(60)
+        scale_apply_timer.timeout.connect(_apply_starting_scale)
+
+        @Slot(int)
+        def _on_start_spin_changed(v: int) -> None:
+            # The checkbox state is persisted by its own toggle handler.
+            self._queue_setting(f"forms/{form_key}/starting_scale_pct", v)
+            if use_start_cb.isChecked():
+                scale_apply_timer.start()
+
+        use_start_cb.toggled.connect(_on_use_start_toggled)
+        start_spin.valueChanged.connect(_on_start_spin_changed)
 
         # Form 3 font scaling (fonts only; does not change row/column sizes).
         if str(form_key) == "3" and font_scale_spin is not None and hasattr(viewer, "set_font_scale_multiplier"):
 
+            @Slot()
             def _apply_form3_font_scale() -> None:
                 try:
                     pt = int(font_scale_spin.value())
@@ -4610,7 +5173,7 @@ class MainWindow(QMainWindow):
                     pt = 10
                 pt = max(6, min(24, int(pt)))
                 try:
-                    self._settings.setValue("forms/3/font_point_size", int(pt))
+                    self._queue_setting("forms/3/font_point_size", int(pt))
                 except Exception:
                     pass
 
@@ -4630,13 +5193,12 @@ class MainWindow(QMainWindow):
                 try:
                     spin2 = getattr(self, "_form3_font_scale_spin_pop", None)
                     if spin2 is not None and int(spin2.value()) != int(pt):
-                        spin2.blockSignals(True)
-                        spin2.setValue(int(pt))
-                        spin2.blockSignals(False)
+                        with QSignalBlocker(spin2):
+                            spin2.setValue(int(pt))
                 except Exception:
                     pass
 
-            font_scale_spin.valueChanged.connect(lambda _v: _apply_form3_font_scale())
+            font_scale_spin.valueChanged.connect(_apply_form3_font_scale)
             _apply_form3_font_scale()
 
         # Apply initial per-form starting scale (applies after first render).
@@ -4645,6 +5207,138 @@ class MainWindow(QMainWindow):
 
         return container, viewer
 
+    def _install_form3_follow(self, viewer, *, popout: bool) -> None:
+        """Wire Form 3 bubble follow (click, wheel and Up/Down on column E) into `viewer`.
+
+        Used by both the embedded Form 3 tab and its pop-out. With `popout` set, a click
+        while the Drawing Viewer is popped out also re-selects the clicked bubble cell,
+        since the pop-out keeps keyboard focus for Up/Down.
+        """
+
+        def _follow_enabled() -> bool:
+            try:
+                return bool(getattr(self, "_form3_follow_find_enabled", False))
+            except Exception:
+                return False
+
+        def _drawing_is_popped_out() -> bool:
+            return self._drawing_viewer_popped
+
+        def _select_bubble_on_drawing(n: int, popped_out: bool) -> None:
+            if n <= 0:
+                return
+
+            # If the Drawing Viewer is popped out, do NOT activate it;
+            # keep keyboard focus on Form 3 so Up/Down works.
+            try:
+                dv = getattr(self, "drawing_viewer_tab", None)
+                pv = getattr(dv, "_pdf_viewer", None) if dv is not None else None
+            except Exception:
+                pv = None
+
+            if popped_out and pv is not None and hasattr(pv, "select_bubble_number"):
+                try:
+                    pv.select_bubble_number(n, center=True)
+                except Exception:
+                    pass
+                return
+
+            try:
+                self._focus_drawing_and_select_bubble(n)
+            except Exception:
+                pass
+
+        def _follow_bubble(n: int) -> None:
+            # One popped-out probe per event, shared with the drawing-side select.
+            popped_out = _drawing_is_popped_out()
+            _select_bubble_on_drawing(n, popped_out)
+            # If drawing viewer is popped out, keep focus here.
+            if popped_out:
+                try:
+                    viewer.table.setFocus(_FR_OTHER)
+                except Exception:
+                    pass
+
+        # Wheel/key handlers must answer "consumed?" synchronously, so the table
+        # selection moves on every tick, but the drawing-side follow is coalesced:
+        # a burst of ticks within one event-loop turn pans the drawing once, to the
+        # last bubble reached.
+        follow_pending = {"n": 0}
+
+        @Slot()
+        def _flush_follow() -> None:
+            _follow_bubble(follow_pending["n"])
+
+        follow_idle = QTimer(viewer.table)
+        follow_idle.setSingleShot(True)
+        follow_idle.setInterval(0)
+        follow_idle.timeout.connect(_flush_follow)
+
+        @Slot(int, int)
+        def _on_form3_bubble_click(r0: int, c0: int) -> None:
+            if not _follow_enabled():
+                return
+            if c0 + 1 != 5:
+                return
+            if getattr(viewer, "_ws", None) is None:
+                return
+            n = _form3_bubble_number_at_row(viewer, r0 + 1)
+            if n is None:
+                return
+            if popout and _drawing_is_popped_out():
+                try:
+                    _form3_select_bubble_cell(viewer.table, r0)
+                except Exception:
+                    pass
+            _follow_bubble(n)
+
+        def _step_to_bubble(row_1based: int, step: int) -> bool:
+            tbl = getattr(viewer, "table", None)
+            if getattr(viewer, "_ws", None) is None or tbl is None:
+                return False
+            hit = _form3_next_bubble_row(viewer, row_1based, step)
+            if hit is None:
+                return False
+            rr, n = hit
+            try:
+                _form3_select_bubble_cell(tbl, rr - 1)
+            except Exception:
+                pass
+            follow_pending["n"] = n
+            follow_idle.start()
+            return True
+
+        def _wheel_nav(row_1based: int, col_1based: int, delta_y: int) -> bool:
+            if not _follow_enabled():
+                return False
+            if col_1based != 5:
+                return False
+            if delta_y == 0:
+                return False
+            return _step_to_bubble(row_1based, 1 if delta_y < 0 else -1)
+
+        def _key_nav(row_1based: int, col_1based: int, direction: int) -> bool:
+            if not _follow_enabled():
+                return False
+            if col_1based != 5:
+                return False
+            if direction not in (-1, 1):
+                return False
+            return _step_to_bubble(row_1based, direction)
+
+        try:
+            viewer.table.cellClicked.connect(_on_form3_bubble_click)
+        except Exception:
+            pass
+        try:
+            viewer.set_wheel_navigation_handler(_wheel_nav)
+        except Exception:
+            pass
+        try:
+            viewer.set_key_navigation_handler(_key_nav)
+        except Exception:
+            pass
+
     def pop_out_form(self, form_key: str):
         viewer = self._form_viewers.get(form_key)
         if viewer is None:
@@ -4663,6 +5357,8 @@ class MainWindow(QMainWindow):
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(6, 4, 6, 0)
 
+        # The pop-out seeds its controls from QSettings; write any staged values first.
+        self._flush_pending_settings()
         start_defaults = {"1": 170, "2": 123, "2c": 191, "3": 88}
         start_default = int(start_defaults.get(form_key, 100))
         saved_use = self._settings.value(f"forms/{form_key}/use_starting_scale", True, type=bool)
@@ -4719,6 +5415,7 @@ class MainWindow(QMainWindow):
         color_group = None
         red_btn = orange_btn = none_btn = None
         _clear_color_selection = None
+        _clear_color_idle = None
         _persist_swatch_colors = None
 
         if form_key in ("1", "2", "2c", "3"):
@@ -4740,6 +5437,7 @@ class MainWindow(QMainWindow):
             color_group.addButton(orange_btn, 2)
             color_group.addButton(none_btn, 3)
 
+            @Slot()
             def _clear_color_selection() -> None:
                 try:
                     color_group.setExclusive(False)
@@ -4749,13 +5447,18 @@ class MainWindow(QMainWindow):
                 finally:
                     color_group.setExclusive(True)
 
+            _clear_color_idle = QTimer(color_group)
+            _clear_color_idle.setSingleShot(True)
+            _clear_color_idle.setInterval(0)
+            _clear_color_idle.timeout.connect(_clear_color_selection)
+
             _clear_color_selection()
 
             def _persist_swatch_colors() -> None:
                 try:
-                    self._settings.setValue("forms/3/paint_swatch1_rgb", red_btn.swatch_rgb() or "")
-                    self._settings.setValue("forms/3/paint_swatch2_rgb", orange_btn.swatch_rgb() or "")
-                    self._settings.setValue("forms/3/paint_swatch3_rgb", none_btn.swatch_rgb() or "")
+                    self._queue_setting("forms/3/paint_swatch1_rgb", red_btn.swatch_rgb() or "")
+                    self._queue_setting("forms/3/paint_swatch2_rgb", orange_btn.swatch_rgb() or "")
+                    self._queue_setting("forms/3/paint_swatch3_rgb", none_btn.swatch_rgb() or "")
                 except Exception:
                     pass
 
@@ -4764,15 +5467,8 @@ class MainWindow(QMainWindow):
             header_layout.addWidget(none_btn)
 
             if include_thread_cb is not None:
-                def _persist_and_refresh_form3() -> None:
-                    try:
-                        self._form3_include_thread_extras = include_thread_cb.isChecked()
-                        self._settings.setValue(
-                            "forms/3/include_thread_extras",
-                            self._form3_include_thread_extras,
-                        )
-                    except Exception:
-                        pass
+                @Slot()
+                def _refresh_form3_views() -> None:
                     # Re-render both the embedded and pop-out views.
                     self._refresh_form3_view()
                     try:
@@ -4781,7 +5477,25 @@ class MainWindow(QMainWindow):
                     except Exception:
                         pass
 
-                include_thread_cb.toggled.connect(lambda _checked: _persist_and_refresh_form3())
+                # Quick double toggles (or a programmatic sync) render Form 3 once.
+                form3_refresh_timer = QTimer(include_thread_cb)
+                form3_refresh_timer.setSingleShot(True)
+                form3_refresh_timer.setInterval(25)
+                form3_refresh_timer.timeout.connect(_refresh_form3_views)
+
+                @Slot(bool)
+                def _persist_and_refresh_form3(checked: bool) -> None:
+                    try:
+                        self._form3_include_thread_extras = bool(checked)
+                        self._settings.setValue(
+                            "forms/3/include_thread_extras",
+                            self._form3_include_thread_extras,
+                        )
+                    except Exception:
+                        pass
+                    form3_refresh_timer.start()
+
+                include_thread_cb.toggled.connect(_persist_and_refresh_form3)
 
             # Mirror the embedded Form 3 bubble-follow checkbox in the pop-out header.
             try:
@@ -4789,6 +5503,7 @@ class MainWindow(QMainWindow):
                 saved_follow = bool(getattr(self, "_form3_follow_find_enabled", False))
                 self._form3_follow_find_cb_pop.setChecked(bool(saved_follow))
 
+                @Slot(bool)
                 def _persist_follow_pop(on: bool) -> None:
                     try:
                         self._form3_follow_find_enabled = bool(on)
@@ -4802,13 +5517,12 @@ class MainWindow(QMainWindow):
                     try:
                         cb1 = getattr(self, "_form3_follow_find_cb", None)
                         if cb1 is not None and bool(cb1.isChecked()) != bool(on):
-                            cb1.blockSignals(True)
-                            cb1.setChecked(bool(on))
-                            cb1.blockSignals(False)
+                            with QSignalBlocker(cb1):
+                                cb1.setChecked(bool(on))
                     except Exception:
                         pass
 
-                self._form3_follow_find_cb_pop.toggled.connect(lambda on: _persist_follow_pop(bool(on)))
+                self._form3_follow_find_cb_pop.toggled.connect(_persist_follow_pop)
                 header_layout.addWidget(self._form3_follow_find_cb_pop)
             except Exception:
                 pass
@@ -4828,308 +5542,58 @@ class MainWindow(QMainWindow):
             pop_viewer.set_selection_outline_only(True)
         except Exception:
             pass
-        if form_key == "3":
-            pop_viewer.set_hidden_columns([23, 24, 25])
-            pop_viewer.set_auto_fit_row_height_columns([7])
-            try:
-                pop_viewer.set_custom_undo_handler(self._on_form3_undo_requested)
-            except Exception:
-                pass
-
-            # Form 3 pop-out: apply font-only scale and keep it in sync.
-            try:
-                spin_pop = getattr(self, "_form3_font_scale_spin_pop", None)
-                if spin_pop is not None and hasattr(pop_viewer, "set_font_scale_multiplier"):
-
-                    def _apply_form3_font_scale_pop() -> None:
-                        try:
-                            pt = int(spin_pop.value())
-                        except Exception:
-                            pt = 10
-                        pt = max(6, min(24, int(pt)))
-                        try:
-                            self._settings.setValue("forms/3/font_point_size", int(pt))
-                        except Exception:
-                            pass
-                        try:
-                            base_pt = float(pop_viewer.table.font().pointSizeF())
-                            if base_pt <= 0:
-                                base_pt = 10.0
-                        except Exception:
-                            base_pt = 10.0
-                        try:
-                            pop_viewer.set_font_scale_multiplier(float(pt) / float(base_pt))
-                        except Exception:
-                            pass
-
-                        # Keep embedded control (if present) in sync.
-                        try:
-                            spin_emb = getattr(self, "_form3_font_scale_spin", None)
-                            if spin_emb is not None and int(spin_emb.value()) != int(pt):
-                                spin_emb.blockSignals(True)
-                                spin_emb.setValue(int(pt))
-                                spin_emb.blockSignals(False)
-                        except Exception:
-                            pass
-
-                    spin_pop.valueChanged.connect(lambda _v: _apply_form3_font_scale_pop())
-                    _apply_form3_font_scale_pop()
-            except Exception:
-                pass
-
-            # Form 3 pop-out: click/scroll bubble follow (driven by Form 3 checkbox).
-            try:
-                def _follow_enabled() -> bool:
-                    try:
-                        return bool(getattr(self, "_form3_follow_find_enabled", False))
-                    except Exception:
-                        return False
-
-                def _select_bubble_on_drawing(n: int) -> None:
-                    try:
-                        nn = int(n)
-                    except Exception:
-                        return
-                    if nn <= 0:
-                        return
-
-                    # If the Drawing Viewer is popped out, do NOT activate it;
-                    # keep keyboard focus on Form 3 so Up/Down works.
-                    try:
-                        dv = getattr(self, "drawing_viewer_tab", None)
-                        pv = getattr(dv, "_pdf_viewer", None) if dv is not None else None
-                        popped_out = bool(dv is not None and (dv.windowFlags() & Qt.Window))
-                    except Exception:
-                        dv = None
-                        pv = None
-                        popped_out = False
-
-                    if popped_out and pv is not None and hasattr(pv, "select_bubble_number"):
-                        try:
-                            pv.select_bubble_number(int(nn), center=True)
-                        except Exception:
-                            pass
-                        return
-
-                    try:
-                        self._focus_drawing_and_select_bubble(int(nn))
-                    except Exception:
-                        pass
-
-                def _bubble_number_at_row(ws, row_1based: int) -> int | None:
-                    try:
-                        v = ws.cell(row=int(row_1based), column=5).value
-                        n = int(v)
-                        return int(n) if n > 0 else None
-                    except Exception:
-                        return None
-
-                def _on_form3_bubble_click(r0: int, c0: int) -> None:
-                    if not _follow_enabled():
-                        return
-                    if int(c0) + 1 != 5:
-                        return
-                    ws = getattr(pop_viewer, "_ws", None)
-                    if ws is None:
-                        return
-                    n = _bubble_number_at_row(ws, int(r0) + 1)
-                    if n is None:
-                        return
-                    _select_bubble_on_drawing(int(n))
-
-                    # If drawing viewer is popped out, keep focus here.
-                    try:
-                        dv = getattr(self, "drawing_viewer_tab", None)
-                        popped_out = bool(dv is not None and (dv.windowFlags() & Qt.Window))
-                    except Exception:
-                        popped_out = False
-                    if popped_out:
-                        try:
-                            tbl = pop_viewer.table
-                            try:
-                                tbl.clearSelection()
-                            except Exception:
-                                pass
-                            tbl.setCurrentCell(int(r0), 4)
-                            try:
-                                tbl.setRangeSelected(QTableWidgetSelectionRange(int(r0), 4, int(r0), 4), True)
-                            except Exception:
-                                pass
-                            try:
-                                it = tbl.item(int(r0), 4)
-                                if it is not None:
-                                    off = max(0, int(r0) - 5)
-                                    it2 = tbl.item(int(off), 4)
-                                    if it2 is not None:
-                                        tbl.scrollToItem(it2, QAbstractItemView.ScrollHint.PositionAtTop)
-                            except Exception:
-                                pass
-                            pop_viewer.table.setFocus(Qt.FocusReason.OtherFocusReason)
-                        except Exception:
-                            pass
-
-                def _wheel_nav(row_1based: int, col_1based: int, delta_y: int) -> bool:
-                    if not _follow_enabled():
-                        return False
-                    if int(col_1based) != 5:
-                        return False
-                    if int(delta_y) == 0:
-                        return False
-
-                    ws = getattr(pop_viewer, "_ws", None)
-                    tbl = getattr(pop_viewer, "table", None)
-                    if ws is None or tbl is None:
-                        return False
-
-                    step = 1 if int(delta_y) < 0 else -1
-                    rr = int(row_1based) + int(step)
-                    if rr < 6:
-                        rr = 6
-
-                    max_row = 0
-                    try:
-                        max_row = int(getattr(ws, "max_row", 0) or 0)
-                    except Exception:
-                        max_row = 0
-                    if max_row <= 0:
-                        max_row = int(rr) + 500
-
-                    tries = 0
-                    while 1 <= rr <= max_row and tries < 2000:
-                        tries += 1
-                        n = _bubble_number_at_row(ws, rr)
-                        if n is not None:
-                            try:
-                                r0 = int(rr) - 1
-                                c0 = 4
-                                try:
-                                    tbl.clearSelection()
-                                except Exception:
-                                    pass
-                                tbl.setCurrentCell(int(r0), int(c0))
-                                try:
-                                    tbl.setRangeSelected(QTableWidgetSelectionRange(int(r0), int(c0), int(r0), int(c0)), True)
-                                except Exception:
-                                    pass
-                                try:
-                                    it = tbl.item(int(r0), int(c0))
-                                    if it is not None:
-                                        off = max(0, int(r0) - 5)
-                                        it2 = tbl.item(int(off), int(c0))
-                                        if it2 is not None:
-                                            tbl.scrollToItem(it2, QAbstractItemView.ScrollHint.PositionAtTop)
-                                except Exception:
-                                    pass
-                            except Exception:
-                                pass
-                            _select_bubble_on_drawing(int(n))
-
-                            # If drawing viewer is popped out, keep focus here.
-                            try:
-                                dv = getattr(self, "drawing_viewer_tab", None)
-                                popped_out = bool(dv is not None and (dv.windowFlags() & Qt.Window))
-                            except Exception:
-                                popped_out = False
-                            if popped_out:
-                                try:
-                                    tbl.setFocus(Qt.FocusReason.OtherFocusReason)
-                                except Exception:
-                                    pass
-                            return True
-                        rr += int(step)
-
-                    return False
-
-                def _key_nav(row_1based: int, col_1based: int, direction: int) -> bool:
-                    if not _follow_enabled():
-                        return False
-                    if int(col_1based) != 5:
-                        return False
-                    try:
-                        direction = int(direction)
-                    except Exception:
-                        direction = 0
-                    if direction not in (-1, 1):
-                        return False
-
-                    ws = getattr(pop_viewer, "_ws", None)
-                    tbl = getattr(pop_viewer, "table", None)
-                    if ws is None or tbl is None:
-                        return False
-
-                    rr = int(row_1based) + int(direction)
-                    if rr < 6:
-                        rr = 6
+        if form_key == "3":
+            pop_viewer.set_hidden_columns([23, 24, 25])
+            pop_viewer.set_auto_fit_row_height_columns([7])
+            try:
+                pop_viewer.set_custom_undo_handler(self._on_form3_undo_requested)
+            except Exception:
+                pass
 
-                    max_row = 0
-                    try:
-                        max_row = int(getattr(ws, "max_row", 0) or 0)
-                    except Exception:
-                        max_row = 0
-                    if max_row <= 0:
-                        max_row = int(rr) + 500
-
-                    tries = 0
-                    while 1 <= rr <= max_row and tries < 2000:
-                        tries += 1
-                        n = _bubble_number_at_row(ws, rr)
-                        if n is not None:
-                            try:
-                                r0 = int(rr) - 1
-                                c0 = 4
-                                try:
-                                    tbl.clearSelection()
-                                except Exception:
-                                    pass
-                                tbl.setCurrentCell(int(r0), int(c0))
-                                try:
-                                    tbl.setRangeSelected(QTableWidgetSelectionRange(int(r0), int(c0), int(r0), int(c0)), True)
-                                except Exception:
-                                    pass
-                                try:
-                                    it = tbl.item(int(r0), int(c0))
-                                    if it is not None:
-                                        off = max(0, int(r0) - 5)
-                                        it2 = tbl.item(int(off), int(c0))
-                                        if it2 is not None:
-                                            tbl.scrollToItem(it2, QAbstractItemView.ScrollHint.PositionAtTop)
-                                except Exception:
-                                    pass
-                            except Exception:
-                                pass
-                            _select_bubble_on_drawing(int(n))
+            # Form 3 pop-out: apply font-only scale and keep it in sync.
+            try:
+                spin_pop = getattr(self, "_form3_font_scale_spin_pop", None)
+                if spin_pop is not None and hasattr(pop_viewer, "set_font_scale_multiplier"):
 
-                            # If drawing viewer is popped out, keep focus here.
-                            try:
-                                dv = getattr(self, "drawing_viewer_tab", None)
-                                popped_out = bool(dv is not None and (dv.windowFlags() & Qt.Window))
-                            except Exception:
-                                popped_out = False
-                            if popped_out:
-                                try:
-                                    tbl.setFocus(Qt.FocusReason.OtherFocusReason)
-                                except Exception:
-                                    pass
-                            return True
-                        rr += int(direction)
+                    @Slot()
+                    def _apply_form3_font_scale_pop() -> None:
+                        try:
+                            pt = int(spin_pop.value())
+                        except Exception:
+                            pt = 10
+                        pt = max(6, min(24, int(pt)))
+                        try:
+                            self._queue_setting("forms/3/font_point_size", int(pt))
+                        except Exception:
+                            pass
+                        try:
+                            base_pt = float(pop_viewer.table.font().pointSizeF())
+                            if base_pt <= 0:
+                                base_pt = 10.0
+                        except Exception:
+                            base_pt = 10.0
+                        try:
+                            pop_viewer.set_font_scale_multiplier(float(pt) / float(base_pt))
+                        except Exception:
+                            pass
 
-                    return False
+                        # Keep embedded control (if present) in sync.
+                        try:
+                            spin_emb = getattr(self, "_form3_font_scale_spin", None)
+                            if spin_emb is not None and int(spin_emb.value()) != int(pt):
+                                with QSignalBlocker(spin_emb):
+                                    spin_emb.setValue(int(pt))
+                        except Exception:
+                            pass
 
-                try:
-                    pop_viewer.table.cellClicked.connect(_on_form3_bubble_click)
-                except Exception:
-                    pass
-                try:
-                    pop_viewer.set_wheel_navigation_handler(_wheel_nav)
-                except Exception:
-                    pass
-                try:
-                    pop_viewer.set_key_navigation_handler(_key_nav)
-                except Exception:
-                    pass
+                    spin_pop.valueChanged.connect(_apply_form3_font_scale_pop)
+                    _apply_form3_font_scale_pop()
             except Exception:
                 pass
 
+            # Form 3 pop-out: click/scroll bubble follow (driven by Form 3 checkbox).
+            self._install_form3_follow(pop_viewer, popout=True)
+
         # Wire up the color selector to apply-to-selection behavior (Excel-like).
         if color_group is not None and red_btn is not None and orange_btn is not None and none_btn is not None:
             try:
@@ -5138,6 +5602,7 @@ class MainWindow(QMainWindow):
                 except Exception:
                     pass
 
+                @Slot()
                 def _apply_fill_from_swatch() -> None:
                     checked_id = -1
                     try:
@@ -5167,8 +5632,8 @@ class MainWindow(QMainWindow):
                             pass
 
                     try:
-                        if _clear_color_selection is not None:
-                            QTimer.singleShot(0, _clear_color_selection)
+                        if _clear_color_idle is not None:
+                            _clear_color_idle.start()
                     except Exception:
                         pass
                     try:
@@ -5176,8 +5641,9 @@ class MainWindow(QMainWindow):
                     except Exception:
                         pass
 
-                color_group.buttonClicked.connect(lambda _b=None: _apply_fill_from_swatch())
+                color_group.buttonClicked.connect(_apply_fill_from_swatch)
 
+                @Slot()
                 def _refresh_after_color_pick() -> None:
                     try:
                         if _persist_swatch_colors is not None:
@@ -5191,6 +5657,7 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
 
+        @Slot(float)
         def _update_scale_label(scale: float) -> None:
             try:
                 pct = int(round(float(scale) * 100.0))
@@ -5198,6 +5665,7 @@ class MainWindow(QMainWindow):
                 pct = 100
             scale_label.setText(f"Scale: {pct}%")
 
+        @Slot()
         def _apply_starting_scale() -> None:
             if use_start_cb.isChecked():
                 pop_viewer.set_effective_scale(float(start_spin.value()) / 100.0)
@@ -5205,19 +5673,36 @@ class MainWindow(QMainWindow):
                 pop_viewer.reset_auto_scale()
 
         def _persist_settings() -> None:
-            self._settings.setValue(f"forms/{form_key}/use_starting_scale", use_start_cb.isChecked())
-            self._settings.setValue(f"forms/{form_key}/starting_scale_pct", int(start_spin.value()))
+            self._queue_setting(f"forms/{form_key}/use_starting_scale", use_start_cb.isChecked())
+            self._queue_setting(f"forms/{form_key}/starting_scale_pct", int(start_spin.value()))
 
         pop_viewer.scaleChanged.connect(_update_scale_label)
         _update_scale_label(pop_viewer.effective_scale())
-        use_start_cb.toggled.connect(lambda _checked: (_persist_settings(), _apply_starting_scale()))
-        start_spin.valueChanged.connect(
-            lambda _v: (_persist_settings(), _apply_starting_scale()) if use_start_cb.isChecked() else _persist_settings()
-        )
+        @Slot(bool)
+        def _on_use_start_toggled(_checked: bool) -> None:
+            _persist_settings()
+            _apply_starting_scale()
+
+        # Holding an arrow on the spin box fires valueChanged many times a second; each
+        # rescale relayouts the whole sheet, so the rescale runs once the ticks settle.
+        scale_apply_timer = QTimer(start_spin)
+        scale_apply_timer.setSingleShot(True)
+        scale_apply_timer.setInterval(60)
+        scale_apply_timer.timeout.connect(_apply_starting_scale)
+
+        @Slot(int)
+        def _on_start_spin_changed(v: int) -> None:
+            # The checkbox state is persisted by its own toggle handler.
+            self._queue_setting(f"forms/{form_key}/starting_scale_pct", v)
+            if use_start_cb.isChecked():
+                scale_apply_timer.start()
+
+        use_start_cb.toggled.connect(_on_use_start_toggled)
+        start_spin.valueChanged.connect(_on_start_spin_changed)
         _apply_starting_scale()
 
-        if self._template_wb is not None and self._form_sheet_names.get(form_key):
-            ws = self._template_wb[self._form_sheet_names[form_key]]
+        ws = self._form_worksheets.get(form_key) if self._template_wb is not None else None
+        if ws is not None:
             pop_viewer.set_worksheet(ws)
             pop_viewer.set_overrides({})
             pop_viewer.render()
@@ -5231,32 +5716,32 @@ class MainWindow(QMainWindow):
         self._popout_windows.append(win)
 
     def _normalize_sheet_name(self, s: str) -> str:
-        return re.sub(r"\s+", " ", str(s or "").strip().lower())
+        return _norm_ws(s)
 
     def _detect_form_sheets(self, wb) -> None:
-        self._form_sheet_names = {"1": None, "2": None, "2c": None, "3": None}
+        names = {"1": None, "2": None, "2c": None, "3": None}
+        # One normalization per sheet; "formN" substrings already cover the endswith() forms.
         for name in wb.sheetnames:
-            n = self._normalize_sheet_name(name)
-            if "form 1" in n or n.endswith("form1") or "form1" in n:
-                self._form_sheet_names["1"] = name
-            # Must detect "Form 2 Cont" before "Form 2".
-            # Templates often use punctuation like "Form 2 - Cont.".
-            elif ("form 2" in n and "cont" in n) or "form2cont" in n or n.endswith("form2cont"):
-                self._form_sheet_names["2c"] = name
-            elif "form 2" in n or n.endswith("form2") or "form2" in n:
-                self._form_sheet_names["2"] = name
-            elif "form 3" in n or n.endswith("form3") or "form3" in n:
-                self._form_sheet_names["3"] = name
+            n = _norm_ws(name)
+            for key, needles in _FORM_SHEET_NEEDLES:
+                if needles is None:
+                    # Templates often use punctuation like "Form 2 - Cont.".
+                    hit = ("form 2" in n and "cont" in n) or "form2cont" in n
+                else:
+                    hit = any(p in n for p in needles)
+                if hit:
+                    names[key] = name
+                    break
 
         # Fallback: assign remaining keys in sheet order
-        remaining_keys = [k for k in ("1", "2", "2c", "3") if not self._form_sheet_names.get(k)]
-        used = {v for v in self._form_sheet_names.values() if v}
-        for name in wb.sheetnames:
-            if not remaining_keys:
-                break
-            if name in used:
-                continue
-            self._form_sheet_names[remaining_keys.pop(0)] = name
+        remaining = [k for k in ("1", "2", "2c", "3") if not names[k]]
+        if remaining:
+            used = {v for v in names.values() if v}
+            leftovers = [nm for nm in wb.sheetnames if nm not in used]
+            for k, nm in zip(remaining, leftovers):
+                names[k] = nm
+        self._form_sheet_names = names
+        self._form_worksheets = {k: wb[nm] for k, nm in names.items() if nm}
 
     def load_template(self, *, persist_settings: bool = True):
         if not self.template_path or not os.path.exists(self.template_path):
@@ -5268,12 +5753,29 @@ class MainWindow(QMainWindow):
                     v.render()
             return
 
+        # Timers and queued calls keep running while the worker loads, against the
+        # current workbook: apply what's pending now and don't start a second load.
+        if self._template_loading:
+            return
+        try:
+            self._flush_pending_workbook_writes()
+        except Exception:
+            pass
+        if self._viewer_refresh_timer is not None:
+            self._viewer_refresh_timer.stop()
+
+        self._template_loading = True
         try:
-            self._template_wb = openpyxl.load_workbook(self.template_path)
+            self._template_wb = _load_workbook_off_thread(self.template_path)
         except Exception as e:
             QMessageBox.warning(self, "Template Error", f"Failed to load template:\n{e}")
             self._template_wb = None
             return
+        finally:
+            self._template_loading = False
+            if self._close_after_template_load:
+                self._close_after_template_load = False
+                QTimer.singleShot(0, self.close)
 
         try:
             self._form3_undo_stack = []
@@ -5331,30 +5833,25 @@ class MainWindow(QMainWindow):
                 limit_r = 1000
             limit_r = max(1, min(int(limit_r), 5000))
 
-            # Only touch existing cells for speed.
+            # Only touch existing cells for speed; assigning a style does not add keys, so the
+            # dict can be walked without a copy. Cells that already wrap keep their style.
             try:
-                items = list(getattr(ws, "_cells", {}).items())
+                items = getattr(ws, "_cells", {}).items()
             except Exception:
-                items = []
-            for (r, c), cell in items:
-                try:
-                    rr = int(r)
-                    cc = int(c)
-                except Exception:
-                    continue
-                if rr <= 0 or rr > int(limit_r):
-                    continue
-                if cc not in cols:
+                items = ()
+            wrap_only = Alignment(wrapText=True)
+            for (rr, cc), cell in items:
+                if cc not in cols or rr <= 0 or rr > limit_r:
                     continue
                 try:
                     cur = getattr(cell, "alignment", None)
-                    if cur is not None:
+                    if cur is None:
+                        cell.alignment = wrap_only
+                    elif not cur.wrapText:
                         try:
                             cell.alignment = cur.copy(wrapText=True)
                         except Exception:
-                            cell.alignment = Alignment(wrapText=True)
-                    else:
-                        cell.alignment = Alignment(wrapText=True)
+                            cell.alignment = wrap_only
                 except Exception:
                     continue
 
@@ -5508,10 +6005,9 @@ class MainWindow(QMainWindow):
 
         for form_key in ("1", "2", "2c", "3"):
             viewer = self._form_viewers.get(form_key)
-            sheet_name = self._form_sheet_names.get(form_key)
-            if viewer is None or not sheet_name:
+            ws = self._form_worksheets.get(form_key)
+            if viewer is None or ws is None:
                 continue
-            ws = self._template_wb[sheet_name]
 
             # Trim away unused columns/rows so the UI stays responsive and the
             # workbook stays small (applies to both Create New and Open Existing).
@@ -5580,10 +6076,9 @@ class MainWindow(QMainWindow):
             viewer.render()
 
         try:
-            form1_name = self._form_sheet_names.get("1")
+            ws1 = self._form_worksheets.get("1")
             viewer1 = self._form_viewers.get("1")
-            if form1_name and viewer1 is not None and form1_name in self._template_wb.sheetnames:
-                ws1 = self._template_wb[form1_name]
+            if ws1 is not None and viewer1 is not None:
                 _ensure_form1_title_merge(ws1)
                 _extend_form1_index_borders(ws1)
                 viewer1.set_worksheet(ws1)
@@ -5756,21 +6251,20 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
+        # Row count of the last full rewrite in this call; column G is freshly computed then.
+        rewritten: list[int] = []
+
         def _write_structured_rows(rows: list[tuple[str, str, str, str, str, str]]) -> None:
-            clear_to = max(len(rows) + 20, 50)
-            for rr in range(1, clear_to + 1):
-                for cc in range(1, 9):
-                    ls.cell(row=rr, column=cc).value = None
-            for i, (company, addr1, addr2, city, state, zipc) in enumerate(rows, start=1):
+            out_rows = []
+            for company, addr1, addr2, city, state, zipc in rows:
                 addr1 = _clean_company_prefix(company, addr1)
                 state = str(state or "").strip().upper()
-                ls.cell(row=i, column=1).value = company
-                ls.cell(row=i, column=2).value = addr1
-                ls.cell(row=i, column=3).value = addr2
-                ls.cell(row=i, column=4).value = city
-                ls.cell(row=i, column=5).value = state
-                ls.cell(row=i, column=6).value = zipc
-                ls.cell(row=i, column=7).value = _build_full_address_with_company(company, addr1, addr2, city, state, zipc)
+                out_rows.append(
+                    (company, addr1, addr2, city, state, zipc,
+                     _build_full_address_with_company(company, addr1, addr2, city, state, zipc))
+                )
+            _replace_hidden_sheet_rows(ls, out_rows, width=8)
+            rewritten[:] = [len(out_rows)]
 
         def _migrate_legacy_ab_to_structured() -> None:
             # If we only have A/B populated, split B into columns and compute H.
@@ -5800,9 +6294,6 @@ class MainWindow(QMainWindow):
         if created or is_empty:
             rows: list[tuple[str, str, str, str, str, str]] = []
 
-            def _norm(s: str) -> str:
-                return re.sub(r"\s+", " ", str(s or "").strip().lower())
-
             # Look for adjacent headers: Company | Address
             for nm in wb.sheetnames:
                 if nm.startswith("__as9102_"):
@@ -5812,13 +6303,22 @@ class MainWindow(QMainWindow):
                 except Exception:
                     continue
 
+                src_max_row = getattr(ws_src, "max_row", 0) or 0
+                src_max_col = getattr(ws_src, "max_column", 0) or 0
+                if src_max_row <= 0 or src_max_col <= 1:
+                    continue
+
+                # One values-only pass over the top-left block; each cell is normalized once
+                # per row and headers are matched against their right-hand neighbour.
                 found = None
-                for r in range(1, min(getattr(ws_src, "max_row", 0) or 0, 300) + 1):
-                    for c in range(1, min(getattr(ws_src, "max_column", 0) or 0, 50) + 1):
-                        v = ws_src.cell(row=r, column=c).value
-                        v2 = ws_src.cell(row=r, column=c + 1).value
-                        if _norm(v) == "company" and _norm(v2) == "address":
-                            found = (r, c)
+                header_rows = ws_src.iter_rows(
+                    min_row=1, max_row=min(src_max_row, 300), max_col=min(src_max_col, 51), values_only=True
+                )
+                for r, row in enumerate(header_rows, start=1):
+                    normed = [_norm_ws(v) if v is not None else "" for v in row]
+                    for c in range(min(len(normed) - 1, 50)):
+                        if normed[c] == "company" and normed[c + 1] == "address":
+                            found = (r, c + 1)
                             break
                     if found:
                         break
@@ -5827,9 +6327,10 @@ class MainWindow(QMainWindow):
                     continue
 
                 hr, hc = found
-                for rr in range(hr + 1, min(hr + 2000, (getattr(ws_src, "max_row", 0) or 0) + 1)):
-                    company = ws_src.cell(row=rr, column=hc).value
-                    addr = ws_src.cell(row=rr, column=hc + 1).value
+                body_rows = ws_src.iter_rows(
+                    min_row=hr + 1, max_row=min(hr + 1999, src_max_row), min_col=hc, max_col=hc + 1, values_only=True
+                )
+                for company, addr in body_rows:
                     if (company is None or str(company).strip() == "") and (addr is None or str(addr).strip() == ""):
                         break
                     company_s = str(company).strip() if company is not None else ""
@@ -5857,6 +6358,9 @@ class MainWindow(QMainWindow):
         marker = str(marker_cell.value or "").strip()
         if marker != "seeded_v4_reset":
             # Clear persisted supplier directory so it doesn't repopulate old rows.
+            self._qsettings_cache.pop("lists/supplier_directory_rows", None)
+            self._last_written_payload.pop("lists/supplier_directory_rows", None)
+            self._persisted_supplier_directory_snapshot = None
             try:
                 self._settings.remove("lists/supplier_directory_rows")
             except Exception:
@@ -5868,41 +6372,41 @@ class MainWindow(QMainWindow):
             # Overwrite the sheet with defaults (no merge).
             _write_structured_rows(list(DEFAULT_SUPPLIER_DIRECTORY_SEED))
 
-            marker_cell.value = "seeded_v4_reset"
+            # The rewrite replaces the row cells, so look the marker cell up again.
+            ls.cell(row=1, column=8).value = "seeded_v4_reset"
 
         # Always keep the computed Full Address (col G) in sync.
         # This is the stored value written into Form 1/2 cells when selecting a Company.
-        try:
-            max_scan = min(max(getattr(ls, "max_row", 0) or 0, 50), 5000)
-            for rr in range(1, max_scan + 1):
-                company = ls.cell(row=rr, column=1).value
-                addr1 = ls.cell(row=rr, column=2).value
-                addr2 = ls.cell(row=rr, column=3).value
-                city = ls.cell(row=rr, column=4).value
-                state = ls.cell(row=rr, column=5).value
-                zipc = ls.cell(row=rr, column=6).value
-                comp_s = str(company).strip() if company is not None else ""
-                a1_s = str(addr1).strip() if addr1 is not None else ""
-                a2_s = str(addr2).strip() if addr2 is not None else ""
-                ct_s = str(city).strip() if city is not None else ""
-                st_s = str(state).strip().upper() if state is not None else ""
-                z_s = str(zipc).strip() if zipc is not None else ""
-                if not (comp_s or a1_s or a2_s or ct_s or st_s or z_s):
-                    continue
-                ls.cell(row=rr, column=7).value = _build_full_address_with_company(comp_s, a1_s, a2_s, ct_s, st_s, z_s)
-        except Exception:
-            pass
-
-        # Compute last row based on full-address column (G).
-        last_row = 0
-        max_scan = min(max(getattr(ls, "max_row", 0) or 0, 50), 5000)
-        for rr in range(1, max_scan + 1):
-            v = ls.cell(row=rr, column=7).value
-            if v is None or str(v).strip() == "":
-                continue
-            last_row = rr
-        if last_row <= 0:
-            last_row = 1
+        # One values-only pass over A:G; G is written only where it actually changes.
+        # Skipped right after a full rewrite, which has just computed every G value.
+        try:
+            max_scan = min(getattr(ls, "max_row", 0) or 0, 5000)
+            if max_scan > 0 and not rewritten:
+                rows_iter = ls.iter_rows(min_row=1, max_row=max_scan, max_col=7, values_only=True)
+                for rr, (company, addr1, addr2, city, state, zipc, full_old) in enumerate(rows_iter, start=1):
+                    comp_s, a1_s, a2_s, ct_s, z_s = _sv(company), _sv(addr1), _sv(addr2), _sv(city), _sv(zipc)
+                    st_s = _sv(state).upper()
+                    if not (comp_s or a1_s or a2_s or ct_s or st_s or z_s):
+                        continue
+                    full = _build_full_address_with_company(comp_s, a1_s, a2_s, ct_s, st_s, z_s)
+                    if full != full_old:
+                        ls.cell(row=rr, column=7).value = full
+        except Exception:
+            pass
+
+        # Compute last row based on full-address column (G): walk up from the bottom and
+        # stop at the first filled cell. Reading ls._cells directly doesn't create cells
+        # for the empty tail the way ls.cell() would.
+        last_row = 1
+        cells = getattr(ls, "_cells", None)
+        cells_get = cells.get if isinstance(cells, dict) else (lambda _k: None)
+        max_scan = min(getattr(ls, "max_row", 0) or 0, 5000)
+        for rr in range(max_scan, 0, -1):
+            c = cells_get((rr, 7))
+            v = c.value if c is not None else None
+            if v is not None and str(v).strip() != "":
+                last_row = rr
+                break
 
         return sheet_name, last_row
 
@@ -5922,25 +6426,14 @@ class MainWindow(QMainWindow):
             ws.data_validations = openpyxl.worksheet.datavalidation.DataValidationList()
             dvs = ws.data_validations
 
-        # If a list validation already exists for the first cell in range, update it.
-        try:
-            first_cell = str(cell_range).split(":", 1)[0]
-        except Exception:
-            first_cell = None
-
-        if first_cell:
-            for dv in list(getattr(dvs, "dataValidation", []) or []):
-                if getattr(dv, "type", None) != "list":
-                    continue
-                try:
-                    if first_cell in str(getattr(dv, "sqref", "")):
-                        try:
-                            dv.formula1 = rng
-                        except Exception:
-                            pass
-                        return
-                except Exception:
-                    continue
+        # If a list validation already covers the whole range, update it.
+        dv = _list_validation_covering(ws, cell_range)
+        if dv is not None:
+            try:
+                dv.formula1 = rng
+            except Exception:
+                pass
+            return
 
         dv = DataValidation(type="list", formula1=rng, allow_blank=True)
         ws.add_data_validation(dv)
@@ -5976,16 +6469,25 @@ class MainWindow(QMainWindow):
             "Supplier Move",
         ]
 
-        def _norm(s: str) -> str:
-            return re.sub(r"\s+", " ", str(s or "").strip().lower())
-
-        # Locate the header cell containing the label
+        # Locate the header cell containing the label. It sits in the Form 1 header
+        # block, so a values-only scan of the top-left corner is enough; walking
+        # ws._cells would visit every materialized cell of the sheet.
         label_cell = None
         needle = "reason for full/partial fai:"
-        for (r, c), cell in getattr(ws, "_cells", {}).items():
-            v = getattr(cell, "value", None)
-            if v and needle in _norm(v):
-                label_cell = (int(r), int(c))
+        # Clamped to the used area: iter_rows() creates any cell it visits.
+        header_rows = ws.iter_rows(
+            min_row=1,
+            max_row=min(getattr(ws, "max_row", 0) or 0, 50),
+            min_col=1,
+            max_col=min(getattr(ws, "max_column", 0) or 0, 20),
+            values_only=True,
+        )
+        for r, row in enumerate(header_rows, start=1):
+            for c, v in enumerate(row, start=1):
+                if v and isinstance(v, str) and needle in _norm_ws(v):
+                    label_cell = (r, c)
+                    break
+            if label_cell:
                 break
         if not label_cell:
             return
@@ -6006,9 +6508,12 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-        # Write the list (overwrite A1..An)
-        for i, val in enumerate(reasons, start=1):
-            ls.cell(row=i, column=1).value = val
+        # Write the list (A1..An). It is static, so on an already-seeded sheet every
+        # value matches and nothing is written.
+        current = ls.iter_rows(min_row=1, max_row=len(reasons), max_col=1, values_only=True)
+        for i, (val, (old,)) in enumerate(zip(reasons, current), start=1):
+            if old != val:
+                ls.cell(row=i, column=1).value = val
 
         # Build a range-based list validation
         rng = f"={list_sheet_name}!$A$1:$A${len(reasons)}"
@@ -6020,14 +6525,8 @@ class MainWindow(QMainWindow):
             dvs = ws.data_validations
 
         target_coord = target.coordinate
-        for dv in list(getattr(dvs, "dataValidation", []) or []):
-            if getattr(dv, "type", None) != "list":
-                continue
-            try:
-                if target_coord in str(getattr(dv, "sqref", "")):
-                    return
-            except Exception:
-                continue
+        if _list_validation_covering(ws, target_coord) is not None:
+            return
 
         dv = DataValidation(type="list", formula1=rng, allow_blank=True)
         ws.add_data_validation(dv)
@@ -6094,19 +6593,14 @@ class MainWindow(QMainWindow):
             dvs = ws.data_validations
 
         target_coord = target.coordinate
-        for dv in list(getattr(dvs, "dataValidation", []) or []):
-            if getattr(dv, "type", None) != "list":
-                continue
+        dv = _list_validation_covering(ws, target_coord)
+        if dv is not None:
+            # Ensure this cell validates against the codes range.
             try:
-                if target_coord in str(getattr(dv, "sqref", "")):
-                    # Ensure this cell validates against the codes range.
-                    try:
-                        dv.formula1 = rng
-                    except Exception:
-                        pass
-                    return
+                dv.formula1 = rng
             except Exception:
-                continue
+                pass
+            return
 
         dv = DataValidation(type="list", formula1=rng, allow_blank=True)
         ws.add_data_validation(dv)
@@ -6117,6 +6611,10 @@ class MainWindow(QMainWindow):
         if not self.characteristics:
             return
 
+        # The rewrite runs synchronously, so dropping the bubble-row indexes up front is
+        # enough; this also reaches pop-outs that are not re-rendered afterwards.
+        self._drop_viewer_row_indexes(ws)
+
         try:
             dbg_gdt = str(os.environ.get("AS9102_DEBUG_GDT", "") or "").strip().lower() in ("1", "true", "yes", "on")
         except Exception:
@@ -6184,6 +6682,11 @@ class MainWindow(QMainWindow):
         current_row = start_row
         row_num = 0
 
+        # openpyxl recomputes max_row/max_column from every cell on each access; the
+        # header/column detection below only reads cells, so bind both once.
+        ws_max_row = int(getattr(ws, "max_row", 0) or 0)
+        ws_max_col = int(getattr(ws, "max_column", 0) or 0)
+
         # Optional: Unit-of-measure column (template-dependent).
         unit_col: int | None = None
         gdt_col: int | None = None
@@ -6193,13 +6696,28 @@ class MainWindow(QMainWindow):
         bonus_tol_col: int | None = None
         header_row = max(1, int(header_row or max(1, start_row - 1)))
         header_rows_to_scan = [header_row]
-        if header_row + 1 <= ws.max_row:
+        if header_row + 1 <= ws_max_row:
             header_rows_to_scan.append(header_row + 1)
 
+        # Header rows are read once, values only, and every column scan below indexes
+        # these tuples instead of building a Cell per ws.cell() probe.
+        header_vals: dict[int, tuple] = {}
+        for hr in header_rows_to_scan:
+            try:
+                header_vals[hr] = next(
+                    ws.iter_rows(min_row=hr, max_row=hr, max_col=max(ws_max_col, 1), values_only=True), ()
+                )
+            except Exception:
+                header_vals[hr] = ()
+
+        def _hv(hr: int, cc: int) -> object:
+            row = header_vals.get(hr, ())
+            return row[cc - 1] if 0 < cc <= len(row) else None
+
         try:
             for hr in header_rows_to_scan:
-                for cc in range(1, ws.max_column + 1):
-                    hv = ws.cell(row=hr, column=cc).value
+                for cc in range(1, ws_max_col + 1):
+                    hv = _hv(hr, cc)
                     if not hv:
                         continue
                     h = str(hv).strip().lower()
@@ -6211,7 +6729,7 @@ class MainWindow(QMainWindow):
             # Fallback: common templates use column J (10)
             if unit_col is None:
                 for hr in header_rows_to_scan:
-                    hv = ws.cell(row=hr, column=10).value
+                    hv = _hv(hr, 10)
                     if hv and "unit" in str(hv).lower():
                         unit_col = 10
                         break
@@ -6221,8 +6739,8 @@ class MainWindow(QMainWindow):
         # Optional: GD&T Callout column (template-dependent).
         try:
             for hr in header_rows_to_scan:
-                for cc in range(1, ws.max_column + 1):
-                    hv = ws.cell(row=hr, column=cc).value
+                for cc in range(1, ws_max_col + 1):
+                    hv = _hv(hr, cc)
                     if not hv:
                         continue
                     h = str(hv).strip().lower()
@@ -6244,7 +6762,7 @@ class MainWindow(QMainWindow):
                                 continue
                             vals: list[str] = []
                             for cc in range(int(mr.min_col), int(mr.max_col) + 1):
-                                v = ws.cell(row=hr, column=cc).value
+                                v = _hv(hr, cc)
                                 if v is None:
                                     continue
                                 s = str(v).strip()
@@ -6305,117 +6823,6 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-        def _norm_header(v: object) -> str:
-            if v is None:
-                return ""
-            s = str(v).strip().lower()
-            s = re.sub(r"[\s\t\r\n]+", " ", s)
-            return s
-
-        def _gdt_symbol_from_text(v: object) -> str:
-            """Best-effort Unicode GD&T symbol from Calypso/spec text.
-
-            Uses Unicode symbols where available; falls back to a short token when not.
-            """
-            t = str(v or "").strip()
-            if not t:
-                return ""
-            tu = t.upper()
-
-            # Order matters: specific phrases first.
-            if "PROFILE OF A LINE" in tu or "PROFILE OF LINE" in tu:
-                return "⌒"  # U+2312
-            if "PROFILE" in tu:
-                return "⌓"  # U+2313
-            if "TRUE POSITION" in tu or "POSITION" in tu:
-                return "⌖"  # U+2316
-            if "PERPENDICULAR" in tu:
-                return "⊥"  # U+22A5
-            if "PARALLEL" in tu:
-                return "∥"  # U+2225
-            if "ANGULAR" in tu:
-                return "∠"  # U+2220
-            if "FLATNESS" in tu:
-                return "⏥"  # U+23E5
-            if "STRAIGHTNESS" in tu:
-                return "⏤"  # U+23E4
-            if "CIRCULARITY" in tu or "ROUNDNESS" in tu:
-                return "○"  # U+25CB
-            if "CYLINDRIC" in tu:
-                return "⌭"  # U+232D
-            if "CONCENTRIC" in tu:
-                return "⊙"  # U+2299 (approx)
-            if "SYMMETRY" in tu:
-                return "≡"  # U+2261 (approx)
-            if "CIRCULAR RUNOUT" in tu:
-                return "⟲"  # U+27F2 (approx)
-            if "TOTAL RUNOUT" in tu or "RUNOUT" in tu:
-                return "⟳"  # U+27F3 (approx)
-
-            # Modifiers/feature-control extras sometimes appear standalone.
-            if "MMC" in tu:
-                return "Ⓜ"  # U+24C2
-            if "LMC" in tu:
-                return "Ⓛ"  # U+24C1
-            if "RFS" in tu:
-                return "Ⓢ"  # U+24C8
-            if "PROJECTED" in tu and "ZONE" in tu:
-                return "Ⓟ"  # U+24C5
-
-            if "SQUARE" in tu:
-                return "□"  # U+25A1
-            if "CENTERLINE" in tu or "CENTER LINE" in tu:
-                return "℄"  # U+2104
-
-            if "COUNTERBORE" in tu:
-                return "⌴"  # U+2334
-            if "COUNTERSINK" in tu:
-                return "⌵"  # U+2335
-            if "DEPTH" in tu:
-                return "⌷"  # U+2337
-
-            return ""
-
-        def _gdt_font_code_from_text(v: object) -> str:
-            """Return the single-letter code (Excel font-mapped) from text."""
-            t = str(v or "").strip()
-            if not t:
-                return ""
-            tu = t.upper()
-            # Match most-specific first.
-            mapping: list[tuple[str, str]] = [
-                ("ANGULARITY", "a"),
-                ("PERPENDICULAR", "b"),
-                ("FLATNESS", "c"),
-                ("PROFILE OF A LINE", "k"),
-                ("PROFILE", "d"),
-                ("CIRCULARITY", "e"),
-                ("PARALLEL", "f"),
-                ("CYLINDRIC", "g"),
-                ("CIRCULAR RUNOUT", "h"),
-                ("SYMMETRY", "i"),
-                ("TRUE POSITION", "j"),
-                ("POSITION", "j"),
-                ("LMC", "l"),
-                ("MMC", "m"),
-                ("SQUARE", "o"),
-                ("PROJECTED TOLERANCE ZONE", "p"),
-                ("CENTERLINE", "q"),
-                ("CONCENTRIC", "r"),
-                ("RFS", "s"),
-                ("TOTAL RUNOUT", "t"),
-                ("STRAIGHTNESS", "u"),
-                ("COUNTERBORE", "v"),
-                ("COUNTERSINK", "w"),
-                ("DEPTH", "x"),
-                ("CONICAL TAPER", "y"),
-                ("FLAT TAPER", "Z"),
-            ]
-            for key, code in mapping:
-                if key in tu:
-                    return code
-            return ""
-
         def _truthy_flag(v: object) -> bool:
             s = str(v or "").strip().lower()
             if not s:
@@ -6428,11 +6835,11 @@ class MainWindow(QMainWindow):
             if not s:
                 return ""
             # Prefer a standalone single letter token.
-            m = re.findall(r"\b([A-Za-z])\b", s)
+            m = _DATUM_SINGLE_RE.findall(s)
             if m:
                 return str(m[-1]).upper()
             # Fallback: any letter at all.
-            m2 = re.findall(r"([A-Za-z])", s)
+            m2 = _DATUM_ANY_RE.findall(s)
             if m2:
                 return str(m2[-1]).upper()
             return ""
@@ -6478,88 +6885,24 @@ class MainWindow(QMainWindow):
                     parts.append(dd)
             return "|".join(parts)
 
-        def _is_gdt_callout_row(char_obj: object) -> bool:
-            """Return True only for rows that should display a GD&T callout.
-
-            Calypso exports often include helper/component rows like .X/.Z that are
-            "basic" components for a GD&T position and should NOT display a callout.
-            Also exclude pure size dimensions like Diameter of Cylinder/Circle.
-            """
-            try:
-                idsym = str(getattr(char_obj, "idsymbol", "") or "").strip()
-            except Exception:
-                idsym = ""
-            try:
-                typ = str(getattr(char_obj, "type", "") or "").strip()
-            except Exception:
-                typ = ""
-            try:
-                cid = str(getattr(char_obj, "id", "") or "").strip()
-            except Exception:
-                cid = ""
-
-            idsym_l = idsym.lower()
-            typ_u = typ.upper()
-            cid_u = cid.upper()
-
-            # Exclude X/Z component rows (e.g., True Position ... .X / .Z)
-            if idsym_l.endswith(".x") or idsym_l.endswith(".z"):
-                return False
-            if cid_u.endswith(".X") or cid_u.endswith(".Z"):
-                return False
-            if ".X" in typ_u or ".Z" in typ_u:
-                return False
-            if typ_u in ("X VALUE", "Y VALUE", "Z VALUE"):
-                return False
-
-            # Exclude diameter size dimensions (not GD&T callouts)
-            if idsym_l == "diameter" or typ_u == "DIAMETER":
-                return False
-
-            # Most GD&T rows in this export have idsymbol starting with 'gdt'.
-            # Keep that as a strong signal.
-            if idsym_l.startswith("gdt"):
-                return True
-
-            # Fallback: allow explicit GD&T types.
-            return any(
-                k in typ_u
-                for k in (
-                    "POSITION",
-                    "TRUE POSITION",
-                    "FLATNESS",
-                    "PERPENDICULAR",
-                    "PROFILE",
-                    "PARALLEL",
-                    "ANGULAR",
-                    "STRAIGHT",
-                    "CIRCULAR",
-                    "CYLINDRIC",
-                    "RUNOUT",
-                    "SYMMETRY",
-                    "CONCENTRIC",
-                )
-            )
-
         # Discover Form 3 columns for:
         # - 10. Designed/Qualified Tooling
         # - 12. Additional Data/Comments (first column)
         # - Results (if present; fallback stays at 12 for older templates)
         try:
             for hr in header_rows_to_scan:
-                for cc in range(1, ws.max_column + 1):
-                    hv = ws.cell(row=hr, column=cc).value
+                for cc in range(1, ws_max_col + 1):
+                    hv = _hv(hr, cc)
                     if hv is None or str(hv).strip() == "":
                         continue
-                    h = _norm_header(hv)
+                    h = _norm_ws(hv)
 
                     if tooling_col is None and ("tooling" in h) and ("designed" in h) and ("qualified" in h):
                         # If merged, prefer left-most column of the merged range.
                         tooling_col = cc
                         try:
-                            coord = ws.cell(row=hr, column=cc).coordinate
                             for mr in getattr(ws, "merged_cells", []).ranges:
-                                if coord in mr:
+                                if mr.min_row <= hr <= mr.max_row and mr.min_col <= cc <= mr.max_col:
                                     tooling_col = mr.min_col
                                     break
                         except Exception:
@@ -6568,9 +6911,8 @@ class MainWindow(QMainWindow):
                     if additional_col is None and ("comment" in h) and ("additional" in h or "addtion" in h) and ("data" in h):
                         additional_col = cc
                         try:
-                            coord = ws.cell(row=hr, column=cc).coordinate
                             for mr in getattr(ws, "merged_cells", []).ranges:
-                                if coord in mr:
+                                if mr.min_row <= hr <= mr.max_row and mr.min_col <= cc <= mr.max_col:
                                     additional_col = mr.min_col
                                     break
                         except Exception:
@@ -6599,7 +6941,7 @@ class MainWindow(QMainWindow):
                         # Inspect the values across this merged block on the header row.
                         vals: list[str] = []
                         for cc in range(int(mr.min_col), int(mr.max_col) + 1):
-                            v = ws.cell(row=hr, column=cc).value
+                            v = _hv(hr, cc)
                             if v is None:
                                 continue
                             s = str(v).strip()
@@ -6629,13 +6971,13 @@ class MainWindow(QMainWindow):
         try:
             if results_col is not None and bonus_tol_col is not None and int(results_col) == int(bonus_tol_col):
                 for hr in header_rows_to_scan:
-                    for cc in range(1, ws.max_column + 1):
+                    for cc in range(1, ws_max_col + 1):
                         if int(cc) == int(bonus_tol_col):
                             continue
-                        hv = ws.cell(row=hr, column=cc).value
+                        hv = _hv(hr, cc)
                         if hv is None or str(hv).strip() == "":
                             continue
-                        h = _norm_header(hv)
+                        h = _norm_ws(hv)
                         if ("result" in h or "results" in h or "actual" in h) and not ("bonus" in h and "tolerance" in h):
                             results_col = cc
                             raise StopIteration
@@ -6649,14 +6991,14 @@ class MainWindow(QMainWindow):
         try:
             # If header detection failed (often due to merged/blank header cells),
             # fall back to the known columns for this template.
-            if tooling_col is None and ws.max_column >= 12:
+            if tooling_col is None and ws_max_col >= 12:
                 tooling_col = 12
 
-            if results_col is None and ws.max_column >= 11:
+            if results_col is None and ws_max_col >= 11:
                 results_col = 11
 
             # User template revision: Additional Data/Comments is column Q (17)
-            if additional_col is None and ws.max_column >= 17:
+            if additional_col is None and ws_max_col >= 17:
                 additional_col = 17
         except Exception:
             pass
@@ -6672,18 +7014,8 @@ class MainWindow(QMainWindow):
             details = self._selected_calibrated_equipment_details()
             if details:
                 machine_id, machine_type, due_date = details
-                mid_clean = re.sub(
-                    r"^\s*(?:gage\s*id|id)\s*:\s*",
-                    "",
-                    str(machine_id or ""),
-                    flags=re.IGNORECASE,
-                ).strip()
-                due_clean = re.sub(
-                    r"^\s*(?:cal\s*due|due)\s*:\s*",
-                    "",
-                    str(due_date or ""),
-                    flags=re.IGNORECASE,
-                ).strip()
+                mid_clean = _GAGE_PREFIX_RE.sub("", str(machine_id or "")).strip()
+                due_clean = _DUE_PREFIX_RE.sub("", str(due_date or "")).strip()
                 tooling_parts: list[str] = []
                 if mid_clean:
                     tooling_parts.append(f"Gage ID: {mid_clean}")
@@ -6711,16 +7043,22 @@ class MainWindow(QMainWindow):
             # description_text is written as "{id} {feature_name}"; id is the first token.
             return s.split()[0].strip()
 
-        def _find_table_end_row() -> int:
+        def _find_table_end_row() -> tuple[int, int]:
             # Walk downward until we hit a stretch of empty rows in key columns.
             # This prevents leaving stale rows visible when the derived rows are hidden.
-            max_scan = min(max(int(getattr(ws, "max_row", 0) or 0), start_row + 250), start_row + 2000)
+            # Also returns the last row the old per-cell probe reached (25 rows past the
+            # data, or max_scan on an empty table); see _find_template_table_bottom_row.
+            ws_max = int(getattr(ws, "max_row", 0) or 0)
+            max_scan = min(max(ws_max, start_row + 250), start_row + 2000)
             started = False
             empty_run = 0
             last_seen = start_row
-            for rr in range(start_row, max_scan + 1):
-                c2 = ws.cell(row=rr, column=2).value
-                c7 = ws.cell(row=rr, column=7).value
+            # Values-only over B:G, clamped to the used rows: rows past max_row are empty
+            # anyway, and iter_rows() would otherwise create cells for them.
+            rows_iter = ws.iter_rows(
+                min_row=start_row, max_row=min(max_scan, ws_max), min_col=2, max_col=7, values_only=True
+            )
+            for rr, (c2, _c3, _c4, _c5, _c6, c7) in enumerate(rows_iter, start=start_row):
                 has_any = (c2 is not None and str(c2).strip() != "") or (c7 is not None and str(c7).strip() != "")
                 if has_any:
                     started = True
@@ -6731,19 +7069,27 @@ class MainWindow(QMainWindow):
                         empty_run += 1
                         if empty_run >= 25:
                             break
-            return max(start_row, last_seen)
+            probed_to = min(last_seen + 25, max_scan) if started else max_scan
+            return max(start_row, last_seen), probed_to
 
-        def _find_template_table_bottom_row() -> int:
+        def _find_template_table_bottom_row(min_extent: int) -> int:
             """Find the last visible Form 3 grid row already present in the template.
 
             The in-app sheet viewer does not emulate Excel's overflow text or implicit
             table styling, so we preserve the template's explicit row borders all the way
             through the preformatted blank rows at the bottom of Form 3.
+
+            `min_extent` is treated as a floor for ws.max_row. The table-end probe used to
+            create cells down to that row, and the fallback below relied on the max_row
+            it left behind.
             """
 
+            # Bound once per scan rather than recomputing max_column for every row.
+            last_col = min(int(getattr(ws, "max_column", 0) or 0), 26)
+
             def _row_has_structure(rr: int) -> bool:
                 try:
-                    for cc in range(2, min(int(getattr(ws, "max_column", 0) or 0), 26) + 1):
+                    for cc in range(2, last_col + 1):
                         cell = ws.cell(row=rr, column=cc)
                         if cell.value is not None and str(cell.value).strip() != "":
                             return True
@@ -6756,7 +7102,7 @@ class MainWindow(QMainWindow):
                     return False
                 return False
 
-            ws_max = int(getattr(ws, "max_row", 0) or 0)
+            ws_max = max(int(getattr(ws, "max_row", 0) or 0), min_extent)
             max_scan = min(max(ws_max, start_row + 60), start_row + 250)
             last_seen = start_row
             empty_run = 0
@@ -6907,8 +7253,8 @@ class MainWindow(QMainWindow):
                     except Exception:
                         pass
 
-        end_row = _find_table_end_row()
-        template_table_bottom_row = _find_template_table_bottom_row()
+        end_row, probed_to = _find_table_end_row()
+        template_table_bottom_row = _find_template_table_bottom_row(probed_to)
         _ensure_form3_title_merge()
 
         # Capture per-column border objects from start_row once so we can replicate them onto
@@ -6964,14 +7310,16 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-        # Capture existing ref locations before clearing.
-        for rr in range(start_row, end_row + 1):
+        # Capture existing ref locations before clearing (one values-only pass over D:G).
+        try:
+            ref_rows = ws.iter_rows(min_row=start_row, max_row=end_row, min_col=4, max_col=7, values_only=True)
+        except Exception:
+            ref_rows = ()
+        for ref_val, _e, _f, desc in ref_rows:
             try:
-                desc = ws.cell(row=rr, column=7).value
                 char_id = _parse_char_id_from_desc(desc)
                 if not char_id:
                     continue
-                ref_val = ws.cell(row=rr, column=4).value
                 if ref_val is None:
                     continue
                 ref_s = str(ref_val).strip()
@@ -7145,22 +7493,26 @@ class MainWindow(QMainWindow):
                 ]
             )
             # Treat both 'Basic' and the common abbreviation 'BSC' as basic dimensions.
-            is_basic = bool(re.search(r"\b(?:basic|bsc)\b", basic_text, flags=re.IGNORECASE))
+            is_basic = bool(_BASIC_DIM_RE.search(basic_text))
 
             # GD&T callout (best-effort) from Calypso/spec text.
             if gdt_col is not None and enable_gdt_callout and not is_basic:
                 try:
+                    c_type = str(getattr(char, "type", "") or "").strip()
+                    c_idsym = str(getattr(char, "idsymbol", "") or "").strip()
+                    c_id = str(getattr(char, "id", "") or "").strip()
+
                     # Only emit callouts for real GD&T rows.
-                    if not _is_gdt_callout_row(char):
+                    if not _is_gdt_callout_row(c_idsym, c_type, c_id):
                         raise RuntimeError("not_gdt_row")
 
                     # Calypso imports often put the GD&T type in the feature name, while the
                     # spec text is just the numeric requirement (e.g. ".0100 MAX").
                     gdt_source = " ".join(
                         [
-                            str(getattr(char, "type", "") or "").strip(),
-                            str(getattr(char, "idsymbol", "") or "").strip(),
-                            str(getattr(char, "id", "") or "").strip(),
+                            c_type,
+                            c_idsym,
+                            c_id,
                             str(getattr(char, "feature_name", "") or "").strip(),
                             str(getattr(char, "description", "") or "").strip(),
                         ]
@@ -7170,7 +7522,7 @@ class MainWindow(QMainWindow):
                     symbol_unicode = _gdt_symbol_from_text(gdt_source)
                     tol_text = str(getattr(char, "description", "") or "").strip()
                     # Clean up tolerance text to only include the number (remove "MAX", "MIN", etc.)
-                    _m = re.search(r"(\d*\.?\d+)", tol_text)
+                    _m = _TOL_NUMBER_RE.search(tol_text)
                     if _m:
                         tol_text = _m.group(1)
                     mmc_flag = _truthy_flag(getattr(char, "mmc", ""))
@@ -7338,18 +7690,8 @@ class MainWindow(QMainWindow):
                 row_tooling_value = tooling_value
                 row_additional_value = additional_value
                 try:
-                    machine_id = re.sub(
-                        r"^\s*(?:gage\s*id|id)\s*:\s*",
-                        "",
-                        str(getattr(char, "machine_id", "") or ""),
-                        flags=re.IGNORECASE,
-                    ).strip()
-                    due_date = re.sub(
-                        r"^\s*(?:cal\s*due|due)\s*:\s*",
-                        "",
-                        str(getattr(char, "calibration_due", "") or ""),
-                        flags=re.IGNORECASE,
-                    ).strip()
+                    machine_id = _GAGE_PREFIX_RE.sub("", str(getattr(char, "machine_id", "") or "")).strip()
+                    due_date = _DUE_PREFIX_RE.sub("", str(getattr(char, "calibration_due", "") or "")).strip()
                     machine_type = str(getattr(char, "machine_type", "") or "").strip()
                     tooling_parts: list[str] = []
                     if machine_id:
@@ -7683,7 +8025,7 @@ class MainWindow(QMainWindow):
                 matches = []
 
             if not matches:
-                one = re.sub(r"\s+", " ", s).strip()
+                one = _WS_RE.sub(" ", s).strip()
                 return [one] if one else []
 
             parts: list[str] = []
@@ -7691,7 +8033,7 @@ class MainWindow(QMainWindow):
                 start = int(m.start(2))
                 end = int(matches[i + 1].start(2)) if i + 1 < len(matches) else len(s)
                 seg = s[start:end].strip()
-                seg = re.sub(r"\s+", " ", seg).strip()
+                seg = _WS_RE.sub(" ", seg).strip()
                 if seg:
                     parts.append(seg)
             return parts
@@ -8150,7 +8492,7 @@ class MainWindow(QMainWindow):
                                     anchor_r0 = max(0, r0 - 4)
                                     idx = tbl.model().index(anchor_r0, c0)
                                     if idx.isValid():
-                                        tbl.scrollTo(idx, QAbstractItemView.ScrollHint.PositionAtTop)
+                                        tbl.scrollTo(idx, _SH_POS_TOP)
                                 except Exception:
                                     pass
                     except Exception:
@@ -8333,7 +8675,7 @@ class MainWindow(QMainWindow):
                                     anchor_r0 = max(0, r0 - 4)
                                     idx = tbl.model().index(anchor_r0, c0)
                                     if idx.isValid():
-                                        tbl.scrollTo(idx, QAbstractItemView.ScrollHint.PositionAtTop)
+                                        tbl.scrollTo(idx, _SH_POS_TOP)
                                 except Exception:
                                     pass
                     except Exception:
@@ -9491,7 +9833,7 @@ class MainWindow(QMainWindow):
 
         # If it's popped out, bring it forward.
         try:
-            if dv is not None and dv.windowFlags() & Qt.Window:
+            if dv is not None and dv.windowFlags() & _QT_WINDOW:
                 dv.show()
                 dv.raise_()
                 dv.activateWindow()
@@ -9509,12 +9851,7 @@ class MainWindow(QMainWindow):
 
         Requirement: only do this when the Drawing Viewer is popped out.
         """
-        try:
-            dv = getattr(self, "drawing_viewer_tab", None)
-            popped_out = bool(dv is not None and (dv.windowFlags() & Qt.Window))
-        except Exception:
-            popped_out = False
-        if not popped_out:
+        if not self._drawing_viewer_popped:
             return
 
         # Bring the main window to Form 3 so the user can see the highlight.
@@ -9574,61 +9911,32 @@ class MainWindow(QMainWindow):
         if e < s:
             e = s
 
-        try:
-            tbl.clearSelection()
-        except Exception:
-            pass
-
-        matched_rows0: list[int] = []
-        try:
-            max_row = int(getattr(ws, "max_row", 0) or 0)
-        except Exception:
-            max_row = 0
-        if max_row <= 0:
-            max_row = 5000
-
-        for rr in range(6, int(max_row) + 1):
+        # Bubble rows come from the viewer's cached column-E index instead of a
+        # ws.cell() walk over the whole sheet on every scroller move.
+        rows, nums = _form3_bubble_index(viewer)
+        matched_rows0 = [r - 1 for r in rows if r >= 6 and s <= nums[r] <= e]
+        if not matched_rows0:
             try:
-                v = ws.cell(row=int(rr), column=5).value
-                n = int(v)
+                tbl.clearSelection()
             except Exception:
-                continue
-            if int(s) <= int(n) <= int(e):
-                r0 = int(rr) - 1
-                matched_rows0.append(int(r0))
-
-        if not matched_rows0:
+                pass
             return
 
-        min_r0 = int(min(matched_rows0))
-        max_r0 = int(max(matched_rows0))
+        min_r0 = matched_rows0[0]
+        max_r0 = matched_rows0[-1]
 
-        # IMPORTANT: setCurrentCell() can collapse selection to a single cell.
-        # Set the current cell *first*, then apply the selection range.
+        # One ClearAndSelect makes min_r0 current and selected and scrolls it near the top.
         try:
-            tbl.setCurrentCell(int(min_r0), 4)
+            _form3_select_bubble_cell(tbl, min_r0)
         except Exception:
             pass
 
-        # Select the whole range in the Bubble column so it highlights as one block.
-        try:
-            tbl.setRangeSelected(QTableWidgetSelectionRange(int(min_r0), 4, int(max_r0), 4), True)
-        except Exception:
-            # Fallback: select each row individually.
-            for r0 in matched_rows0:
-                try:
-                    tbl.setRangeSelected(QTableWidgetSelectionRange(int(r0), 4, int(r0), 4), True)
-                except Exception:
-                    pass
-
-        # Scroll so the selected bubble row is ~5 rows below the top.
-        try:
-            target_row0 = max(0, int(min_r0) - 5)
-            it = tbl.item(int(target_row0), 4)
-            if it is not None:
-                tbl.scrollToItem(it, QAbstractItemView.ScrollHint.PositionAtTop)
-        except Exception:
-            pass
+        # Extend to the whole range in the Bubble column so it highlights as one block.
+        if max_r0 > min_r0:
+            try:
+                tbl.setRangeSelected(QTableWidgetSelectionRange(min_r0, 4, max_r0, 4), True)
+            except Exception:
+                pass
 
     def detach_pdf(self):
         if not self.drawing_pdf_path:
@@ -9645,11 +9953,11 @@ class MainWindow(QMainWindow):
         try:
             v = getattr(self.pdf_window, "_pdf_viewer", None)
             if v is not None and hasattr(v, "bubbles_changed"):
-                v.bubbles_changed.connect(self._on_drawing_bubbles_changed)
+                _connect_unique(v.bubbles_changed, self._on_drawing_bubbles_changed)
             if v is not None and hasattr(v, "drawing_saved"):
-                v.drawing_saved.connect(self._on_drawing_saved)
+                _connect_unique(v.drawing_saved, self._on_drawing_saved)
             if v is not None and hasattr(v, "insert_notes_to_form3_requested"):
-                v.insert_notes_to_form3_requested.connect(self._on_insert_notes_to_form3)
+                _connect_unique(v.insert_notes_to_form3_requested, self._on_insert_notes_to_form3)
         except Exception:
             pass
         self.pdf_window.showMaximized()
@@ -9659,7 +9967,7 @@ class MainWindow(QMainWindow):
         if not s:
             return ""
         s = re.sub(r"[\\/:*?\"<>|]", "_", s)
-        s = re.sub(r"\s+", " ", s).strip()
+        s = _WS_RE.sub(" ", s).strip()
         s = s.strip(" _.-")
         return s
 
@@ -9673,11 +9981,8 @@ class MainWindow(QMainWindow):
         lot = ""
         include_lot_label = False
 
-        def _norm(s: object) -> str:
-            return re.sub(r"\s+", " ", str(s or "")).strip().lower()
-
         def _looks_like_label(s: object, keywords: list[str]) -> bool:
-            t = _norm(s)
+            t = _norm_ws(s)
             if not t:
                 return False
             hits = 0
@@ -9742,7 +10047,7 @@ class MainWindow(QMainWindow):
                         v = ws.cell(row=rr, column=cc).value
                     except Exception:
                         v = None
-                    t = _norm(v)
+                    t = _norm_ws(v)
                     if not t:
                         continue
                     if needle_no not in t:
@@ -9787,7 +10092,7 @@ class MainWindow(QMainWindow):
             s = str(raw or "").strip()
             if not s:
                 return ("", False)
-            s_norm = re.sub(r"\s+", " ", s).strip()
+            s_norm = _WS_RE.sub(" ", s).strip()
             low = s_norm.lower()
             # Placeholder-only values should not appear in filenames.
             if low in ("job#", "job #", "job number", "job no", "job no."):
@@ -9859,7 +10164,7 @@ class MainWindow(QMainWindow):
                         v = ws.cell(row=rr, column=cc).value
                     except Exception:
                         v = None
-                    t = _norm(v)
+                    t = _norm_ws(v)
                     if not t:
                         continue
                     if t in ("job#", "job #") or t.startswith("job #") or t.startswith("job#"):
@@ -10383,6 +10688,8 @@ class MainWindow(QMainWindow):
             
         # Prefer saving the in-memory workbook (includes UI edits).
         if self._template_wb is not None:
+            self._flush_pending_workbook_writes()
+
             # Ensure calibrated equipment mapping is written before saving.
             try:
                 self._apply_selected_calibrated_equipment_to_workbook()
@@ -10442,6 +10749,7 @@ class MainWindow(QMainWindow):
         if not output_path:
             return
 
+        self._flush_pending_workbook_writes()
         try:
             self._template_wb.save(output_path)
             self._wb_dirty = False
@@ -10500,7 +10808,24 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """Handle application close, ensuring child windows like the Drawing Viewer are closed properly and unsaved data is handled."""
-        
+
+        # A template load is waiting on its worker thread; close once it has returned.
+        if getattr(self, "_template_loading", False):
+            self._close_after_template_load = True
+            event.ignore()
+            return
+
+        # 0. Apply table edits and settings still waiting on their debounce first, so the
+        # unsaved-changes prompt (and a Save from it) sees them.
+        try:
+            self._flush_pending_table_saves()
+        except Exception:
+            pass
+        try:
+            self._flush_pending_settings()
+        except Exception:
+            pass
+
         # 1. Ask to save Form (Excel) changes
         if getattr(self, "_wb_dirty", False):
             mb = QMessageBox(self)
@@ -10526,7 +10851,7 @@ class MainWindow(QMainWindow):
         try:
             dv = getattr(self, "drawing_viewer_tab", None)
             if dv is not None:
-                is_popped_out = bool(dv.windowFlags() & Qt.Window)
+                is_popped_out = bool(dv.windowFlags() & _QT_WINDOW)
                 
                 if is_popped_out:
                     # If popped out, we must close the secondary window.
@@ -10554,7 +10879,7 @@ class MainWindow(QMainWindow):
 
         except Exception:
             pass
-        
+
         super().closeEvent(event)
 
     def _set_theme(self, mode: str) -> None:
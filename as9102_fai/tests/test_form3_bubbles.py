@@ -0,0 +1,40 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("PySide6")
+openpyxl = pytest.importorskip("openpyxl")
+
+from as9102_fai.gui.main_window import _form3_bubble_index, _form3_next_bubble_row
+
+
+def _bubble_viewer(bubbles: dict[int, object]):
+    ws = openpyxl.Workbook().active
+    for row, value in bubbles.items():
+        ws.cell(row=row, column=5).value = value
+    return SimpleNamespace(_ws=ws, _row_index_cache={})
+
+
+def test_form3_bubble_index_does_not_create_cells() -> None:
+    viewer = _bubble_viewer({7: 1, 8: 2, 20: "note"})
+    viewer._ws.cell(row=40, column=1).value = "x"
+    n_cells = len(viewer._ws._cells)
+
+    assert _form3_bubble_index(viewer) == ([7, 8], {7: 1, 8: 2})
+    assert len(viewer._ws._cells) == n_cells
+
+
+def test_form3_next_bubble_row_steps_both_ways() -> None:
+    viewer = _bubble_viewer({6: 1, 7: 2, 10: 3, 12: "note", 15: 4})
+
+    assert _form3_next_bubble_row(viewer, 7, 1) == (10, 3)
+    assert _form3_next_bubble_row(viewer, 10, 1) == (15, 4)
+    assert _form3_next_bubble_row(viewer, 15, -1) == (10, 3)
+    assert _form3_next_bubble_row(viewer, 15, 1) is None
+
+
+def test_form3_next_bubble_row_clamps_to_row_6() -> None:
+    viewer = _bubble_viewer({3: 9, 6: 1, 8: 2})
+
+    assert _form3_next_bubble_row(viewer, 1, 1) == (6, 1)
+    assert _form3_next_bubble_row(viewer, 6, -1) == (6, 1)
@@ -0,0 +1,28 @@
+import pytest
+
+pytest.importorskip("PySide6")
+
+from as9102_fai.gui.main_window import _build_full_address, _build_full_address_with_company
+
+
+@pytest.mark.parametrize(
+    ("parts", "expected"),
+    [
+        (("1 Main St", "Suite 2", "", "Springfield", "il", "62701"), "1 Main St, Suite 2, Springfield, IL 62701"),
+        (("1 Main St", "", "", "Springfield", "IL", ""), "1 Main St, Springfield, IL"),
+        (("1 Main St", "", "", "Springfield", "", "62701"), "1 Main St, Springfield"),
+        (("", "", "", "", "IL", "62701"), "IL 62701"),
+        (("", "", "", "", "", "62701"), "62701"),
+        ((" 1 Main St, ", None, None, None, None, None), "1 Main St"),
+        (("", "", "", "", "", ""), ""),
+    ],
+)
+def test_build_full_address(parts, expected) -> None:
+    assert _build_full_address(*parts) == expected
+
+
+def test_build_full_address_with_company() -> None:
+    assert _build_full_address_with_company("Acme", "1 Main St", "", "Springfield", "IL", "62701") == (
+        "Acme, 1 Main St, Springfield, IL 62701"
+    )
+    assert _build_full_address_with_company("Acme", "", "", "", "", "") == "Acme"
@@ -0,0 +1,55 @@
+import pytest
+
+pytest.importorskip("PySide6")
+openpyxl = pytest.importorskip("openpyxl")
+
+from as9102_fai.gui.main_window import _replace_hidden_sheet_rows
+
+
+def _values(ws) -> list[tuple]:
+    return [tuple(r) for r in ws.iter_rows(min_row=1, max_row=ws.max_row, max_col=ws.max_column, values_only=True)]
+
+
+def test_replace_hidden_sheet_rows_fresh_sheet() -> None:
+    ws = openpyxl.Workbook().create_sheet("__as9102_test")
+
+    _replace_hidden_sheet_rows(ws, [("a", 1), ("b", 2)])
+
+    assert _values(ws) == [("a", 1), ("b", 2)]
+
+
+def test_replace_hidden_sheet_rows_shrinks_and_grows() -> None:
+    ws = openpyxl.Workbook().create_sheet("__as9102_test")
+    _replace_hidden_sheet_rows(ws, [("a",), ("b",), ("c",), ("d",)])
+
+    _replace_hidden_sheet_rows(ws, [("x",), ("b",)])
+    assert _values(ws) == [("x",), ("b",)]
+
+    _replace_hidden_sheet_rows(ws, [("x",), ("b",), ("y",)])
+    assert _values(ws) == [("x",), ("b",), ("y",)]
+
+
+def test_replace_hidden_sheet_rows_only_writes_changed_cells() -> None:
+    ws = openpyxl.Workbook().create_sheet("__as9102_test")
+    _replace_hidden_sheet_rows(ws, [("a", "b"), ("c", "d")])
+    untouched = ws.cell(row=1, column=1)
+
+    _replace_hidden_sheet_rows(ws, [("a", "b"), ("c", "z")])
+
+    assert ws.cell(row=1, column=1) is untouched
+    assert _values(ws) == [("a", "b"), ("c", "z")]
+
+
+def test_replace_hidden_sheet_rows_keeps_columns_past_width() -> None:
+    ws = openpyxl.Workbook().create_sheet("__as9102_test")
+    for r in range(1, 5):
+        for c in range(1, 8):
+            ws.cell(row=r, column=c).value = f"{r}/{c}"
+    ws.cell(row=1, column=8).value = "seeded"
+    ws.cell(row=3, column=9).value = "legacy"
+
+    _replace_hidden_sheet_rows(ws, [tuple("abcdefg"), tuple("hijklmn")], width=8)
+
+    assert ws.cell(row=3, column=9).value == "legacy"
+    assert ws.cell(row=1, column=8).value is None
+    assert [ws.cell(row=r, column=1).value for r in range(1, 5)] == ["a", "h", None, None]
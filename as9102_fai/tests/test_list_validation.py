@@ -0,0 +1,68 @@
+import pytest
+
+pytest.importorskip("PySide6")
+openpyxl = pytest.importorskip("openpyxl")
+
+from openpyxl.worksheet.datavalidation import DataValidation
+
+from as9102_fai.gui.main_window import _list_validation_covering
+
+
+def _list_dv(ws, sqref: str) -> DataValidation:
+    dv = DataValidation(type="list", formula1="=$A$1:$A$3")
+    ws.add_data_validation(dv)
+    dv.sqref = sqref
+    return dv
+
+
+def test_list_validation_covering_uses_range_membership() -> None:
+    ws = openpyxl.Workbook().active
+    dv = _list_dv(ws, "D5:D20")
+
+    assert _list_validation_covering(ws, "D9") is dv
+    assert _list_validation_covering(ws, "D6:D20") is dv
+    assert _list_validation_covering(ws, "D90") is None
+    assert _list_validation_covering(ws, "E9") is None
+
+
+def test_list_validation_covering_needs_the_whole_range() -> None:
+    ws = openpyxl.Workbook().active
+    dv = _list_dv(ws, "D5:D20 F1")
+
+    assert _list_validation_covering(ws, "D9:D500") is None
+    assert _list_validation_covering(ws, "D9 F1") is dv
+    assert _list_validation_covering(ws, "D9 F2") is None
+
+
+def test_list_validation_covering_sees_sqref_edits() -> None:
+    ws = openpyxl.Workbook().active
+    dv = _list_dv(ws, "D5")
+    assert _list_validation_covering(ws, "D5") is dv
+
+    dv.sqref = "F5"
+    assert _list_validation_covering(ws, "D5") is None
+    assert _list_validation_covering(ws, "F5") is dv
+
+
+def test_list_validation_covering_ignores_other_types() -> None:
+    ws = openpyxl.Workbook().active
+    dv = DataValidation(type="whole")
+    ws.add_data_validation(dv)
+    dv.add("D5")
+
+    assert _list_validation_covering(ws, "D5") is None
+
+
+def test_apply_list_validation_only_reuses_a_covering_validation() -> None:
+    from as9102_fai.gui.main_window import MainWindow
+
+    ws = openpyxl.Workbook().active
+    dv = _list_dv(ws, "D5:D20")
+
+    MainWindow._apply_list_validation(None, ws, "D9", "=$B$1:$B$4")
+    assert dv.formula1 == "=$B$1:$B$4"
+    assert len(ws.data_validations.dataValidation) == 1
+
+    MainWindow._apply_list_validation(None, ws, "D9:D500", "=$C$1:$C$4")
+    assert dv.formula1 == "=$B$1:$B$4"
+    assert _list_validation_covering(ws, "D9:D500").formula1 == "=$C$1:$C$4"
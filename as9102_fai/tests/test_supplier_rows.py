@@ -0,0 +1,27 @@
+import pytest
+
+pytest.importorskip("PySide6")
+
+from as9102_fai.gui.main_window import _normalize_supplier_row
+
+
+def test_normalize_supplier_row_current_schema() -> None:
+    row = ("Acme", " 1 Main St ", "Suite 2", "Springfield", "il", 62701, None)
+
+    assert _normalize_supplier_row(row, legacy=False) == ("Acme", "1 Main St", "Suite 2", "Springfield", "IL", "62701")
+
+
+def test_normalize_supplier_row_legacy_folds_address_3() -> None:
+    row = ("Acme", "1 Main St", "", "Bldg 3", "Springfield", "IL", "62701")
+
+    assert _normalize_supplier_row(row, legacy=True) == ("Acme", "1 Main St", "Bldg 3", "Springfield", "IL", "62701")
+
+
+def test_normalize_supplier_row_splits_one_line_address() -> None:
+    row = ("Acme", "1 Main St, Springfield, IL 62701")
+
+    assert _normalize_supplier_row(row, legacy=False) == ("Acme", "1 Main St", "", "Springfield", "IL", "62701")
+
+
+def test_normalize_supplier_row_blank_is_none() -> None:
+    assert _normalize_supplier_row((None, "  ", None), legacy=False) is None
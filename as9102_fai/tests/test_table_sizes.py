@@ -0,0 +1,31 @@
+import struct
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from as9102_fai.gui.main_window import _pack_table_sizes, _unpack_table_sizes
+
+
+def test_table_sizes_round_trip() -> None:
+    cols, rows = [120, 80, 300], [22, 22, 40, 18]
+
+    assert _unpack_table_sizes(_pack_table_sizes(cols, rows)) == (cols, rows)
+    assert _unpack_table_sizes(_pack_table_sizes([], [])) == ([], [])
+
+
+def test_table_sizes_past_16_bit_counts() -> None:
+    rows = [20] * 70000
+
+    assert _unpack_table_sizes(_pack_table_sizes([100], rows)) == ([100], rows)
+
+
+def test_table_sizes_reads_legacy_blob() -> None:
+    legacy = struct.pack("<HH3I", 2, 1, 120, 80, 22)
+
+    assert _unpack_table_sizes(legacy) == ([120, 80], [22])
+
+
+def test_table_sizes_rejects_malformed_blob() -> None:
+    assert _unpack_table_sizes(b"") is None
+    assert _unpack_table_sizes(_pack_table_sizes([1, 2], [3])[:-4]) is None